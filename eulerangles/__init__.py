@@ -1,7 +1,28 @@
 from .base import ConversionMeta
-from .interface import convert_eulers
+from .interface import convert_eulers, convert_eulers_many, convert_matrices, \
+    convert_eulers_and_shifts, convert_eulers_columns
 from .math.eulers_to_eulers import euler2euler
 from .math.rotation_matrix_to_eulers import matrix2euler
 from .math.eulers_to_rotation_matrix import euler2matrix
+from .math.quaternions import euler2quaternion, quaternion2matrix, matrix2quaternion, \
+    multiply_quaternions, invert_quaternions, slerp_quaternions
+from .math.axis_angle import euler2rotvec, rotvec2euler, matrix2axisangle, axisangle2matrix
+from .math.columnar import euler2matrix_columns, matrix2euler_columns, euler2euler_columns
 from .math.rotation_matrices.utils import invert_rotation_matrices
+from .math.rotation_matrices.orthonormalisation import rotation_matrix_residuals, \
+    is_rotation_matrix, orthonormalise_rotation_matrices
+from .math.rigid_body_transforms import compose_rigid_body_transforms, \
+    invert_rigid_body_transforms, rigid_body2transform, transform2rigid_body, \
+    compose_transforms, invert_transforms
+from .cache import ConversionCache, DiskConversionCache
+from .parallel import convert_eulers_parallel
+from .aio import aconvert_eulers, aiter_convert_eulers
+from .canonicalisation import canonicalise_eulers, hash_eulers
+from .distances import angular_distance
+from .composition import compose_eulers, invert_eulers
+from .tilt_series import TiltSeriesOrientations
+from .interpolation import interpolate_eulers, resample_eulers
+from .random_rotations import random_rotations, iter_random_rotations
+from .histogram import ViewingDirectionHistogram
+from .incremental import IncrementalConverter
 from .version import __version__
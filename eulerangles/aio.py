@@ -0,0 +1,117 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .interface import convert_eulers
+from .utils import get_conversion_metadata
+
+
+async def aiter_convert_eulers(euler_angles: np.ndarray,
+                               source_meta: Union[ConversionMeta, str],
+                               target_meta: Union[ConversionMeta, str],
+                               chunk_size: int = 100_000,
+                               executor: Optional[Executor] = None,
+                               degrees: bool = True) -> AsyncIterator[np.ndarray]:
+    """
+    Asynchronously convert Euler angles in chunks, yielding converted chunks as they complete.
+
+    Each chunk is converted with `convert_eulers` in `executor` and control is returned to the
+    event loop while it runs. Cancelling the consuming task stops conversion after the chunk
+    currently running.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+
+    chunk_size : int
+        number of rows converted per chunk
+
+    executor : concurrent.futures.Executor or None
+        executor on which chunks are converted, None uses the default executor of the event loop
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Yields
+    ------
+    euler_angles : (m, 3) array of float
+        Euler angles resulting from conversion of consecutive chunks of rows
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+    euler_angles = np.asarray(euler_angles).reshape((-1, 3))
+    loop = asyncio.get_running_loop()
+
+    for start in range(0, euler_angles.shape[0], chunk_size):
+        convert_chunk = functools.partial(convert_eulers,
+                                          euler_angles[start:start + chunk_size],
+                                          source_meta,
+                                          target_meta,
+                                          degrees=degrees)
+        converted_chunk = await loop.run_in_executor(executor, convert_chunk)
+        yield np.asarray(converted_chunk).reshape((-1, 3))
+
+
+async def aconvert_eulers(euler_angles: np.ndarray,
+                          source_meta: Union[ConversionMeta, str],
+                          target_meta: Union[ConversionMeta, str],
+                          chunk_size: int = 100_000,
+                          executor: Optional[Executor] = None,
+                          degrees: bool = True) -> np.ndarray:
+    """
+    Asynchronously convert Euler angles defined according to one 'convention' into Euler angles
+    defined according to another, see `aiter_convert_eulers`.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+
+    chunk_size : int
+        number of rows converted per chunk
+
+    executor : concurrent.futures.Executor or None
+        executor on which chunks are converted, None uses the default executor of the event loop
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles resulting from conversion
+    """
+    euler_angles = np.asarray(euler_angles)
+    converted_eulers = np.empty(euler_angles.reshape((-1, 3)).shape)
+
+    start = 0
+    async for converted_chunk in aiter_convert_eulers(euler_angles, source_meta, target_meta,
+                                                      chunk_size=chunk_size, executor=executor,
+                                                      degrees=degrees):
+        converted_eulers[start:start + converted_chunk.shape[0]] = converted_chunk
+        start += converted_chunk.shape[0]
+
+    return converted_eulers.squeeze()
@@ -0,0 +1,368 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .interface import convert_eulers
+from .math.eulers_to_rotation_matrix import euler2matrix
+from .utils import get_conversion_metadata
+
+
+def hash_array(array: np.ndarray) -> str:
+    """
+    Compute a fast content hash of an array, including its shape and dtype.
+    """
+    array = np.ascontiguousarray(array)
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(str((array.shape, array.dtype.str)).encode())
+    hasher.update(memoryview(array).cast('B'))
+    return hasher.hexdigest()
+
+
+def hash_file(filename: Union[str, os.PathLike],
+              byte_range: Optional[Tuple[int, Optional[int]]] = None,
+              block_size: int = 2 ** 20) -> str:
+    """
+    Compute a fast content hash of a file, or of a range of bytes within a file.
+
+    Parameters
+    ----------
+    filename : str or path-like
+        file to hash
+    byte_range : (int, int or None) tuple or None
+        start (inclusive) and stop (exclusive) byte offsets, None hashes the whole file
+        and a stop of None hashes until the end of the file
+    block_size : int
+        number of bytes read at once
+    """
+    start, stop = byte_range if byte_range is not None else (0, None)
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        remaining = None if stop is None else stop - start
+        while remaining is None or remaining > 0:
+            n_bytes = block_size if remaining is None else min(block_size, remaining)
+            block = file.read(n_bytes)
+            if not block:
+                break
+            hasher.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return hasher.hexdigest()
+
+
+def conversion_meta_key(meta: ConversionMeta) -> tuple:
+    """
+    Reduce a ConversionMeta object to the fields which affect conversion results.
+
+    The name of the software package is ignored so that equivalent conventions share results.
+    """
+    return meta.axes.strip().lower(), meta.intrinsic, meta.right_handed_rotation, meta.active
+
+
+# Prefix of the files written by DiskConversionCache, other files in its directory are ignored
+cache_file_prefix = 'eulerangles-'
+
+
+class ConversionCache:
+    """
+    An opt-in in-memory cache for the results of `convert_eulers` and `euler2matrix`.
+
+    Results are keyed by a hash of the input buffer and the parameters of the conversion.
+    The least recently used results are evicted once the total size of cached arrays
+    exceeds `max_bytes`. Cached results are returned as read-only arrays.
+
+    Parameters
+    ----------
+    max_bytes : int
+        maximum total number of bytes of cached arrays
+
+    Attributes
+    ----------
+    hits : int
+        number of lookups answered from the cache
+    misses : int
+        number of lookups which required computation
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.n_bytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Hit/miss statistics and current size of the cache.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'n_bytes': self.n_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Remove all cached results and reset statistics.
+        """
+        self._entries.clear()
+        self.n_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def convert_eulers(self,
+                       euler_angles: np.ndarray,
+                       source_meta: Union[ConversionMeta, str],
+                       target_meta: Union[ConversionMeta, str],
+                       degrees: bool = True,
+                       precision: str = 'exact') -> np.ndarray:
+        """
+        Cached version of `convert_eulers`, see `eulerangles.convert_eulers`.
+        """
+        source_meta = get_conversion_metadata(source_meta)
+        target_meta = get_conversion_metadata(target_meta)
+        euler_angles = np.asarray(euler_angles)
+
+        key = ('convert_eulers',
+               hash_array(euler_angles),
+               conversion_meta_key(source_meta),
+               conversion_meta_key(target_meta),
+               degrees,
+               precision)
+        return self._lookup(key, convert_eulers, euler_angles, source_meta, target_meta,
+                            degrees=degrees, precision=precision)
+
+    def euler2matrix(self,
+                     euler_angles: np.ndarray,
+                     axes: str,
+                     intrinsic: bool,
+                     right_handed_rotation: bool,
+                     degrees: bool = True,
+                     precision: str = 'exact') -> np.ndarray:
+        """
+        Cached version of `euler2matrix`, see `eulerangles.euler2matrix`.
+        """
+        euler_angles = np.asarray(euler_angles)
+
+        key = ('euler2matrix',
+               hash_array(euler_angles),
+               axes.strip().lower(),
+               intrinsic,
+               right_handed_rotation,
+               degrees,
+               precision)
+        return self._lookup(key, euler2matrix, euler_angles, axes, intrinsic,
+                            right_handed_rotation, degrees=degrees, precision=precision)
+
+    def _lookup(self, key, function, *args, **kwargs):
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        result = np.asarray(function(*args, **kwargs))
+        result.setflags(write=False)
+        self._insert(key, result)
+        return result
+
+    def _insert(self, key, result: np.ndarray):
+        # Results which could never fit are not cached
+        if result.nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = result
+        self.n_bytes += result.nbytes
+
+        # Evict least recently used results until under budget
+        while self.n_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.n_bytes -= evicted.nbytes
+
+
+class DiskConversionCache:
+    """
+    A persistent on-disk cache for the results of `convert_eulers`.
+
+    Converted Euler angles are stored as `eulerangles-<hash>.npy` files in `directory` and read
+    back via memory-mapping, which allows results to be shared between processes and jobs.
+    Results are keyed by the conversion parameters and either a hash of the input array or,
+    when `source_file` is given, a hash of the file (or byte range of the file) the angles
+    were read from. Once the total size of the cache exceeds `max_bytes` the least recently
+    used cache files are removed, other files in `directory` are never touched.
+
+    Parameters
+    ----------
+    directory : str or path-like
+        directory in which results are stored, created if it does not exist
+    max_bytes : int
+        maximum total number of bytes of `.npy` files kept in `directory`
+
+    Attributes
+    ----------
+    hits : int
+        number of lookups answered from the cache by this object
+    misses : int
+        number of lookups which required computation by this object
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_bytes: int = 2 ** 30):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def n_bytes(self) -> int:
+        """
+        Total size of the cached results currently on disk.
+        """
+        return sum(size for _, _, size in self._cached_files())
+
+    @property
+    def stats(self) -> dict:
+        """
+        Hit/miss statistics and current size of the cache.
+        """
+        cached_files = self._cached_files()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(cached_files),
+            'n_bytes': sum(size for _, _, size in cached_files),
+            'max_bytes': self.max_bytes,
+        }
+
+    def clear(self):
+        """
+        Remove all cached results from disk and reset statistics.
+        """
+        for path, _, _ in self._cached_files():
+            _remove_if_present(path)
+        self.hits = 0
+        self.misses = 0
+
+    def convert_eulers(self,
+                       euler_angles: np.ndarray,
+                       source_meta: Union[ConversionMeta, str],
+                       target_meta: Union[ConversionMeta, str],
+                       source_file: Optional[Union[str, os.PathLike]] = None,
+                       byte_range: Optional[Tuple[int, Optional[int]]] = None,
+                       degrees: bool = True,
+                       precision: str = 'exact') -> np.ndarray:
+        """
+        Cached version of `convert_eulers`, see `eulerangles.convert_eulers`.
+
+        Parameters
+        ----------
+        euler_angles : (n, 3) or (3,) array of float
+            Euler angles to be converted
+        source_meta : ConversionMeta or str
+            metadata defining how to interpret the euler angles
+        target_meta : ConversionMeta or str
+            metadata defining how to generate euler angles
+        source_file : str, path-like or None
+            file from which `euler_angles` were read, if provided the cache is keyed on the
+            contents of the file rather than on the contents of `euler_angles`
+        byte_range : (int, int or None) tuple or None
+            range of bytes in `source_file` from which `euler_angles` were read
+        degrees : bool
+            True - Euler angles are given and returned in degrees
+            False - Euler angles are given and returned in radians
+        precision : str
+            'exact' or 'fast', see `eulerangles.convert_eulers`
+
+        Returns
+        -------
+        euler_angles : (n, 3) or (3,) array of float
+            read-only memory-mapped Euler angles resulting from conversion
+        """
+        source_meta = get_conversion_metadata(source_meta)
+        target_meta = get_conversion_metadata(target_meta)
+
+        if source_file is not None:
+            input_key = ('file', hash_file(source_file, byte_range), byte_range)
+        else:
+            input_key = ('array', hash_array(np.asarray(euler_angles)))
+
+        key = (input_key, conversion_meta_key(source_meta), conversion_meta_key(target_meta),
+               degrees, precision)
+        filename = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        path = self.directory / f'{cache_file_prefix}{filename}.npy'
+
+        try:
+            result = np.load(path, mmap_mode='r')
+        except (FileNotFoundError, ValueError, OSError):
+            result = None
+
+        if result is not None:
+            self.hits += 1
+            _touch(path)
+            return result
+
+        self.misses += 1
+        result = np.asarray(convert_eulers(euler_angles, source_meta, target_meta,
+                                           degrees=degrees, precision=precision))
+        self._write(path, result)
+        self._evict()
+        return np.load(path, mmap_mode='r') if path.exists() else result
+
+    def _write(self, path: Path, result: np.ndarray):
+        # Write to a temporary file and rename so that other processes never see partial files
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory,
+                                                           prefix=cache_file_prefix,
+                                                           suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                np.save(file, result)
+            os.replace(temporary_path, path)
+        except BaseException:
+            _remove_if_present(temporary_path)
+            raise
+
+    def _evict(self):
+        # Remove least recently used files until under budget
+        cached_files = sorted(self._cached_files(), key=lambda cached_file: cached_file[1])
+        n_bytes = sum(size for _, _, size in cached_files)
+        for path, _, size in cached_files:
+            if n_bytes <= self.max_bytes:
+                break
+            _remove_if_present(path)
+            n_bytes -= size
+
+    def _cached_files(self):
+        cached_files = []
+        for path in self.directory.glob(f'{cache_file_prefix}*.npy'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            cached_files.append((path, stat.st_mtime_ns, stat.st_size))
+        return cached_files
+
+
+def _touch(path: Path):
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_if_present(path: Union[str, os.PathLike]):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
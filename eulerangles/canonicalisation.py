@@ -0,0 +1,146 @@
+from typing import Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.constants import valid_axes, gimbal_lock_tolerance
+from .utils import get_conversion_metadata
+
+# Tait-Bryan axes sequences which are cyclic permutations of 'xyz'
+even_parity_axes = ('xyz', 'yzx', 'zxy')
+
+
+def _wrap(angles: np.ndarray, half_turn: float) -> np.ndarray:
+    """
+    Wrap angles into [-half_turn, half_turn).
+    """
+    return (angles + half_turn) % (2 * half_turn) - half_turn
+
+
+def canonicalise_eulers(euler_angles: np.ndarray,
+                        meta: Union[ConversionMeta, str],
+                        degrees: bool = True) -> np.ndarray:
+    """
+    Map Euler angles onto a unique canonical representative of the rotation they describe.
+
+    For right handed rotations, the first and third angles are wrapped into [-180, 180), the
+    second angle into [0, 180] for proper Euler angles (e.g. 'zyz') or [-90, 90] for Tait-Bryan
+    angles (e.g. 'xyz'). In gimbal lock the second angle is set exactly to its limiting value
+    and the whole rotation about the remaining axis is assigned to the angle which
+    `matrix2euler` keeps, the other is set to 0. Angles for left handed rotations are the
+    negatives of those for right handed rotations.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be canonicalised
+    meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array of float
+        canonical Euler angles
+    """
+    meta = get_conversion_metadata(meta)
+    axes = meta.axes.strip().lower()
+    if axes not in valid_axes:
+        raise ValueError(f'Axes {meta.axes} are not a valid set of euler angle axes')
+
+    half_turn = 180.0 if degrees else np.pi
+    euler_angles = np.array(euler_angles, dtype=float).reshape((-1, 3))
+
+    # Work with right handed extrinsic rotations
+    if not meta.right_handed_rotation:
+        euler_angles *= -1
+    if meta.intrinsic:
+        euler_angles = euler_angles[:, ::-1]
+        axes = axes[::-1]
+    first, second, third = [euler_angles[:, idx] for idx in range(3)]
+
+    # Resolve the ambiguity in the sign of the second angle,
+    # (a, b, c) is equivalent to (a + 180, -b, c + 180) for proper Euler angles
+    # and (a + 180, 180 - b, c + 180) for Tait-Bryan angles
+    second = _wrap(second, half_turn)
+    proper_euler = axes[0] == axes[2]
+    if proper_euler:
+        flip = second < 0
+        second = np.abs(second)
+    else:
+        flip = np.abs(second) > half_turn / 2
+        second = np.where(flip, _wrap(half_turn - second, half_turn), second)
+    first = first + flip * half_turn
+    third = third + flip * half_turn
+
+    # Gimbal lock, rotations about the first and third axes combine
+    if proper_euler:
+        sin_second = np.sin(np.deg2rad(second) if degrees else second)
+        gimbal_idx = np.abs(sin_second) < gimbal_lock_tolerance
+        upper = second > half_turn / 2
+        first = np.where(gimbal_idx, np.where(upper, first - third, first + third), first)
+        second = np.where(gimbal_idx, np.where(upper, half_turn, 0), second)
+    else:
+        cos_second = np.cos(np.deg2rad(second) if degrees else second)
+        gimbal_idx = np.abs(cos_second) < gimbal_lock_tolerance
+        upper = second > 0
+        subtract = upper if axes in even_parity_axes else ~upper
+        first = np.where(gimbal_idx, np.where(subtract, first - third, first + third), first)
+        second = np.where(gimbal_idx, np.where(upper, half_turn / 2, -half_turn / 2), second)
+    third = np.where(gimbal_idx, 0, third)
+
+    euler_angles = np.stack([_wrap(first, half_turn), second, _wrap(third, half_turn)], axis=-1)
+
+    # Return to the original convention
+    if meta.intrinsic:
+        euler_angles = euler_angles[:, ::-1]
+    if not meta.right_handed_rotation:
+        euler_angles *= -1
+
+    return np.ascontiguousarray(euler_angles.squeeze())
+
+
+def hash_eulers(euler_angles: np.ndarray,
+                meta: Union[ConversionMeta, str],
+                resolution: float = 1.0,
+                degrees: bool = True) -> np.ndarray:
+    """
+    Compute a compact integer hash of the rotations described by Euler angles.
+
+    Canonical Euler angles (see `canonicalise_eulers`) are quantised to `resolution` and the
+    three bin indices are packed into a single integer. Equivalent Euler angles hash
+    identically, rotations closer than `resolution` may still fall into neighbouring bins.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be hashed
+    meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    resolution : float
+        size of the angular bins, must divide a full turn
+    degrees : bool
+        True - Euler angles and resolution are given in degrees
+        False - Euler angles and resolution are given in radians
+
+    Returns
+    -------
+    hashes : (n,) array of int64 or int64
+        hashes of the rotations
+    """
+    full_turn = 360.0 if degrees else 2 * np.pi
+    n_bins = int(round(full_turn / resolution))
+    if n_bins < 1 or not np.isclose(n_bins * resolution, full_turn):
+        raise ValueError('resolution must divide a full turn')
+    if n_bins ** 3 >= np.iinfo(np.int64).max:
+        raise ValueError('resolution is too fine to pack into a 64-bit integer')
+
+    canonical_eulers = canonicalise_eulers(euler_angles, meta, degrees=degrees)
+    bins = np.round(canonical_eulers / resolution).astype(np.int64) % n_bins
+    bins = bins.reshape((-1, 3))
+    hashes = (bins[:, 0] * n_bins + bins[:, 1]) * n_bins + bins[:, 2]
+    return hashes.squeeze()
@@ -0,0 +1,160 @@
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .canonicalisation import canonicalise_eulers
+from .math.columnar import matrix2euler_columns
+from .math.quaternions import euler2quaternion_components, quaternion2matrix_columns, \
+    multiply_quaternion_components
+from .utils import get_conversion_metadata
+
+
+def _target_quaternion_components(euler_angles: np.ndarray,
+                                  meta: ConversionMeta,
+                                  target_meta: ConversionMeta,
+                                  degrees: bool) -> List[np.ndarray]:
+    """
+    Components of quaternions describing Euler angles as the type of transformation (active or
+    passive) of the target.
+    """
+    components = euler2quaternion_components(euler_angles,
+                                             axes=meta.axes,
+                                             intrinsic=meta.intrinsic,
+                                             right_handed_rotation=meta.right_handed_rotation,
+                                             degrees=degrees)
+    if meta.active != target_meta.active:
+        components = [components[0]] + [-component for component in components[1:]]
+    return components
+
+
+def _quaternion_components2euler(components: Sequence[np.ndarray],
+                                 target_meta: ConversionMeta,
+                                 degrees: bool) -> np.ndarray:
+    """
+    Euler angles as a (3, n) array from the components of quaternions.
+    """
+    return matrix2euler_columns(quaternion2matrix_columns(components),
+                                axes=target_meta.axes,
+                                intrinsic=target_meta.intrinsic,
+                                right_handed_rotation=target_meta.right_handed_rotation,
+                                degrees=degrees)
+
+
+def compose_eulers(eulers_a: np.ndarray,
+                   eulers_b: np.ndarray,
+                   meta_a: Union[ConversionMeta, str],
+                   meta_b: Union[ConversionMeta, str],
+                   target_meta: Optional[Union[ConversionMeta, str]] = None,
+                   chunk_size: int = 1_000_000,
+                   degrees: bool = True) -> np.ndarray:
+    """
+    Compose two sets of rotations described by Euler angles such that rotation b is applied
+    first, then rotation a.
+
+    With R_a and R_b the rotation matrices of both sets expressed as the type of transformation
+    (active or passive) of `target_meta`, Euler angles describing R_a @ R_b are returned.
+    Rotations are composed as quaternion products in chunks of rows, matrix components are
+    only built once per chunk to derive the final Euler angles. A single set of Euler angles is
+    converted once and broadcast against all rows of the other set.
+
+    Parameters
+    ----------
+    eulers_a : (n, 3) or (3,) array of float
+        Euler angles describing rotation a
+    eulers_b : (n, 3) or (3,) array of float
+        Euler angles describing rotation b, broadcast against `eulers_a`
+    meta_a : ConversionMeta or str
+        metadata defining how to interpret the first set of euler angles or a string with the
+        name of a software package
+    meta_b : ConversionMeta or str
+        metadata defining how to interpret the second set of euler angles or a string with the
+        name of a software package
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, None uses `meta_a`
+    chunk_size : int
+        number of rows processed at once
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles describing the composed rotations
+    """
+    meta_a = get_conversion_metadata(meta_a)
+    meta_b = get_conversion_metadata(meta_b)
+    target_meta = meta_a if target_meta is None else get_conversion_metadata(target_meta)
+
+    single = np.ndim(eulers_a) == 1 and np.ndim(eulers_b) == 1
+    eulers_a = np.asarray(eulers_a).reshape((-1, 3))
+    eulers_b = np.asarray(eulers_b).reshape((-1, 3))
+    n_rows = np.broadcast_shapes(eulers_a.shape, eulers_b.shape)[0]
+
+    composed_eulers = np.empty((n_rows, 3))
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        chunk_a = eulers_a if eulers_a.shape[0] == 1 else eulers_a[start:stop]
+        chunk_b = eulers_b if eulers_b.shape[0] == 1 else eulers_b[start:stop]
+        components = multiply_quaternion_components(
+            _target_quaternion_components(chunk_a, meta_a, target_meta, degrees),
+            _target_quaternion_components(chunk_b, meta_b, target_meta, degrees)
+        )
+        components = np.broadcast_arrays(*components)
+        composed_eulers[start:stop] = _quaternion_components2euler(components, target_meta,
+                                                                   degrees).T
+
+    return composed_eulers[0] if single else composed_eulers
+
+
+def invert_eulers(euler_angles: np.ndarray,
+                  meta: Union[ConversionMeta, str],
+                  target_meta: Optional[Union[ConversionMeta, str]] = None,
+                  degrees: bool = True) -> np.ndarray:
+    """
+    Derive Euler angles describing the inverse of a set of rotations.
+
+    Euler angles (a, b, c) about axes (i, j, k) are inverted by (-c, -b, -a) about (k, j, i).
+    For proper Euler angles (e.g. 'zyz') kept in the same convention the inverse is therefore
+    formed directly from the angles, without any trigonometry, and canonicalised with
+    `canonicalise_eulers`. Other cases go through quaternions.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be inverted
+    meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, None uses `meta`
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles describing the inverse rotations
+    """
+    meta = get_conversion_metadata(meta)
+    target_meta = meta if target_meta is None else get_conversion_metadata(target_meta)
+    axes = meta.axes.strip().lower()
+
+    same_convention = (axes == target_meta.axes.strip().lower()
+                       and meta.intrinsic == target_meta.intrinsic
+                       and meta.right_handed_rotation == target_meta.right_handed_rotation
+                       and meta.active == target_meta.active)
+    if same_convention and axes[0] == axes[2]:
+        euler_angles = np.asarray(euler_angles)
+        return canonicalise_eulers(-euler_angles[..., ::-1], meta, degrees=degrees)
+
+    # Inverting describes the rotations as the other type of transformation
+    components = _target_quaternion_components(euler_angles, meta, target_meta, degrees)
+    components = [components[0]] + [-component for component in components[1:]]
+    inverse_eulers = _quaternion_components2euler(components, target_meta, degrees).T
+    return inverse_eulers[0] if np.ndim(euler_angles) == 1 \
+        else np.ascontiguousarray(inverse_eulers)
@@ -0,0 +1,106 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.quaternions import euler2quaternion, invert_quaternions, matrix2quaternion, \
+    multiply_quaternions
+from .utils import get_conversion_metadata
+
+
+def _meta2quaternion(euler_angles: np.ndarray, meta: ConversionMeta, degrees: bool):
+    quaternions = euler2quaternion(euler_angles,
+                                   axes=meta.axes,
+                                   intrinsic=meta.intrinsic,
+                                   right_handed_rotation=meta.right_handed_rotation,
+                                   degrees=degrees)
+    return quaternions.reshape((-1, 4))
+
+
+def quaternion_angular_distance(quaternions_a: np.ndarray,
+                                quaternions_b: np.ndarray) -> np.ndarray:
+    """
+    Geodesic angle in radians between the rotations described by two sets of unit quaternions.
+
+    The angle is computed as 4 * arctan2(|a - b|, |a + b|), with the sign of b chosen to match
+    a, which remains accurate for both small and large angles.
+    """
+    signs = np.where(np.sum(quaternions_a * quaternions_b, axis=-1) < 0, -1, 1)
+    quaternions_b = quaternions_b * signs[..., np.newaxis]
+    return 4 * np.arctan2(np.linalg.norm(quaternions_a - quaternions_b, axis=-1),
+                          np.linalg.norm(quaternions_a + quaternions_b, axis=-1))
+
+
+def angular_distance(eulers_a: np.ndarray,
+                     eulers_b: np.ndarray,
+                     meta_a: Union[ConversionMeta, str],
+                     meta_b: Union[ConversionMeta, str],
+                     symmetry: Optional[np.ndarray] = None,
+                     chunk_size: int = 1_000_000,
+                     degrees: bool = True) -> np.ndarray:
+    """
+    Per-row geodesic angle between the rotations described by two sets of Euler angles.
+
+    Both sets are converted directly to quaternions, never to rotation matrices, and
+    processed in chunks of rows to bound memory. The angle equals arccos((tr(R_a^T R_b) - 1) / 2).
+
+    Parameters
+    ----------
+    eulers_a : (n, 3) or (3,) array of float
+        first set of Euler angles
+    eulers_b : (n, 3) or (3,) array of float
+        second set of Euler angles, broadcast against the first set
+    meta_a : ConversionMeta or str
+        metadata defining how to interpret the first set of euler angles or a string with the
+        name of a software package
+    meta_b : ConversionMeta or str
+        metadata defining how to interpret the second set of euler angles or a string with the
+        name of a software package, rotations are inverted if its active/passive nature
+        differs from `meta_a`
+    symmetry : (k, 3, 3) array of float or None
+        rotation matrices of a symmetry group, if provided the minimum angle between R_a and
+        R_b @ S over all symmetry operators S is returned
+    chunk_size : int
+        number of rows processed at once
+    degrees : bool
+        True - Euler angles are given and angles are returned in degrees
+        False - Euler angles are given and angles are returned in radians
+
+    Returns
+    -------
+    angles : (n,) array of float or float
+        angles between rotations
+    """
+    meta_a = get_conversion_metadata(meta_a)
+    meta_b = get_conversion_metadata(meta_b)
+    single = np.ndim(eulers_a) == 1 and np.ndim(eulers_b) == 1
+    eulers_a, eulers_b = np.broadcast_arrays(np.asarray(eulers_a).reshape((-1, 3)),
+                                             np.asarray(eulers_b).reshape((-1, 3)))
+
+    if symmetry is not None:
+        symmetry_quaternions = matrix2quaternion(symmetry).reshape((-1, 4))
+
+    n_rows = eulers_a.shape[0]
+    angles = np.empty(n_rows)
+    for start in range(0, n_rows, chunk_size):
+        stop = min(start + chunk_size, n_rows)
+        quaternions_a = _meta2quaternion(eulers_a[start:stop], meta_a, degrees)
+        quaternions_b = _meta2quaternion(eulers_b[start:stop], meta_b, degrees)
+
+        # Express both sets as the same kind of transformation
+        if meta_a.active != meta_b.active:
+            quaternions_b = invert_quaternions(quaternions_b)
+
+        if symmetry is not None:
+            # Pick the symmetry related rotation closest to each rotation in the first set
+            equivalent_quaternions = multiply_quaternions(quaternions_b[:, np.newaxis],
+                                                          symmetry_quaternions[np.newaxis])
+            dots = np.abs(np.einsum('nj,nkj->nk', quaternions_a, equivalent_quaternions))
+            closest = np.argmax(dots, axis=-1)
+            quaternions_b = equivalent_quaternions[np.arange(stop - start), closest]
+
+        angles[start:stop] = quaternion_angular_distance(quaternions_a, quaternions_b)
+
+    if degrees:
+        angles = np.rad2deg(angles)
+    return angles[0] if single else angles
@@ -0,0 +1,154 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .constants import euler_angle_metadata
+from .interface import convert_eulers
+from .utils import get_conversion_metadata
+
+
+class ViewingDirectionHistogram:
+    """
+    Streaming histogram of viewing directions, and optionally in-plane angles, implied by
+    Euler angles.
+
+    Viewing directions are described by the RELION rot and tilt angles (azimuth and polar
+    angle), the in-plane angle by psi. Bins are uniform in cos(tilt) and rot so that every
+    bin covers the same area of the sphere. Chunks of Euler angles in any convention are
+    added with `add`, histograms filled by parallel workers are combined with `merge`.
+
+    Parameters
+    ----------
+    n_tilt_bins : int
+        number of bins in cos(tilt) from the north (tilt = 0) to the south (tilt = 180) pole
+    n_rot_bins : int
+        number of bins in rot over [-180, 180)
+    n_psi_bins : int or None
+        number of bins in psi over [-180, 180), None does not bin in-plane angles
+    """
+
+    def __init__(self, n_tilt_bins: int = 45, n_rot_bins: int = 90,
+                 n_psi_bins: Optional[int] = None):
+        self.n_tilt_bins = n_tilt_bins
+        self.n_rot_bins = n_rot_bins
+        self.n_psi_bins = n_psi_bins
+        self.counts = np.zeros(self.shape, dtype=np.int64)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        shape = (self.n_tilt_bins, self.n_rot_bins)
+        if self.n_psi_bins is not None:
+            shape += (self.n_psi_bins,)
+        return shape
+
+    @property
+    def n_total(self) -> int:
+        return int(self.counts.sum())
+
+    def bin_edges(self, degrees: bool = True) -> Tuple[np.ndarray, ...]:
+        """
+        Edges of the bins in tilt, rot and, if binned, psi.
+
+        Returns
+        -------
+        tilt_edges, rot_edges[, psi_edges] : arrays of float
+            bin edges in degrees unless `degrees` is False
+        """
+        edges = [np.arccos(np.linspace(1, -1, self.n_tilt_bins + 1)),
+                 np.linspace(-np.pi, np.pi, self.n_rot_bins + 1)]
+        if self.n_psi_bins is not None:
+            edges.append(np.linspace(-np.pi, np.pi, self.n_psi_bins + 1))
+        if degrees:
+            edges = [np.rad2deg(bin_edges) for bin_edges in edges]
+        return tuple(edges)
+
+    @staticmethod
+    def _bin(values: np.ndarray, lower: float, upper: float, n_bins: int) -> np.ndarray:
+        bins = np.floor((values - lower) * (n_bins / (upper - lower))).astype(np.intp)
+        return np.clip(bins, 0, n_bins - 1, out=bins)
+
+    def add(self,
+            euler_angles: np.ndarray,
+            meta: Union[ConversionMeta, str],
+            chunk_size: int = 1_000_000,
+            degrees: bool = True) -> 'ViewingDirectionHistogram':
+        """
+        Add the orientations described by a set of Euler angles to the histogram.
+
+        Parameters
+        ----------
+        euler_angles : (n, 3) or (3,) array of float
+            Euler angles
+        meta : ConversionMeta or str
+            metadata defining how to interpret the euler angles or a string with the name of a
+            software package
+        chunk_size : int
+            number of rows converted at once
+        degrees : bool
+            True - Euler angles are given in degrees
+            False - Euler angles are given in radians
+
+        Returns
+        -------
+        histogram : ViewingDirectionHistogram
+            the histogram, updated in place
+        """
+        meta = get_conversion_metadata(meta)
+        euler_angles = np.asarray(euler_angles).reshape((-1, 3))
+
+        for start in range(0, euler_angles.shape[0], chunk_size):
+            relion_eulers = convert_eulers(euler_angles[start:start + chunk_size],
+                                           source_meta=meta,
+                                           target_meta=euler_angle_metadata['relion'],
+                                           degrees=degrees)
+            relion_eulers = np.asarray(relion_eulers).reshape((-1, 3))
+            if degrees:
+                relion_eulers = np.deg2rad(relion_eulers)
+            rot, tilt, psi = [relion_eulers[:, idx] for idx in range(3)]
+
+            # cos(tilt) decreases from 1 at the north pole to -1 at the south pole
+            bins = self._bin(-np.cos(tilt), -1, 1, self.n_tilt_bins)
+            bins *= self.n_rot_bins
+            bins += self._bin(rot, -np.pi, np.pi, self.n_rot_bins)
+            if self.n_psi_bins is not None:
+                bins *= self.n_psi_bins
+                bins += self._bin(psi, -np.pi, np.pi, self.n_psi_bins)
+
+            self.counts += np.bincount(bins, minlength=self.counts.size).reshape(self.shape)
+        return self
+
+    def merge(self, other: 'ViewingDirectionHistogram') -> 'ViewingDirectionHistogram':
+        """
+        Add the counts of another histogram with the same bins to this histogram.
+
+        Returns
+        -------
+        histogram : ViewingDirectionHistogram
+            the histogram, updated in place
+        """
+        if other.shape != self.shape:
+            raise ValueError('histograms must have the same bins to be merged')
+        self.counts += other.counts
+        return self
+
+    def save(self, filename: str):
+        """
+        Save counts and bin edges (in degrees) to a .npz file.
+        """
+        bin_edges = self.bin_edges()
+        arrays = {'counts': self.counts, 'tilt_edges': bin_edges[0], 'rot_edges': bin_edges[1]}
+        if self.n_psi_bins is not None:
+            arrays['psi_edges'] = bin_edges[2]
+        np.savez(filename, **arrays)
+
+    @classmethod
+    def load(cls, filename: str) -> 'ViewingDirectionHistogram':
+        """
+        Load a histogram saved with `save`.
+        """
+        with np.load(filename) as data:
+            counts = data['counts']
+        histogram = cls(*counts.shape)
+        histogram.counts += counts
+        return histogram
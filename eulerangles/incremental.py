@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .cache import conversion_meta_key
+from .interface import convert_eulers
+from .utils import get_conversion_metadata
+
+# Number of bytes at the start of a source file and before the converted offset hashed to
+# recognise a replaced source file
+fingerprint_size = 1024
+
+
+class IncrementalConverter:
+    """
+    Convert only the rows appended to a growing table of Euler angles since the last update.
+
+    The converter remembers how much of its source has already been converted, as a number of
+    rows for arrays (`update`) or a byte offset for text files (`update_file`), and converts
+    new rows with `convert_eulers`. If `state_file` is given the state is saved there as JSON
+    after every update and loaded on construction, so that a converter created in a later run
+    continues where the previous one stopped.
+
+    >>> converter = IncrementalConverter('relion', 'dynamo', state_file='conversion.json')
+    >>> new_eulers = converter.update_file('particles.txt', cols=(0, 1, 2))
+
+    Parameters
+    ----------
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+    state_file : str, path-like or None
+        JSON file in which the state is persisted, None keeps the state in memory only
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Attributes
+    ----------
+    n_rows : int
+        number of rows converted so far
+    offset : int
+        byte offset in `source_file` up to which rows have been converted
+    source_file : str or None
+        absolute path of the text file converted by `update_file`, None if no file has been
+        converted
+    source_fingerprint : list or None
+        hashes of the first and of the last `fingerprint_size` bytes before `offset` of
+        `source_file`, used to detect a file replaced by another one longer than `offset`.
+        Files rewritten with the same converted content, e.g. renamed over the original by a
+        writer, are not considered replaced
+    """
+
+    def __init__(self,
+                 source_meta: Union[ConversionMeta, str],
+                 target_meta: Union[ConversionMeta, str],
+                 state_file: Optional[Union[str, os.PathLike]] = None,
+                 degrees: bool = True):
+        self.source_meta = get_conversion_metadata(source_meta)
+        self.target_meta = get_conversion_metadata(target_meta)
+        self.state_file = Path(state_file) if state_file is not None else None
+        self.degrees = degrees
+        self.n_rows = 0
+        self.offset = 0
+        self.source_file = None
+        self.source_fingerprint = None
+
+        if self.state_file is not None and self.state_file.exists():
+            self._load_state()
+
+    @property
+    def _conversion_key(self) -> list:
+        # Lists compare equal to the values read back from JSON
+        return [list(conversion_meta_key(self.source_meta)),
+                list(conversion_meta_key(self.target_meta)),
+                self.degrees]
+
+    def reset(self):
+        """
+        Forget all converted rows, e.g. after the source has been replaced.
+        """
+        self.n_rows = 0
+        self.offset = 0
+        self.source_file = None
+        self.source_fingerprint = None
+        self._save_state()
+
+    def update(self, euler_angles: np.ndarray) -> np.ndarray:
+        """
+        Convert the rows of a growing array of Euler angles which have not been converted yet.
+
+        Parameters
+        ----------
+        euler_angles : (n, 3) array of float
+            the whole table of Euler angles, the first `n_rows` rows are assumed to be unchanged
+            since the last update
+
+        Returns
+        -------
+        euler_angles : (m, 3) array of float
+            converted Euler angles for the m rows appended since the last update
+        """
+        if self.source_file is not None:
+            raise ValueError(f'converter is tracking the file {self.source_file}, '
+                             f'use update_file or reset')
+        euler_angles = np.asarray(euler_angles).reshape((-1, 3))
+        if euler_angles.shape[0] < self.n_rows:
+            raise ValueError(f'array has {euler_angles.shape[0]} rows but {self.n_rows} rows '
+                             f'were already converted, call reset if it was replaced')
+
+        converted_eulers = self._convert(euler_angles[self.n_rows:])
+        self.n_rows = euler_angles.shape[0]
+        self._save_state()
+        return converted_eulers
+
+    def update_file(self,
+                    filename: Union[str, os.PathLike],
+                    cols: Sequence[int] = (0, 1, 2),
+                    delimiter: Optional[str] = None,
+                    comments: Sequence[str] = ('#',)) -> np.ndarray:
+        """
+        Convert the rows appended to a text file since the last update.
+
+        Only complete lines are read, a partially written last line is left for the next
+        update. Empty lines and lines starting with one of `comments` are skipped, e.g.
+        ``comments=('#', 'data_', 'loop_', '_')`` skips the header of a STAR file. A file
+        replaced by another one, even if longer than the converted offset, raises a ValueError
+        until `reset` is called.
+
+        Parameters
+        ----------
+        filename : str or path-like
+            text file to which rows are appended
+        cols : sequence of three int
+            indices of the columns holding the first, second and third Euler angles
+        delimiter : str or None
+            string separating columns, None splits on whitespace
+        comments : sequence of str
+            prefixes of lines which are skipped
+
+        Returns
+        -------
+        euler_angles : (m, 3) array of float
+            converted Euler angles for the m rows appended since the last update
+        """
+        if len(cols) != 3:
+            raise ValueError('cols must contain exactly three column indices')
+        filename = os.path.abspath(filename)
+        if self.source_file is None and self.n_rows > 0:
+            raise ValueError('converter is tracking an array, use update or reset')
+        if self.source_file is not None and self.source_file != filename:
+            raise ValueError(f'converter is tracking the file {self.source_file}, '
+                             f'call reset to convert {filename}')
+
+        with open(filename, 'rb') as file:
+            file.seek(0, os.SEEK_END)
+            if file.tell() < self.offset:
+                raise ValueError(f'{filename} is shorter than the converted offset '
+                                 f'{self.offset}, call reset if it was replaced')
+            if self.offset > 0 and _fingerprint(file, self.offset) != self.source_fingerprint:
+                raise ValueError(f'{filename} was replaced since the last update, '
+                                 f'call reset to convert it from the start')
+            file.seek(self.offset)
+            appended_bytes = file.read()
+
+            # Stop after the last complete line
+            n_complete_bytes = appended_bytes.rfind(b'\n') + 1
+            fingerprint = _fingerprint(file, self.offset + n_complete_bytes)
+
+        lines = appended_bytes[:n_complete_bytes].decode().splitlines()
+        prefixes = tuple(comments)
+        lines = [line for line in lines
+                 if line.strip() and not line.lstrip().startswith(prefixes)]
+
+        if len(lines) > 0:
+            euler_angles = np.loadtxt(lines, usecols=tuple(cols), delimiter=delimiter,
+                                      comments=None, ndmin=2, dtype=float)
+        else:
+            euler_angles = np.empty((0, 3))
+
+        converted_eulers = self._convert(euler_angles)
+        self.source_file = filename
+        self.source_fingerprint = fingerprint
+        self.offset += n_complete_bytes
+        self.n_rows += euler_angles.shape[0]
+        self._save_state()
+        return converted_eulers
+
+    def _convert(self, euler_angles: np.ndarray) -> np.ndarray:
+        if euler_angles.shape[0] == 0:
+            return np.empty((0, 3))
+        converted_eulers = convert_eulers(euler_angles, self.source_meta, self.target_meta,
+                                          degrees=self.degrees)
+        return np.asarray(converted_eulers).reshape((-1, 3))
+
+    def _load_state(self):
+        with open(self.state_file) as file:
+            state = json.load(file)
+        if state['conversion'] != self._conversion_key:
+            raise ValueError(f'state in {self.state_file} was saved for a different conversion')
+        self.n_rows = state['n_rows']
+        self.offset = state['offset']
+        self.source_file = state['source_file']
+        self.source_fingerprint = state.get('source_fingerprint')
+
+    def _save_state(self):
+        if self.state_file is None:
+            return
+        state = {'conversion': self._conversion_key,
+                 'n_rows': self.n_rows,
+                 'offset': self.offset,
+                 'source_file': self.source_file,
+                 'source_fingerprint': self.source_fingerprint}
+
+        # Write to a temporary file and rename so that an interrupted write never loses state
+        directory = self.state_file.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w') as file:
+                json.dump(state, file)
+            os.replace(temporary_path, self.state_file)
+        except BaseException:
+            try:
+                os.remove(temporary_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+
+def _fingerprint(file, offset: int) -> list:
+    """
+    Hashes of the first and of the last `fingerprint_size` bytes before `offset` of an open
+    file.
+    """
+    file.seek(0)
+    head_digest = hashlib.sha1(file.read(min(offset, fingerprint_size))).hexdigest()
+    file.seek(max(offset - fingerprint_size, 0))
+    tail_digest = hashlib.sha1(file.read(min(offset, fingerprint_size))).hexdigest()
+    return [head_digest, tail_digest]
@@ -1,14 +1,21 @@
-from typing import Union
+from typing import Dict, Sequence, Tuple, Union
 
 import numpy as np
 from .base import ConversionMeta
+from .math.columnar import euler2euler_columns
 from .math.eulers_to_eulers import euler2euler
+from .math.eulers_to_rotation_matrix import euler2matrix
+from .math.rotation_matrix_to_eulers import matrix2euler
+from .math.rigid_body_transforms import invert_rigid_body_transforms
+from .math.rotation_matrices.utils import invert_rotation_matrices
 from .utils import get_conversion_metadata
 
 
 def convert_eulers(euler_angles: np.ndarray,
                    source_meta: Union[ConversionMeta, str],
-                   target_meta: Union[ConversionMeta, str]):
+                   target_meta: Union[ConversionMeta, str],
+                   degrees: bool = True,
+                   precision: str = 'exact'):
     """
     Convert Euler angles defined according to one 'convention' into Euler angles defined
     according to another.
@@ -16,7 +23,7 @@ def convert_eulers(euler_angles: np.ndarray,
     Parameters
     ----------
     euler_angles : (n, 3) or (3,) array of float
-        Euler angles to be converted
+        Euler angles to be converted, dask arrays are converted lazily
 
     source_meta : ConversionMeta or str
         metadata defining how to interpret the euler angles or a string with the name of a
@@ -26,6 +33,15 @@ def convert_eulers(euler_angles: np.ndarray,
         metadata defining how to generate euler angles or a string with the name of a software
         package
 
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    precision : str
+        'exact' - full double precision
+        'fast' - single precision rotation matrices with an angular error below 1e-4 degrees,
+        see `euler2euler`
+
     Returns
     -------
     euler_angles : (n, 3) or (3,) array of float
@@ -51,7 +67,231 @@ def convert_eulers(euler_angles: np.ndarray,
                                target_axes=target_meta.axes,
                                target_intrinsic=target_meta.intrinsic,
                                target_right_handed_rotation=target_meta.right_handed_rotation,
-                               invert_matrix=invert_matrix)
+                               invert_matrix=invert_matrix,
+                               degrees=degrees,
+                               precision=precision)
 
     return final_eulers
 
+
+def convert_eulers_many(euler_angles: np.ndarray,
+                        source_meta: Union[ConversionMeta, str],
+                        targets: Sequence[Union[ConversionMeta, str]],
+                        degrees: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Convert Euler angles defined according to one 'convention' into Euler angles defined
+    according to several others.
+
+    Rotation matrices are calculated once from the input Euler angles (and inverted at most
+    once) then Euler angles are derived for each target.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    targets : sequence of ConversionMeta or str
+        metadata defining how to generate euler angles or strings with the names of software
+        packages
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : dict of str to (n, 3) or (3,) array of float
+        Euler angles resulting from conversion, keyed by the target as given if it is a string
+        or by the name of the ConversionMeta object otherwise, keys must be unique
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_metas = [get_conversion_metadata(target) for target in targets]
+    keys = [target if isinstance(target, str) else target_meta.name
+            for target, target_meta in zip(targets, target_metas)]
+    duplicate_keys = sorted({key for key in keys if keys.count(key) > 1})
+    if duplicate_keys:
+        raise ValueError(f'targets must have unique keys, {duplicate_keys} given more than once')
+
+    rotation_matrices = euler2matrix(euler_angles,
+                                     axes=source_meta.axes,
+                                     intrinsic=source_meta.intrinsic,
+                                     right_handed_rotation=source_meta.right_handed_rotation,
+                                     degrees=degrees)
+    inverted_rotation_matrices = None
+
+    converted_eulers = {}
+    for key, target_meta in zip(keys, target_metas):
+        # Invert matrices only once, and only if required by a target
+        if source_meta.active != target_meta.active:
+            if inverted_rotation_matrices is None:
+                inverted_rotation_matrices = invert_rotation_matrices(rotation_matrices)
+            target_rotation_matrices = inverted_rotation_matrices
+        else:
+            target_rotation_matrices = rotation_matrices
+
+        target_eulers = matrix2euler(target_rotation_matrices,
+                                     axes=target_meta.axes,
+                                     intrinsic=target_meta.intrinsic,
+                                     right_handed_rotation=target_meta.right_handed_rotation,
+                                     degrees=degrees)
+        converted_eulers[key] = target_eulers
+
+    return converted_eulers
+
+
+def convert_matrices(rotation_matrices: np.ndarray,
+                     source_meta: Union[ConversionMeta, str],
+                     target_meta: Union[ConversionMeta, str]) -> np.ndarray:
+    """
+    Convert rotation matrices associated with one 'convention' into rotation matrices
+    associated with another, without deriving Euler angles.
+
+    Rotation matrices in this package always premultiply column vectors in a right handed
+    coordinate system, so the axes, intrinsic/extrinsic nature and rotation handedness of a
+    convention only affect how its Euler angles map onto a matrix. Only the active/passive
+    nature of a transformation changes the matrices themselves, requiring their inversion.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array of float
+        rotation matrices to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the rotation matrices or a string with the name of
+        a software package
+
+    target_meta : ConversionMeta or str
+        metadata defining the desired rotation matrices or a string with the name of a
+        software package
+
+    Returns
+    -------
+    rotation_matrices : (n, 3, 3) or (3, 3) array of float
+        rotation matrices resulting from conversion
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+    rotation_matrices = np.asarray(rotation_matrices)
+
+    if source_meta.active != target_meta.active:
+        rotation_matrices = invert_rotation_matrices(rotation_matrices)
+
+    return rotation_matrices
+
+
+def convert_eulers_and_shifts(euler_angles: np.ndarray,
+                              shifts: np.ndarray,
+                              source_meta: Union[ConversionMeta, str],
+                              target_meta: Union[ConversionMeta, str],
+                              degrees: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert rigid body transformations, given as Euler angles and shifts defined according to
+    one 'convention', into Euler angles and shifts defined according to another.
+
+    Shifts are interpreted as the translation t of the transformation x' = Rx + t, where R is
+    the rotation matrix described by the Euler angles. When the active/passive nature of the
+    source and target differ the whole transformation is inverted, yielding R^T and -R^T t,
+    otherwise shifts are unchanged.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be converted
+
+    shifts : (n, 3) or (3,) array of float
+        shifts to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles, shifts : (n, 3) or (3,) array of float, (n, 3) or (3,) array of float
+        Euler angles and shifts resulting from conversion
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+    shifts = np.asarray(shifts, dtype=float)
+
+    rotation_matrices = euler2matrix(euler_angles,
+                                     axes=source_meta.axes,
+                                     intrinsic=source_meta.intrinsic,
+                                     right_handed_rotation=source_meta.right_handed_rotation,
+                                     degrees=degrees)
+
+    if source_meta.active != target_meta.active:
+        rotation_matrices, shifts = invert_rigid_body_transforms(rotation_matrices, shifts)
+
+    final_eulers = matrix2euler(rotation_matrices,
+                                axes=target_meta.axes,
+                                intrinsic=target_meta.intrinsic,
+                                right_handed_rotation=target_meta.right_handed_rotation,
+                                degrees=degrees)
+
+    return final_eulers, shifts.squeeze()
+
+
+def convert_eulers_columns(euler_angles: Union[np.ndarray, Sequence[np.ndarray]],
+                           source_meta: Union[ConversionMeta, str],
+                           target_meta: Union[ConversionMeta, str],
+                           degrees: bool = True) -> np.ndarray:
+    """
+    Convert Euler angles stored as columns defined according to one 'convention' into Euler
+    angles stored as columns defined according to another.
+
+    Structure-of-arrays equivalent of `convert_eulers` for columnar data, e.g. columns of a
+    STAR file or DataFrame, which avoids packing angles into an (n, 3) array.
+
+    Parameters
+    ----------
+    euler_angles : (3, n) array or sequence of three (n,) arrays
+        Euler angles to be converted, first, second and third angles
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (3, n) array of float
+        Euler angles resulting from conversion, each row is contiguous in memory
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+
+    # Check if desired transformation is of the same type as the input Eulers
+    invert_matrix = source_meta.active != target_meta.active
+
+    final_eulers = euler2euler_columns(
+        euler_angles,
+        source_axes=source_meta.axes,
+        source_intrinsic=source_meta.intrinsic,
+        source_right_handed_rotation=source_meta.right_handed_rotation,
+        target_axes=target_meta.axes,
+        target_intrinsic=target_meta.intrinsic,
+        target_right_handed_rotation=target_meta.right_handed_rotation,
+        invert_matrix=invert_matrix,
+        degrees=degrees
+    )
+    return final_eulers
@@ -0,0 +1,210 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.quaternions import euler2quaternion, invert_quaternions, multiply_quaternions, \
+    quaternion2matrix, quaternion_exp, quaternion_log, slerp_quaternions
+from .math.rotation_matrix_to_eulers import matrix2euler
+from .utils import get_conversion_metadata
+
+interpolation_methods = ('slerp', 'squad')
+interpolation_outputs = ('eulers', 'matrices')
+
+
+def _continuous_quaternions(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Flip the signs of quaternions along axis -2 so that consecutive quaternions lie in the same
+    hemisphere.
+    """
+    dots = np.sum(quaternions[..., 1:, :] * quaternions[..., :-1, :], axis=-1)
+    signs = np.cumprod(np.where(dots < 0, -1, 1), axis=-1)
+    signs = np.concatenate([np.ones(signs.shape[:-1] + (1,)), signs], axis=-1)
+    return quaternions * signs[..., np.newaxis]
+
+
+def _squad_control_points(quaternions: np.ndarray,
+                          times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inner control points of quaternions along axis -2 sampled at `times` for the segments
+    leaving and entering each quaternion, end points are their own control points.
+
+    With a_i = log(q_i^-1 q_i+1), b_i = log(q_i^-1 q_i-1) and intervals h_i = t_i+1 - t_i, the
+    tangent at q_i is the angular velocity (a_i - b_i) / (h_i-1 + h_i) scaled by the interval
+    of each segment, so that the curve has a continuous angular velocity in time. For evenly
+    spaced times both control points reduce to q_i exp(-(a_i + b_i) / 4).
+    """
+    outgoing = quaternions.copy()
+    incoming = quaternions.copy()
+    if quaternions.shape[-2] < 3:
+        return outgoing, incoming
+    inner = quaternions[..., 1:-1, :]
+    inverse = invert_quaternions(inner)
+    log_next = quaternion_log(multiply_quaternions(inverse, quaternions[..., 2:, :]))
+    log_previous = quaternion_log(multiply_quaternions(inverse, quaternions[..., :-2, :]))
+
+    intervals = np.diff(times)
+    interval_previous = intervals[:-1, np.newaxis]
+    interval_next = intervals[1:, np.newaxis]
+    angular_velocity = (log_next - log_previous) / (interval_previous + interval_next)
+    outgoing[..., 1:-1, :] = multiply_quaternions(
+        inner, quaternion_exp((interval_next * angular_velocity - log_next) / 2)
+    )
+    incoming[..., 1:-1, :] = multiply_quaternions(
+        inner, quaternion_exp(-(interval_previous * angular_velocity + log_previous) / 2)
+    )
+    return outgoing, incoming
+
+
+def interpolate_eulers(times: np.ndarray,
+                       euler_angles: np.ndarray,
+                       query_times: np.ndarray,
+                       source_meta: Union[ConversionMeta, str],
+                       target_meta: Optional[Union[ConversionMeta, str]] = None,
+                       method: str = 'slerp',
+                       output: str = 'eulers',
+                       degrees: bool = True) -> np.ndarray:
+    """
+    Interpolate sequences of orientations described by Euler angles at new times.
+
+    Orientations are converted to quaternions once and all segments are interpolated together,
+    either piecewise along the shortest arc (SLERP) or with a smooth spherical spline (SQUAD)
+    whose angular velocity is continuous in time, also for unevenly spaced `times`.
+    Query times outside the range of `times` are clamped to the first or last orientation.
+
+    Parameters
+    ----------
+    times : (n,) array of float
+        strictly increasing times of the orientations
+    euler_angles : (..., n, 3) array of float
+        Euler angles describing one or more sequences of n orientations sampled at `times`
+    query_times : (m,) array of float
+        times at which orientations are interpolated
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, None uses `source_meta`
+    method : str
+        'slerp' or 'squad'
+    output : str
+        'eulers' - Euler angles are returned
+        'matrices' - rotation matrices are returned
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    orientations : (..., m, 3) or (..., m, 3, 3) array of float
+        interpolated Euler angles or rotation matrices
+    """
+    if method not in interpolation_methods:
+        raise ValueError(f'method must be one of {interpolation_methods}')
+    if output not in interpolation_outputs:
+        raise ValueError(f'output must be one of {interpolation_outputs}')
+
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = source_meta if target_meta is None else get_conversion_metadata(target_meta)
+
+    times = np.asarray(times, dtype=float)
+    query_times = np.asarray(query_times, dtype=float).reshape(-1)
+    euler_angles = np.asarray(euler_angles)
+    if times.ndim != 1 or euler_angles.shape[-2:] != (times.shape[0], 3):
+        raise ValueError('euler_angles must have shape (..., n, 3) for n times')
+    if np.any(np.diff(times) <= 0):
+        raise ValueError('times must be strictly increasing')
+
+    batch_shape = euler_angles.shape[:-2]
+    quaternions = euler2quaternion(euler_angles.reshape((-1, 3)),
+                                   axes=source_meta.axes,
+                                   intrinsic=source_meta.intrinsic,
+                                   right_handed_rotation=source_meta.right_handed_rotation,
+                                   degrees=degrees)
+    quaternions = _continuous_quaternions(quaternions.reshape(batch_shape + (-1, 4)))
+
+    # Locate the segment and the fraction along it for every query time
+    if times.shape[0] == 1:
+        segments = np.zeros(query_times.shape[0], dtype=int)
+        fractions = np.zeros(query_times.shape[0])
+        quaternions = np.concatenate([quaternions, quaternions], axis=-2)
+    else:
+        clamped_times = np.clip(query_times, times[0], times[-1])
+        segments = np.clip(np.searchsorted(times, clamped_times, side='right') - 1,
+                           0, times.shape[0] - 2)
+        fractions = (clamped_times - times[segments]) / (times[segments + 1] - times[segments])
+
+    start_quaternions = quaternions[..., segments, :]
+    end_quaternions = quaternions[..., segments + 1, :]
+    interpolated = slerp_quaternions(start_quaternions, end_quaternions, fractions)
+
+    if method == 'squad':
+        outgoing, incoming = _squad_control_points(quaternions, times)
+        inner = slerp_quaternions(outgoing[..., segments, :],
+                                  incoming[..., segments + 1, :],
+                                  fractions)
+        interpolated = slerp_quaternions(interpolated, inner, 2 * fractions * (1 - fractions))
+
+    # Check if desired transformation is of the same type as the input Eulers
+    if source_meta.active != target_meta.active:
+        interpolated = invert_quaternions(interpolated)
+
+    rotation_matrices = quaternion2matrix(interpolated).reshape((-1, 3, 3))
+    if output == 'matrices':
+        return rotation_matrices.reshape(batch_shape + (-1, 3, 3))
+
+    interpolated_eulers = matrix2euler(rotation_matrices,
+                                       axes=target_meta.axes,
+                                       intrinsic=target_meta.intrinsic,
+                                       right_handed_rotation=target_meta.right_handed_rotation,
+                                       degrees=degrees)
+    return np.asarray(interpolated_eulers).reshape(batch_shape + (-1, 3))
+
+
+def resample_eulers(euler_angles: np.ndarray,
+                    n_samples: int,
+                    source_meta: Union[ConversionMeta, str],
+                    target_meta: Optional[Union[ConversionMeta, str]] = None,
+                    method: str = 'slerp',
+                    output: str = 'eulers',
+                    degrees: bool = True) -> np.ndarray:
+    """
+    Resample sequences of evenly spaced orientations to `n_samples` evenly spaced orientations
+    spanning the same interval, see `interpolate_eulers`.
+
+    Parameters
+    ----------
+    euler_angles : (..., n, 3) array of float
+        Euler angles describing one or more sequences of n evenly spaced orientations
+    n_samples : int
+        number of orientations in each resampled sequence
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, None uses `source_meta`
+    method : str
+        'slerp' or 'squad'
+    output : str
+        'eulers' - Euler angles are returned
+        'matrices' - rotation matrices are returned
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    orientations : (..., n_samples, 3) or (..., n_samples, 3, 3) array of float
+        resampled Euler angles or rotation matrices
+    """
+    n_orientations = np.shape(euler_angles)[-2]
+    return interpolate_eulers(np.arange(n_orientations),
+                              euler_angles,
+                              np.linspace(0, n_orientations - 1, n_samples),
+                              source_meta,
+                              target_meta=target_meta,
+                              method=method,
+                              output=output,
+                              degrees=degrees)
@@ -0,0 +1,171 @@
+from typing import Tuple
+
+import numpy as np
+
+from .quaternions import euler2quaternion, matrix2quaternion, quaternion2matrix, \
+    quaternion_exp, quaternion_log
+from .rotation_matrix_to_eulers import matrix2euler
+
+
+def quaternion2rotvec(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Derive rotation vectors, whose norm is the rotation angle in radians in [0, pi], from unit
+    quaternions (w, x, y, z).
+    """
+    quaternions = np.asarray(quaternions)
+    quaternions = quaternions * np.where(quaternions[..., :1] < 0, -1, 1)
+    return 2 * quaternion_log(quaternions)
+
+
+def rotvec2quaternion(rotation_vectors: np.ndarray) -> np.ndarray:
+    """
+    Derive unit quaternions (w, x, y, z) from rotation vectors, whose norm is the rotation angle
+    in radians.
+    """
+    return quaternion_exp(np.asarray(rotation_vectors) / 2)
+
+
+def euler2rotvec(euler_angles: np.ndarray,
+                 axes: str,
+                 intrinsic: bool,
+                 right_handed_rotation: bool,
+                 degrees: bool = True) -> np.ndarray:
+    """
+    Derive rotation vectors from a set of euler angles.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array
+        euler angles (in degrees unless `degrees` is False)
+    axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+        e.g. 'zyz', 'zxz', 'xyz'
+    intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    degrees : bool
+        True - Euler angles are given in degrees
+        False - Euler angles are given in radians
+
+    Returns
+    -------
+    rotation_vectors : (n, 3) or (3,) array
+        rotation vectors, the norm of each is the rotation angle in radians
+    """
+    quaternions = euler2quaternion(euler_angles, axes, intrinsic, right_handed_rotation,
+                                   degrees=degrees)
+    return quaternion2rotvec(quaternions)
+
+
+def rotvec2euler(rotation_vectors: np.ndarray,
+                 axes: str,
+                 intrinsic: bool,
+                 right_handed_rotation: bool,
+                 degrees: bool = True) -> np.ndarray:
+    """
+    Derive a set of euler angles from rotation vectors.
+
+    Parameters
+    ----------
+    rotation_vectors : (n, 3) or (3,) array
+        rotation vectors, the norm of each is the rotation angle in radians
+    axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+        e.g. 'zyz', 'zxz', 'xyz'
+    intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    degrees : bool
+        True - Euler angles are returned in degrees
+        False - Euler angles are returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array
+        euler angles
+    """
+    rotation_matrices = quaternion2matrix(rotvec2quaternion(rotation_vectors))
+    return matrix2euler(rotation_matrices, axes, intrinsic, right_handed_rotation,
+                        degrees=degrees)
+
+
+def matrix2axisangle(rotation_matrices: np.ndarray,
+                     degrees: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Derive rotation axes and angles from rotation matrices.
+
+    Quaternions are derived with Shepperd's method and the angle with arctan2, which remain
+    accurate for rotations close to 0 and close to 180 degrees. The axis of an identity
+    rotation is arbitrary, (0, 0, 1) is returned.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    degrees : bool
+        True - angles are returned in degrees
+        False - angles are returned in radians
+
+    Returns
+    -------
+    rotation_axes, angles : (n, 3) or (3,) array, (n,) array or float
+        unit rotation axes and right handed rotation angles in [0, 180]
+    """
+    quaternions = matrix2quaternion(rotation_matrices)
+    vectors = quaternions[..., 1:]
+    vector_norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    angles = 2 * np.arctan2(vector_norms[..., 0], quaternions[..., 0])
+
+    identity = vector_norms == 0
+    rotation_axes = np.where(identity, [0, 0, 1], vectors / np.where(identity, 1, vector_norms))
+    angles = np.rad2deg(angles) if degrees else angles
+    return rotation_axes, angles
+
+
+def axisangle2matrix(rotation_axes: np.ndarray,
+                     angles: np.ndarray,
+                     degrees: bool = True) -> np.ndarray:
+    """
+    Derive rotation matrices from rotation axes and right handed rotation angles using
+    Rodrigues' rotation formula.
+
+    Parameters
+    ----------
+    rotation_axes : (n, 3) or (3,) array
+        rotation axes, normalised before use
+    angles : (n,) array or float
+        rotation angles
+    degrees : bool
+        True - angles are given in degrees
+        False - angles are given in radians
+
+    Returns
+    -------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    """
+    rotation_axes = np.asarray(rotation_axes, dtype=float).reshape((-1, 3))
+    rotation_axes = rotation_axes / np.linalg.norm(rotation_axes, axis=-1, keepdims=True)
+    angles = np.asarray(angles, dtype=float).reshape(-1)
+    if degrees:
+        angles = np.deg2rad(angles)
+
+    # Cross product matrices of the rotation axes
+    x, y, z = [rotation_axes[:, idx] for idx in range(3)]
+    zeros = np.zeros_like(x)
+    cross_matrices = np.stack([zeros, -z, y,
+                               z, zeros, -x,
+                               -y, x, zeros], axis=-1).reshape((-1, 3, 3))
+
+    sines = np.sin(angles)[:, np.newaxis, np.newaxis]
+    # 1 - cos(theta) written as 2 sin^2(theta / 2) to avoid cancellation for small angles
+    versines = 2 * np.sin(angles / 2)[:, np.newaxis, np.newaxis] ** 2
+    rotation_matrices = np.eye(3) + sines * cross_matrices + \
+        versines * (cross_matrices @ cross_matrices)
+    return rotation_matrices.squeeze()
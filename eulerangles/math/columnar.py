@@ -0,0 +1,197 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from .constants import valid_axes
+from .rotation_matrices.angle_to_matrix import theta2rotm
+from .rotation_matrix_to_eulers import matrix2euler_right_handed
+
+
+def _angle_columns(euler_angles: Union[np.ndarray, Sequence[np.ndarray]]) -> List[np.ndarray]:
+    """
+    Split (3, n) Euler angles into three 1-D arrays without copying.
+    """
+    if len(euler_angles) != 3:
+        raise ValueError('euler_angles must be a (3, n) array or a sequence of three arrays')
+    return [np.asarray(angles, dtype=float).reshape(-1) for angles in euler_angles]
+
+
+def _sanitise_axes(axes: str) -> str:
+    axes_sanitised = axes.strip().lower()
+    if axes_sanitised not in valid_axes:
+        raise ValueError(f'Axes {axes} are not a valid set of euler angle axes')
+    return axes_sanitised
+
+
+def euler2matrix_columns(euler_angles: Union[np.ndarray, Sequence[np.ndarray]],
+                         axes: str,
+                         intrinsic: bool,
+                         right_handed_rotation: bool,
+                         degrees: bool = True) -> np.ndarray:
+    """
+    Derive rotation matrices from a set of euler angles stored as columns.
+
+    Structure-of-arrays equivalent of `euler2matrix`, each angle is read from its own contiguous
+    array and each of the nine matrix components is written to its own contiguous array.
+
+    Parameters
+    ----------
+    euler_angles : (3, n) array or sequence of three (n,) arrays
+        euler angles (in degrees unless `degrees` is False), first, second and third angles
+    axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+        e.g. 'zyz', 'zxz', 'xyz'
+    intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    degrees : bool
+        True - Euler angles are given in degrees
+        False - Euler angles are given in radians
+
+    Returns
+    -------
+    rotation_matrices : (3, 3, n) array
+        rotation matrices derived from euler angles, rotation_matrices[i, j] is a contiguous
+        array of the (i, j) components.
+    """
+    angle_columns = _angle_columns(euler_angles)
+    axes = _sanitise_axes(axes)
+
+    if not right_handed_rotation:
+        # Left handed rotation case
+        angle_columns = [angles * -1 for angles in angle_columns]
+
+    elemental_rotations = [theta2rotm(theta=angle_columns[idx], axis=axes[idx], degrees=degrees)
+                           for idx in range(3)]
+    elemental_rotations = [rotations.reshape((-1, 3, 3)) for rotations in elemental_rotations]
+
+    if not intrinsic:
+        elemental_rotations = elemental_rotations[::-1]
+
+    # Compose directly into a (3, 3, n) array through its (n, 3, 3) view
+    n = max(len(angles) for angles in angle_columns)
+    rotation_matrices = np.empty((3, 3, n))
+    np.matmul(elemental_rotations[0] @ elemental_rotations[1], elemental_rotations[2],
+              out=rotation_matrices.transpose((2, 0, 1)))
+    return rotation_matrices
+
+
+def matrix2euler_columns(rotation_matrices: np.ndarray,
+                         axes: str,
+                         intrinsic: bool,
+                         right_handed_rotation: bool,
+                         degrees: bool = True) -> np.ndarray:
+    """
+    Derive a set of euler angles, stored as columns, from rotation matrices stored as columns.
+
+    Structure-of-arrays equivalent of `matrix2euler`, each of the nine matrix components is read
+    from its own contiguous array and each angle is written to its own contiguous array.
+
+    Parameters
+    ----------
+    rotation_matrices : (3, 3, n) array of float
+        rotation matrices from which euler angles are derived, rotation_matrices[i, j] holds the
+        (i, j) components.
+    axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+        e.g. 'zyz', 'zxz', 'xyz'
+    intrinsic : bool
+        True - Euler angles are for intrinsic rotations
+        False - Euler angles are for extrinsic rotations
+    right_handed_rotation : bool
+        True - Euler angles are for right handed rotations
+        False - Euler angles are for left handed rotations
+    degrees : bool
+        True - Euler angles are returned in degrees
+        False - Euler angles are returned in radians
+
+    Returns
+    -------
+    euler_angles : (3, n) array
+        Euler angles derived from rotation matrices, euler_angles[i] is a contiguous array
+        of the i-th angles.
+    """
+    rotation_matrices = np.asarray(rotation_matrices)
+    if rotation_matrices.shape[:2] != (3, 3):
+        raise ValueError(f'rotation_matrices must be a (3, 3, n) array, '
+                         f'got shape {rotation_matrices.shape}')
+    rotation_matrices = rotation_matrices.reshape((3, 3, -1))
+    axes = _sanitise_axes(axes)
+
+    # The (n, 3, 3) view of the components is consumed without copying
+    euler_angles = matrix2euler_right_handed(rotation_matrices.transpose((2, 0, 1)), axes,
+                                             intrinsic, degrees=degrees)
+
+    if not right_handed_rotation:
+        euler_angles *= -1
+
+    return euler_angles.T
+
+
+def euler2euler_columns(euler_angles: Union[np.ndarray, Sequence[np.ndarray]],
+                        source_axes: str,
+                        source_right_handed_rotation: bool,
+                        source_intrinsic: bool,
+                        target_axes: str,
+                        target_right_handed_rotation: bool,
+                        target_intrinsic: bool,
+                        invert_matrix: bool,
+                        degrees: bool = True) -> np.ndarray:
+    """
+    Convert a set of Euler angles stored as columns defined one way into a set of Euler angles
+    stored as columns defined another way.
+
+    Structure-of-arrays equivalent of `euler2euler`, see `euler2matrix_columns` and
+    `matrix2euler_columns`.
+
+    Parameters
+    ----------
+    euler_angles : (3, n) array or sequence of three (n,) arrays
+        Euler angles to convert
+    source_axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+    source_right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    source_intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    target_axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+    target_right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    target_intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    invert_matrix : bool
+        True - rotation matrices will be inverted prior to deriving new Euler angles
+        False - rotation matrices will not be inverted prior to deriving new Euler angles
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (3, n) array
+        Euler angles generated from input Euler angles
+    """
+    rotation_matrices = euler2matrix_columns(euler_angles,
+                                             source_axes,
+                                             source_intrinsic,
+                                             source_right_handed_rotation,
+                                             degrees=degrees)
+
+    # Invert matrices by swapping the component axes
+    if invert_matrix:
+        rotation_matrices = rotation_matrices.transpose((1, 0, 2))
+
+    euler_angles = matrix2euler_columns(rotation_matrices,
+                                        target_axes,
+                                        target_intrinsic,
+                                        target_right_handed_rotation,
+                                        degrees=degrees)
+    return euler_angles
@@ -18,3 +18,6 @@ valid_matrix_composition_modes = (
     'extrinsic'
 )
 
+# Euler angles are in gimbal lock where |sin| (proper Euler angles) or |cos| (Tait-Bryan angles)
+# of the second angle is below this tolerance
+gimbal_lock_tolerance = 1e-4
@@ -0,0 +1,73 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+def is_dask_array(array) -> bool:
+    """
+    Check whether an object is a dask array without importing dask.
+    """
+    array_type = type(array)
+    return array_type.__name__ == 'Array' and array_type.__module__.split('.')[0] == 'dask'
+
+
+def _apply_to_block(block: np.ndarray, function: Callable, output_row_shape: Tuple[int, ...],
+                    **kwargs) -> np.ndarray:
+    return np.asarray(function(block, **kwargs)).reshape((-1, *output_row_shape))
+
+
+def map_row_blocks(function: Callable,
+                   array,
+                   input_row_shape: Tuple[int, ...],
+                   output_row_shape: Tuple[int, ...],
+                   **kwargs):
+    """
+    Lazily apply a NumPy conversion function to blocks of rows of a dask array.
+
+    The array is chunked along its first axis only and `function` is applied independently to
+    each block of rows. No computation is triggered.
+
+    Parameters
+    ----------
+    function : callable
+        function mapping an (n, *input_row_shape) array to an (n, *output_row_shape) array,
+        keyword arguments are passed through
+    array : dask array
+        (n, *input_row_shape) or input_row_shape array
+    input_row_shape : tuple of int
+        shape of a single row of the input
+    output_row_shape : tuple of int
+        shape of a single row of the output
+
+    Returns
+    -------
+    result : dask array
+        (n, *output_row_shape) array, or output_row_shape array if a single row was given
+    """
+    single_row = array.ndim == len(input_row_shape)
+
+    # Chunk along rows only so that every block holds complete rows
+    array = array.reshape((-1, *input_row_shape))
+    array = array.rechunk({axis: -1 for axis in range(1, array.ndim)})
+
+    input_ndim = 1 + len(input_row_shape)
+    output_ndim = 1 + len(output_row_shape)
+    if output_ndim > input_ndim:
+        axes_kwargs = {'new_axis': list(range(input_ndim, output_ndim))}
+    elif output_ndim < input_ndim:
+        axes_kwargs = {'drop_axis': list(range(output_ndim, input_ndim))}
+    else:
+        axes_kwargs = {}
+
+    result = array.map_blocks(_apply_to_block,
+                              function=function,
+                              output_row_shape=output_row_shape,
+                              chunks=(array.chunks[0], *((size,) for size in output_row_shape)),
+                              dtype=float,
+                              meta=np.empty((0,) * output_ndim),
+                              **axes_kwargs,
+                              **kwargs)
+
+    if single_row:
+        result = result[0]
+    return result
@@ -1,8 +1,12 @@
 import numpy as np
 
 from .eulers_to_rotation_matrix import euler2matrix
-from .rotation_matrix_to_eulers import matrix2euler
+from .rotation_matrix_to_eulers import matrix2euler, matrix2euler_well_conditioned
 from .rotation_matrices.utils import invert_rotation_matrices
+from .constants import valid_axes
+from .fast_trig import check_precision, fast_gimbal_margin
+from .dask_arrays import is_dask_array, map_row_blocks
+from .scalar import euler2matrix_scalar, matrix2euler_scalar, transpose_scalar
 
 
 def euler2euler(euler_angles: np.ndarray,
@@ -12,14 +16,16 @@ def euler2euler(euler_angles: np.ndarray,
                 target_axes: str,
                 target_right_handed_rotation: bool,
                 target_intrinsic: bool,
-                invert_matrix: bool):
+                invert_matrix: bool,
+                degrees: bool = True,
+                precision: str = 'exact'):
     """
     Convert a set of Euler angles defined one way into a set of Euler angles defined another way.
 
     Parameters
     ----------
     euler_angles : (n, 3) or (3,) array
-        Euler angles to convert
+        Euler angles to convert, dask arrays are converted lazily
     source_axes : str
         valid sequence of three non-sequential axes from 'x', 'y' and 'z'
     source_right_handed_rotation : bool
@@ -39,28 +45,110 @@ def euler2euler(euler_angles: np.ndarray,
     invert_matrix : bool
         True - rotation matrices will be inverted prior to deriving new Euler angles
         False - rotation matrices will not be inverted prior to deriving new Euler angles
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+    precision : str
+        'exact' - full double precision
+        'fast' - rotation matrices from `euler2matrix` in single precision and angles derived
+        with `matrix2euler_well_conditioned`, the few rows close to gimbal lock in the target
+        convention are recomputed in double precision, the angular error of the result is below
+        `fast_max_angular_error` (1e-4 degrees)
 
     Returns
     -------
     euler_angles : (n, 3) or (3,) array
         Euler angles generated from input Euler angles
     """
+    check_precision(precision)
+
+    # Lazily map over blocks of rows for dask arrays
+    if is_dask_array(euler_angles):
+        return map_row_blocks(euler2euler, euler_angles, (3,), (3,),
+                              source_axes=source_axes,
+                              source_right_handed_rotation=source_right_handed_rotation,
+                              source_intrinsic=source_intrinsic,
+                              target_axes=target_axes,
+                              target_right_handed_rotation=target_right_handed_rotation,
+                              target_intrinsic=target_intrinsic,
+                              invert_matrix=invert_matrix,
+                              degrees=degrees,
+                              precision=precision)
+
+    # Single set of euler angles, avoid array overheads where possible
+    euler_angles = np.asarray(euler_angles)
+    if euler_angles.shape == (3,):
+        single_eulers = _euler2euler_scalar(euler_angles.tolist(),
+                                            source_axes,
+                                            source_right_handed_rotation,
+                                            source_intrinsic,
+                                            target_axes,
+                                            target_right_handed_rotation,
+                                            target_intrinsic,
+                                            invert_matrix,
+                                            degrees)
+        if single_eulers is not None:
+            return np.array(single_eulers, dtype=float)
+
     # Calculate rotation matrices from euler angles
     rotation_matrices = euler2matrix(euler_angles,
                                      source_axes,
                                      source_intrinsic,
-                                     source_right_handed_rotation)
+                                     source_right_handed_rotation,
+                                     degrees=degrees,
+                                     precision=precision)
 
     # Invert matrices if one set of euler angles describe the inverse rotations of the desired
     # result
     if invert_matrix:
         rotation_matrices = invert_rotation_matrices(rotation_matrices)
 
-    # Calculate euler angles in the target convention
-    euler_angles = matrix2euler(rotation_matrices,
-                                target_axes,
-                                target_intrinsic,
-                                target_right_handed_rotation)
-    return euler_angles.squeeze()
+    # Calculate euler angles in the target convention, matrices built with single precision
+    # trigonometry need well conditioned formulas close to gimbal lock
+    if precision == 'fast':
+        matrix2euler_function = matrix2euler_well_conditioned
+    else:
+        matrix2euler_function = matrix2euler
+    target_euler_angles = matrix2euler_function(rotation_matrices,
+                                                target_axes,
+                                                target_intrinsic,
+                                                target_right_handed_rotation,
+                                                degrees=degrees)
+
+    if precision == 'fast':
+        # Errors in single precision matrices grow close to gimbal lock, redo those rows exactly
+        target_rows = target_euler_angles.reshape((-1, 3))
+        theta2 = np.deg2rad(target_rows[:, 1]) if degrees else target_rows[:, 1]
+        proper_euler = target_axes.strip().lower()[0] == target_axes.strip().lower()[2]
+        distance_from_gimbal = np.abs(np.sin(theta2) if proper_euler else np.cos(theta2))
+        near_gimbal = distance_from_gimbal < fast_gimbal_margin
+        if np.any(near_gimbal):
+            source_rows = np.asarray(euler_angles).reshape((-1, 3))
+            target_rows[near_gimbal] = euler2euler(source_rows[near_gimbal],
+                                                   source_axes,
+                                                   source_right_handed_rotation,
+                                                   source_intrinsic,
+                                                   target_axes,
+                                                   target_right_handed_rotation,
+                                                   target_intrinsic,
+                                                   invert_matrix,
+                                                   degrees=degrees).reshape((-1, 3))
+    return target_euler_angles.squeeze()
 
 
+def _euler2euler_scalar(euler_angles, source_axes, source_right_handed_rotation,
+                        source_intrinsic, target_axes, target_right_handed_rotation,
+                        target_intrinsic, invert_matrix, degrees):
+    source_axes = source_axes.strip().lower()
+    target_axes = target_axes.strip().lower()
+    if source_axes not in valid_axes or target_axes not in valid_axes:
+        # Defer to the array implementation for error handling
+        return None
+
+    rotation_matrix = euler2matrix_scalar(euler_angles, source_axes, source_intrinsic,
+                                          source_right_handed_rotation, degrees=degrees)
+    if invert_matrix:
+        rotation_matrix = transpose_scalar(rotation_matrix)
+
+    return matrix2euler_scalar(rotation_matrix, target_axes, target_intrinsic,
+                               target_right_handed_rotation, degrees=degrees)
@@ -1,21 +1,29 @@
+from typing import Optional, Union
+
 import numpy as np
 
 from .rotation_matrices.angle_to_matrix import theta2rotm
 from .rotation_matrices.rotation_matrix_composition import compose_rotation_matrices
 from .constants import valid_axes
+from .fast_trig import check_precision
+from .dask_arrays import is_dask_array, map_row_blocks
+from .scalar import euler2matrix_scalar
 
 
 def euler2matrix(euler_angles: np.ndarray,
                  axes: str,
                  intrinsic: bool,
-                 right_handed_rotation: bool) -> np.ndarray:
+                 right_handed_rotation: bool,
+                 degrees: bool = True,
+                 angular_step: Optional[Union[float, str]] = None,
+                 precision: str = 'exact') -> np.ndarray:
     """
     Derive rotation matrices from a set of euler angles.
 
     Parameters
     ----------
     euler_angles : (n, 3) or (3,) array
-        euler angles (in degrees)
+        euler angles (in degrees unless `degrees` is False), dask arrays are converted lazily
     axes : str
         valid sequence of three non-sequential axes from 'x', 'y' and 'z'
         e.g. 'zyz', 'zxz', 'xyz'
@@ -25,6 +33,20 @@ def euler2matrix(euler_angles: np.ndarray,
     right_handed_rotation : bool
         True - Euler angles are interpreted as right handed rotations
         False - Euler angles are interpreted as left handed rotations
+    degrees : bool
+        True - Euler angles are given in degrees
+        False - Euler angles are given in radians
+    angular_step : float, 'auto' or None
+        float - spacing of the grid the Euler angles lie on, e.g. 0.5 for a 0.5 degree search
+        'auto' - detect the spacing of the grid from common angular steps
+        None - no lookup table is used
+        sines and cosines of Euler angles on the grid are read from a memoised lookup table,
+        angles off the grid fall back to direct evaluation
+    precision : str
+        'exact' - full double precision
+        'fast' - sines, cosines and matrix products in single precision using NumPy's vectorised
+        kernels, the angular error of the resulting matrices is below `fast_max_angular_error`
+        (1e-4 degrees)
 
     Returns
     -------
@@ -33,20 +55,41 @@ def euler2matrix(euler_angles: np.ndarray,
 
     """
     # Check and santise input
-    euler_angles = np.asarray(euler_angles).reshape((-1, 3))
     axes_sanitised = axes.strip().lower()
 
     if axes_sanitised not in valid_axes:
         raise ValueError(f'Axes {axes} are not a valid set of euler angle axes')
 
     axes = axes_sanitised
+    check_precision(precision)
+
+    # Lazily map over blocks of rows for dask arrays
+    if is_dask_array(euler_angles):
+        return map_row_blocks(euler2matrix, euler_angles, (3,), (3, 3),
+                              axes=axes,
+                              intrinsic=intrinsic,
+                              right_handed_rotation=right_handed_rotation,
+                              degrees=degrees,
+                              angular_step=angular_step,
+                              precision=precision)
+
+    euler_angles = np.asarray(euler_angles)
+
+    # Single set of euler angles, avoid array overheads
+    if euler_angles.shape == (3,):
+        rotation_matrix = euler2matrix_scalar(euler_angles.tolist(), axes, intrinsic,
+                                              right_handed_rotation, degrees=degrees)
+        return np.array(rotation_matrix, dtype=float)
+
+    euler_angles = euler_angles.reshape((-1, 3))
 
     # Calculate elemental rotation matrices from euler angles
     if not right_handed_rotation:
         # Left handed rotation case
         euler_angles = euler_angles * -1
 
-    elemental_rotations = [theta2rotm(theta=euler_angles[:, idx], axis=axes[idx])
+    elemental_rotations = [theta2rotm(theta=euler_angles[:, idx], axis=axes[idx], degrees=degrees,
+                                      angular_step=angular_step, precision=precision)
                            for idx in range(3)]
 
     # Compose final rotation matrices from elemental rotation matrices
@@ -57,4 +100,6 @@ def euler2matrix(euler_angles: np.ndarray,
 
     rotation_matrices = compose_rotation_matrices(elemental_rotations, mode=mode)
 
+    # Matrices are composed in single precision in fast mode, always return double precision
+    rotation_matrices = rotation_matrices.astype(float, copy=False)
     return rotation_matrices.squeeze()
@@ -0,0 +1,35 @@
+from typing import Tuple
+
+import numpy as np
+
+precisions = ('exact', 'fast')
+
+# Documented upper bound, in degrees, on the angular error of the 'fast' precision mode,
+# Euler angles within the gimbal lock tolerance of matrix2euler may differ by more
+fast_max_angular_error = 1e-4
+
+# Errors in single precision matrices are amplified by 1 / |sin| (proper Euler angles) or
+# 1 / |cos| (Tait-Bryan angles) of the second angle, rows closer to gimbal lock than this are
+# recomputed in double precision
+fast_gimbal_margin = 0.1
+
+
+def check_precision(precision: str):
+    if precision not in precisions:
+        raise ValueError(f'precision must be one of {precisions}')
+
+
+def sin_cos_fast(theta: np.ndarray, degrees: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Single precision sines and cosines of angles from NumPy's vectorised polynomial kernels,
+    absolute error below 1e-6.
+
+    Angles are first reduced to half a turn either side of zero in double precision so that the
+    error does not grow with the magnitude of the angles.
+    """
+    theta = np.asarray(theta, dtype=float)
+    full_turn = 360 if degrees else 2 * np.pi
+    reduced = (theta - full_turn * np.rint(theta * (1 / full_turn))).astype(np.float32)
+    if degrees:
+        reduced *= np.float32(np.pi / 180)
+    return np.sin(reduced), np.cos(reduced)
@@ -0,0 +1,122 @@
+import functools
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .fast_trig import sin_cos_fast
+
+# Steps in degrees tried in order when the angular step is detected automatically
+candidate_angular_steps = (1.0, 0.5, 0.25, 0.1)
+
+# Lookup tables span [-n_table_turns, n_table_turns) turns so that indices for angles in that
+# range are found without a modulo operation
+n_table_turns = 2
+
+# Number of lookup tables kept in memory, the least recently used table is freed beyond this so
+# that sweeping over caller supplied angular steps does not grow memory without bound
+n_memoised_tables = len(candidate_angular_steps) + 4
+
+
+@functools.lru_cache(maxsize=n_memoised_tables)
+def trig_lookup_table(n_bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosines and sines of angles spaced by 1 / n_bins of a turn over
+    [-n_table_turns, n_table_turns) turns, memoised for the `n_memoised_tables` most recently
+    used numbers of bins and returned as read-only arrays.
+    """
+    angles = np.arange(-n_table_turns * n_bins, n_table_turns * n_bins) * (2 * np.pi / n_bins)
+    cos_table, sin_table = np.cos(angles), np.sin(angles)
+    cos_table.flags.writeable = False
+    sin_table.flags.writeable = False
+    return cos_table, sin_table
+
+
+def grid_indices(theta: np.ndarray,
+                 angular_step: float,
+                 degrees: bool = True) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Integer bin indices of angles lying on a grid with a given angular step.
+
+    Parameters
+    ----------
+    theta : (n, ) array
+        angle(s)
+    angular_step : float
+        spacing of the grid, must divide a full turn
+    degrees : bool
+        True if theta and angular_step are in degrees, False if they are in radians
+
+    Returns
+    -------
+    indices, n_bins : (n, ) array of int, int or None
+        indices into `trig_lookup_table(n_bins)` and the number of bins in a full turn, None if
+        any angle is not on the grid
+    """
+    full_turn = 360.0 if degrees else 2 * np.pi
+    n_bins = int(round(full_turn / angular_step))
+    if n_bins < 1 or not np.isclose(n_bins * angular_step, full_turn):
+        raise ValueError('angular_step must divide a full turn')
+
+    scaled_theta = np.asarray(theta, dtype=float) * (n_bins / full_turn)
+    bins = np.rint(scaled_theta)
+    residuals = np.subtract(bins, scaled_theta, out=scaled_theta)
+    if residuals.size == 0 or np.abs(residuals, out=residuals).max() > 1e-6:
+        return None
+
+    indices = bins.astype(np.intp)
+    # Only fall back to a modulo operation for angles outside of the table
+    table_bins = n_table_turns * n_bins
+    if indices.min() < -table_bins or indices.max() >= table_bins:
+        indices %= n_bins
+    indices += table_bins
+    return indices, n_bins
+
+
+def cos_sin(theta: np.ndarray,
+            degrees: bool = True,
+            angular_step: Optional[Union[float, str]] = None,
+            precision: str = 'exact') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cosines and sines of angles, read from a memoised lookup table for angles on a grid.
+
+    Parameters
+    ----------
+    theta : (n, ) array
+        angle(s)
+    degrees : bool
+        True if theta is in degrees, False if theta is in radians
+    angular_step : float, 'auto' or None
+        float - spacing of the grid the angles lie on, in the same unit as theta
+        'auto' - the coarsest of `candidate_angular_steps` (in degrees) matching the angles
+        None - np.cos and np.sin are evaluated directly
+        angles which are not all on the grid also fall back to np.cos and np.sin
+    precision : str
+        'exact' - full double precision
+        'fast' - single precision results with absolute error below 1e-6, see `sin_cos_fast`,
+        values read from a lookup table are always double precision
+
+    Returns
+    -------
+    cos_theta, sin_theta : (n, ) array, (n, ) array
+        cosines and sines of the angles
+    """
+    if angular_step is not None:
+        if angular_step == 'auto':
+            angular_steps = candidate_angular_steps if degrees \
+                else np.deg2rad(candidate_angular_steps)
+        else:
+            angular_steps = (angular_step,)
+
+        for step in angular_steps:
+            grid = grid_indices(theta, step, degrees=degrees)
+            if grid is not None:
+                indices, n_bins = grid
+                cos_table, sin_table = trig_lookup_table(n_bins)
+                return cos_table.take(indices), sin_table.take(indices)
+
+    if precision == 'fast':
+        sin_theta, cos_theta = sin_cos_fast(theta, degrees=degrees)
+        return cos_theta, sin_theta
+    if degrees:
+        theta = np.deg2rad(theta)
+    return np.cos(theta), np.sin(theta)
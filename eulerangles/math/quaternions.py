@@ -0,0 +1,342 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constants import valid_axes
+
+_axis_indices = {'x': 1, 'y': 2, 'z': 3}
+
+
+def theta2quaternion(theta: np.ndarray, axis: str, degrees: bool = True) -> np.ndarray:
+    """
+    Convert values for theta into unit quaternions (w, x, y, z) describing rotations around a
+    given axis 'x', 'y' or 'z'.
+
+    Parameters
+    ----------
+    theta : (n, ) array
+        angle(s), positive is counterclockwise
+    axis : str
+        'x', 'y' or 'z'
+    degrees : bool
+        True if theta is in degrees, False if theta is in radians
+
+    Returns
+    -------
+    quaternions : (n, 4) array
+        unit quaternions
+    """
+    axis = axis.strip().lower()
+    if axis not in ('x', 'y', 'z'):
+        raise ValueError("Axis must be one of 'x', 'y' or 'z'")
+
+    theta = np.asarray(theta).reshape(-1)
+    if degrees:
+        theta = np.deg2rad(theta)
+
+    quaternions = np.zeros((theta.shape[0], 4))
+    quaternions[:, 0] = np.cos(theta / 2)
+    quaternions[:, _axis_indices[axis]] = np.sin(theta / 2)
+    return quaternions
+
+
+# Terms (sign, index in a, index in b) of each component of the Hamilton product a * b
+_hamilton_product_terms = (((1, 0, 0), (-1, 1, 1), (-1, 2, 2), (-1, 3, 3)),
+                           ((1, 0, 1), (1, 1, 0), (1, 2, 3), (-1, 3, 2)),
+                           ((1, 0, 2), (-1, 1, 3), (1, 2, 0), (1, 3, 1)),
+                           ((1, 0, 3), (1, 1, 2), (-1, 2, 1), (1, 3, 0)))
+
+
+def multiply_quaternion_components(components_a: Sequence[Optional[np.ndarray]],
+                                   components_b: Sequence[Optional[np.ndarray]]
+                                   ) -> List[Optional[np.ndarray]]:
+    """
+    Hamilton product of quaternions given as sequences of their four components (w, x, y, z),
+    components which are None are zero and skipped.
+    """
+    product = []
+    for terms in _hamilton_product_terms:
+        component = None
+        for sign, idx_a, idx_b in terms:
+            if components_a[idx_a] is None or components_b[idx_b] is None:
+                continue
+            term = components_a[idx_a] * components_b[idx_b]
+            if component is None:
+                component = term if sign > 0 else -term
+            elif sign > 0:
+                component += term
+            else:
+                component -= term
+        product.append(component)
+    return product
+
+
+def _stack_quaternion_components(components: Sequence[Optional[np.ndarray]],
+                                 shape: Tuple[int, ...]) -> np.ndarray:
+    quaternions = np.zeros(shape + (4,))
+    for idx, component in enumerate(components):
+        if component is not None:
+            quaternions[..., idx] = component
+    return quaternions
+
+
+def multiply_quaternions(quaternions_a: np.ndarray, quaternions_b: np.ndarray) -> np.ndarray:
+    """
+    Hamilton product of two sets of quaternions (w, x, y, z), broadcasting over leading
+    dimensions.
+
+    The product a * b describes the rotation b followed by the rotation a, matching the matrix
+    product R_a @ R_b.
+    """
+    quaternions_a = np.asarray(quaternions_a)
+    quaternions_b = np.asarray(quaternions_b)
+    shape = np.broadcast_shapes(quaternions_a.shape[:-1], quaternions_b.shape[:-1])
+    product = multiply_quaternion_components([quaternions_a[..., idx] for idx in range(4)],
+                                             [quaternions_b[..., idx] for idx in range(4)])
+    return _stack_quaternion_components(product, shape)
+
+
+def invert_quaternions(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Invert unit quaternions (w, x, y, z) by conjugation.
+    """
+    inverse_quaternions = np.array(quaternions, dtype=float)
+    inverse_quaternions[..., 1:] *= -1
+    return inverse_quaternions
+
+
+def euler2quaternion_components(euler_angles: np.ndarray,
+                                axes: str,
+                                intrinsic: bool,
+                                right_handed_rotation: bool,
+                                degrees: bool = True) -> List[Optional[np.ndarray]]:
+    """
+    Derive the four components (w, x, y, z) of unit quaternions from a set of euler angles,
+    each component is a contiguous (n, ) array, see `euler2quaternion`.
+    """
+    euler_angles = np.asarray(euler_angles).reshape((-1, 3))
+    axes_sanitised = axes.strip().lower()
+
+    if axes_sanitised not in valid_axes:
+        raise ValueError(f'Axes {axes} are not a valid set of euler angle axes')
+
+    axes = axes_sanitised
+
+    if not right_handed_rotation:
+        # Left handed rotation case
+        euler_angles = euler_angles * -1
+
+    # Elemental rotations have a single non-zero vector component
+    half_angles = np.deg2rad(euler_angles.T) / 2 if degrees else euler_angles.T / 2
+    elemental_rotations = []
+    for idx in range(3):
+        components = [np.cos(half_angles[idx]), None, None, None]
+        components[_axis_indices[axes[idx]]] = np.sin(half_angles[idx])
+        elemental_rotations.append(components)
+    q1, q2, q3 = elemental_rotations
+
+    if intrinsic:
+        return multiply_quaternion_components(multiply_quaternion_components(q1, q2), q3)
+    else:
+        return multiply_quaternion_components(multiply_quaternion_components(q3, q2), q1)
+
+
+def euler2quaternion(euler_angles: np.ndarray,
+                     axes: str,
+                     intrinsic: bool,
+                     right_handed_rotation: bool,
+                     degrees: bool = True) -> np.ndarray:
+    """
+    Derive unit quaternions (w, x, y, z) from a set of euler angles.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array
+        euler angles (in degrees unless `degrees` is False)
+    axes : str
+        valid sequence of three non-sequential axes from 'x', 'y' and 'z'
+        e.g. 'zyz', 'zxz', 'xyz'
+    intrinsic : bool
+        True - Euler angles are interpreted as intrinsic rotations
+        False - Euler angles are interpreted as extrinsic rotations
+    right_handed_rotation : bool
+        True - Euler angles are interpreted as right handed rotations
+        False - Euler angles are interpreted as left handed rotations
+    degrees : bool
+        True - Euler angles are given in degrees
+        False - Euler angles are given in radians
+
+    Returns
+    -------
+    quaternions : (n, 4) or (4,) array
+        unit quaternions describing the same rotations as `euler2matrix`
+    """
+    components = euler2quaternion_components(euler_angles, axes, intrinsic,
+                                             right_handed_rotation, degrees=degrees)
+    quaternions = _stack_quaternion_components(components, (components[0].shape[0],))
+    return quaternions.squeeze()
+
+
+def quaternion2matrix_columns(components: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Derive rotation matrices stored as columns from the four components (w, x, y, z) of unit
+    quaternions.
+
+    Parameters
+    ----------
+    components : sequence of four (n, ) arrays
+        components of unit quaternions
+
+    Returns
+    -------
+    rotation_matrices : (3, 3, n) array
+        rotation matrices, rotation_matrices[i, j] holds the (i, j) components
+    """
+    w, x, y, z = components
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    rotation_matrices = np.empty((3, 3, np.shape(w)[0]))
+    rotation_matrices[0, 0] = 1 - 2 * (yy + zz)
+    rotation_matrices[0, 1] = 2 * (xy - wz)
+    rotation_matrices[0, 2] = 2 * (xz + wy)
+    rotation_matrices[1, 0] = 2 * (xy + wz)
+    rotation_matrices[1, 1] = 1 - 2 * (xx + zz)
+    rotation_matrices[1, 2] = 2 * (yz - wx)
+    rotation_matrices[2, 0] = 2 * (xz - wy)
+    rotation_matrices[2, 1] = 2 * (yz + wx)
+    rotation_matrices[2, 2] = 1 - 2 * (xx + yy)
+    return rotation_matrices
+
+
+def quaternion2matrix(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Derive rotation matrices from unit quaternions (w, x, y, z).
+
+    Parameters
+    ----------
+    quaternions : (n, 4) or (4,) array
+        unit quaternions
+
+    Returns
+    -------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    """
+    quaternions = np.asarray(quaternions).reshape((-1, 4))
+    rotation_matrices = quaternion2matrix_columns([quaternions[:, idx] for idx in range(4)])
+    rotation_matrices = np.ascontiguousarray(rotation_matrices.transpose((2, 0, 1)))
+    return rotation_matrices.squeeze()
+
+
+def matrix2quaternion(rotation_matrices: np.ndarray) -> np.ndarray:
+    """
+    Derive unit quaternions (w, x, y, z) with w >= 0 from rotation matrices.
+
+    The largest of the four candidate quaternion components is computed from the matrix
+    diagonal for each matrix (Shepperd's method), which remains accurate for all rotations.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+
+    Returns
+    -------
+    quaternions : (n, 4) or (4,) array
+        unit quaternions
+    """
+    rotation_matrices = np.asarray(rotation_matrices).reshape((-1, 3, 3))
+    r = [[rotation_matrices[:, i, j] for j in range(3)] for i in range(3)]
+    trace = r[0][0] + r[1][1] + r[2][2]
+
+    # Candidates for 4 * w^2, 4 * x^2, 4 * y^2 and 4 * z^2
+    candidates = np.stack([1 + trace,
+                           1 + 2 * r[0][0] - trace,
+                           1 + 2 * r[1][1] - trace,
+                           1 + 2 * r[2][2] - trace], axis=-1)
+    largest = np.argmax(candidates, axis=-1)
+
+    # Each row holds 4 * q * q_largest
+    products = np.empty((rotation_matrices.shape[0], 4, 4))
+    products[:, 0] = np.stack([candidates[:, 0],
+                               r[2][1] - r[1][2],
+                               r[0][2] - r[2][0],
+                               r[1][0] - r[0][1]], axis=-1)
+    products[:, 1] = np.stack([r[2][1] - r[1][2],
+                               candidates[:, 1],
+                               r[0][1] + r[1][0],
+                               r[0][2] + r[2][0]], axis=-1)
+    products[:, 2] = np.stack([r[0][2] - r[2][0],
+                               r[0][1] + r[1][0],
+                               candidates[:, 2],
+                               r[1][2] + r[2][1]], axis=-1)
+    products[:, 3] = np.stack([r[1][0] - r[0][1],
+                               r[0][2] + r[2][0],
+                               r[1][2] + r[2][1],
+                               candidates[:, 3]], axis=-1)
+
+    idx = np.arange(rotation_matrices.shape[0])
+    quaternions = products[idx, largest]
+    quaternions /= np.linalg.norm(quaternions, axis=-1, keepdims=True)
+    quaternions *= np.where(quaternions[:, :1] < 0, -1, 1)
+    return quaternions.squeeze()
+
+
+def quaternion_log(quaternions: np.ndarray) -> np.ndarray:
+    """
+    Logarithm of unit quaternions (w, x, y, z), returned as (..., 3) vectors equal to half the
+    rotation vector.
+    """
+    quaternions = np.asarray(quaternions)
+    w = quaternions[..., 0]
+    vectors = quaternions[..., 1:]
+    vector_norms = np.linalg.norm(vectors, axis=-1)
+    half_angles = np.arctan2(vector_norms, w)
+
+    # half_angle / sin(half_angle) tends to 1 / w for small rotations
+    small = vector_norms < 1e-8
+    scale = np.where(small, 1 / np.where(small, w, 1),
+                     half_angles / np.where(small, 1, vector_norms))
+    return vectors * scale[..., np.newaxis]
+
+
+def quaternion_exp(vectors: np.ndarray) -> np.ndarray:
+    """
+    Exponential of pure quaternions given as (..., 3) vectors, returned as unit quaternions
+    (w, x, y, z).
+    """
+    vectors = np.asarray(vectors)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    # np.sinc(x) is sin(pi * x) / (pi * x), well behaved at 0
+    return np.concatenate([np.cos(norms), vectors * np.sinc(norms / np.pi)], axis=-1)
+
+
+def slerp_quaternions(quaternions_a: np.ndarray,
+                      quaternions_b: np.ndarray,
+                      t: np.ndarray) -> np.ndarray:
+    """
+    Spherical linear interpolation along the shortest arc between unit quaternions,
+    broadcasting over leading dimensions.
+
+    Parameters
+    ----------
+    quaternions_a : (..., 4) array
+        unit quaternions at t = 0
+    quaternions_b : (..., 4) array
+        unit quaternions at t = 1
+    t : (...) array
+        interpolation parameter
+
+    Returns
+    -------
+    quaternions : (..., 4) array
+        interpolated unit quaternions
+    """
+    quaternions_a = np.asarray(quaternions_a)
+    relative = multiply_quaternions(invert_quaternions(quaternions_a), quaternions_b)
+    # Take the shorter of the two arcs
+    relative *= np.where(relative[..., :1] < 0, -1, 1)
+    steps = quaternion_log(relative) * np.asarray(t)[..., np.newaxis]
+    return multiply_quaternions(quaternions_a, quaternion_exp(steps))
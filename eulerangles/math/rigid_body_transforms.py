@@ -0,0 +1,165 @@
+from typing import Tuple
+
+import numpy as np
+
+from .rotation_matrices.utils import invert_rotation_matrices
+
+
+def rotate_vectors(rotation_matrices: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    Premultiply column vectors by rotation matrices.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    vectors : (n, 3) or (3,) array
+        vectors to be rotated
+
+    Returns
+    -------
+    rotated_vectors : (n, 3) array
+        rotated vectors
+    """
+    rotation_matrices = np.asarray(rotation_matrices).reshape((-1, 3, 3))
+    vectors = np.asarray(vectors).reshape((-1, 3))
+    return (rotation_matrices @ vectors[..., np.newaxis])[..., 0]
+
+
+def compose_rigid_body_transforms(rotation_matrices_a: np.ndarray,
+                                  shifts_a: np.ndarray,
+                                  rotation_matrices_b: np.ndarray,
+                                  shifts_b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compose two sets of rigid body transformations x' = Rx + t such that transformation b is
+    applied first, then transformation a.
+
+    Parameters
+    ----------
+    rotation_matrices_a : (n, 3, 3) or (3, 3) array
+        rotation matrices of transformation a
+    shifts_a : (n, 3) or (3,) array
+        translations of transformation a
+    rotation_matrices_b : (n, 3, 3) or (3, 3) array
+        rotation matrices of transformation b
+    shifts_b : (n, 3) or (3,) array
+        translations of transformation b
+
+    Returns
+    -------
+    rotation_matrices, shifts : (n, 3, 3) array, (n, 3) array
+        rotation matrices R_a @ R_b and translations R_a @ t_b + t_a
+    """
+    rotation_matrices_a = np.asarray(rotation_matrices_a).reshape((-1, 3, 3))
+    rotation_matrices = rotation_matrices_a @ np.asarray(rotation_matrices_b).reshape((-1, 3, 3))
+    shifts = rotate_vectors(rotation_matrices_a, shifts_b) + np.asarray(shifts_a).reshape((-1, 3))
+    return rotation_matrices, shifts
+
+
+def invert_rigid_body_transforms(rotation_matrices: np.ndarray,
+                                 shifts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Invert a set of rigid body transformations x' = Rx + t.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    shifts : (n, 3) or (3,) array
+        translations
+
+    Returns
+    -------
+    rotation_matrices, shifts : (n, 3, 3) array, (n, 3) array
+        rotation matrices R^T and translations -R^T @ t
+    """
+    inverse_rotation_matrices = invert_rotation_matrices(
+        np.asarray(rotation_matrices).reshape((-1, 3, 3))
+    )
+    inverse_shifts = -rotate_vectors(inverse_rotation_matrices, shifts)
+    return inverse_rotation_matrices, inverse_shifts
+
+
+def rigid_body2transform(rotation_matrices: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    """
+    Pack rotation matrices and translations into 4x4 homogeneous transformation matrices.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        rotation matrices
+    shifts : (n, 3) or (3,) array
+        translations
+
+    Returns
+    -------
+    transforms : (n, 4, 4) array
+        homogeneous transformation matrices
+    """
+    rotation_matrices = np.asarray(rotation_matrices).reshape((-1, 3, 3))
+    shifts = np.asarray(shifts).reshape((-1, 3))
+    n = max(rotation_matrices.shape[0], shifts.shape[0])
+
+    transforms = np.zeros((n, 4, 4))
+    transforms[:, :3, :3] = rotation_matrices
+    transforms[:, :3, 3] = shifts
+    transforms[:, 3, 3] = 1
+    return transforms
+
+
+def transform2rigid_body(transforms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unpack 4x4 homogeneous transformation matrices into rotation matrices and translations.
+
+    Parameters
+    ----------
+    transforms : (n, 4, 4) or (4, 4) array
+        homogeneous transformation matrices
+
+    Returns
+    -------
+    rotation_matrices, shifts : (n, 3, 3) array, (n, 3) array
+        rotation matrices and translations
+    """
+    transforms = np.asarray(transforms).reshape((-1, 4, 4))
+    return transforms[:, :3, :3], transforms[:, :3, 3]
+
+
+def compose_transforms(transforms_a: np.ndarray, transforms_b: np.ndarray) -> np.ndarray:
+    """
+    Compose two sets of 4x4 homogeneous transformation matrices such that transformation b is
+    applied first, then transformation a.
+
+    Parameters
+    ----------
+    transforms_a : (n, 4, 4) or (4, 4) array
+        homogeneous transformation matrices a
+    transforms_b : (n, 4, 4) or (4, 4) array
+        homogeneous transformation matrices b
+
+    Returns
+    -------
+    transforms : (n, 4, 4) array
+        homogeneous transformation matrices T_a @ T_b
+    """
+    rotation_matrices, shifts = compose_rigid_body_transforms(*transform2rigid_body(transforms_a),
+                                                              *transform2rigid_body(transforms_b))
+    return rigid_body2transform(rotation_matrices, shifts)
+
+
+def invert_transforms(transforms: np.ndarray) -> np.ndarray:
+    """
+    Invert 4x4 homogeneous transformation matrices describing rigid body transformations.
+
+    Parameters
+    ----------
+    transforms : (n, 4, 4) or (4, 4) array
+        homogeneous transformation matrices
+
+    Returns
+    -------
+    transforms : (n, 4, 4) array
+        inverse homogeneous transformation matrices
+    """
+    rotation_matrices, shifts = invert_rigid_body_transforms(*transform2rigid_body(transforms))
+    return rigid_body2transform(rotation_matrices, shifts)
@@ -1,18 +1,29 @@
+from typing import Optional, Union
+
 import numpy as np
 
+from ..lookup_tables import cos_sin
+
 
-def theta2rotx(theta: np.ndarray) -> np.ndarray:
+def theta2rotx(theta: np.ndarray,
+               degrees: bool = True,
+               angular_step: Optional[Union[float, str]] = None,
+               precision: str = 'exact') -> np.ndarray:
     """
     Rx = [[1, 0, 0],
           [0, c(t), -s(t)],
           [0, s(t), c(t)]]
-    :param theta: angle(s) in degrees, positive is counterclockwise
+    :param theta: angle(s) in degrees or radians, see `degrees`, positive is counterclockwise
+    :param degrees: True if theta is in degrees, False if theta is in radians
+    :param angular_step: spacing of the grid theta lies on, 'auto' to detect it or None,
+                         sines and cosines of angles on the grid are read from a lookup table
+    :param precision: 'exact' or 'fast' for single precision matrices, see `cos_sin`
     :return: rotation_matrices
     """
-    theta = np.deg2rad(np.asarray(theta).reshape(-1))
-    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=float)
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    theta = np.asarray(theta).reshape(-1)
+    cos_theta, sin_theta = cos_sin(theta, degrees=degrees, angular_step=angular_step,
+                                   precision=precision)
+    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=cos_theta.dtype)
     rotation_matrices[:, 0, 0] = 1
     rotation_matrices[:, (1, 2), (1, 2)] = cos_theta[:, np.newaxis]
     rotation_matrices[:, 1, 2] = -sin_theta
@@ -20,18 +31,25 @@ def theta2rotx(theta: np.ndarray) -> np.ndarray:
     return rotation_matrices
 
 
-def theta2roty(theta: np.ndarray) -> np.ndarray:
+def theta2roty(theta: np.ndarray,
+               degrees: bool = True,
+               angular_step: Optional[Union[float, str]] = None,
+               precision: str = 'exact') -> np.ndarray:
     """
     Ry = [[c(t), 0, s(t)],
           [0, 1, 0],
           [-s(t), 0, c(t)]]
-    :param theta: angle(s) in degrees, positive is counterclockwise
+    :param theta: angle(s) in degrees or radians, see `degrees`, positive is counterclockwise
+    :param degrees: True if theta is in degrees, False if theta is in radians
+    :param angular_step: spacing of the grid theta lies on, 'auto' to detect it or None,
+                         sines and cosines of angles on the grid are read from a lookup table
+    :param precision: 'exact' or 'fast' for single precision matrices, see `cos_sin`
     :return: rotation_matrices
     """
-    theta = np.deg2rad(np.asarray(theta).reshape(-1))
-    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=float)
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    theta = np.asarray(theta).reshape(-1)
+    cos_theta, sin_theta = cos_sin(theta, degrees=degrees, angular_step=angular_step,
+                                   precision=precision)
+    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=cos_theta.dtype)
     rotation_matrices[:, 1, 1] = 1
     rotation_matrices[:, (0, 2), (0, 2)] = cos_theta[:, np.newaxis]
     rotation_matrices[:, 0, 2] = sin_theta
@@ -39,18 +57,25 @@ def theta2roty(theta: np.ndarray) -> np.ndarray:
     return rotation_matrices
 
 
-def theta2rotz(theta: np.ndarray) -> np.ndarray:
+def theta2rotz(theta: np.ndarray,
+               degrees: bool = True,
+               angular_step: Optional[Union[float, str]] = None,
+               precision: str = 'exact') -> np.ndarray:
     """
     Rz = [[c(t), -s(t), 0],
           [s(t), c(t), 0],
           [0, 0, 1]]
-    :param theta: angle(s) in degrees, positive is counterclockwise
+    :param theta: angle(s) in degrees or radians, see `degrees`, positive is counterclockwise
+    :param degrees: True if theta is in degrees, False if theta is in radians
+    :param angular_step: spacing of the grid theta lies on, 'auto' to detect it or None,
+                         sines and cosines of angles on the grid are read from a lookup table
+    :param precision: 'exact' or 'fast' for single precision matrices, see `cos_sin`
     :return: rotation_matrices
     """
-    theta = np.deg2rad(np.asarray(theta).reshape(-1))
-    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=float)
-    cos_theta = np.cos(theta)
-    sin_theta = np.sin(theta)
+    theta = np.asarray(theta).reshape(-1)
+    cos_theta, sin_theta = cos_sin(theta, degrees=degrees, angular_step=angular_step,
+                                   precision=precision)
+    rotation_matrices = np.zeros((theta.shape[0], 3, 3), dtype=cos_theta.dtype)
     rotation_matrices[:, 2, 2] = 1
     rotation_matrices[:, (0, 1), (0, 1)] = cos_theta[:, np.newaxis]
     rotation_matrices[:, 0, 1] = -sin_theta
@@ -58,22 +83,33 @@ def theta2rotz(theta: np.ndarray) -> np.ndarray:
     return rotation_matrices
 
 
-def theta2rotm(theta: np.ndarray, axis: str):
+def theta2rotm(theta: np.ndarray,
+               axis: str,
+               degrees: bool = True,
+               angular_step: Optional[Union[float, str]] = None,
+               precision: str = 'exact'):
     """
     Convert values for theta into rotation matrices around a given axis 'x', 'y' or 'z'
-    :param theta: angle(s) in degrees, positive is counterclockwise
+    :param theta: angle(s) in degrees or radians, see `degrees`, positive is counterclockwise
     :param axis: 'x', 'y' or 'z'
+    :param degrees: True if theta is in degrees, False if theta is in radians
+    :param angular_step: spacing of the grid theta lies on, 'auto' to detect it or None,
+                         sines and cosines of angles on the grid are read from a lookup table
+    :param precision: 'exact' or 'fast' for single precision matrices, see `cos_sin`
     :return: rotation_matrices
     """
     axis = axis.strip().lower()
     if axis not in ('x', 'y', 'z'):
         raise ValueError(f"Axis must be one of 'x', 'y' or 'z''")
     elif axis == 'x':
-        rotation_matrices = theta2rotx(theta)
+        rotation_matrices = theta2rotx(theta, degrees=degrees, angular_step=angular_step,
+                                       precision=precision)
     elif axis == 'y':
-        rotation_matrices = theta2roty(theta)
+        rotation_matrices = theta2roty(theta, degrees=degrees, angular_step=angular_step,
+                                       precision=precision)
     elif axis == 'z':
-        rotation_matrices = theta2rotz(theta)
+        rotation_matrices = theta2rotz(theta, degrees=degrees, angular_step=angular_step,
+                                       precision=precision)
     if rotation_matrices.shape[0] == 1:
         rotation_matrices = rotation_matrices.reshape((3, 3))
     return rotation_matrices
@@ -0,0 +1,168 @@
+from typing import Tuple
+
+import numpy as np
+
+# Default tolerance on determinant and orthonormality residuals of rotation matrices
+rotation_matrix_tolerance = 1e-6
+
+orthonormalisation_methods = ('svd', 'newton')
+
+
+def _determinants(matrices: np.ndarray) -> np.ndarray:
+    """
+    Determinants of (n, 3, 3) matrices by cofactor expansion.
+    """
+    r = [[matrices[:, i, j] for j in range(3)] for i in range(3)]
+    return (r[0][0] * (r[1][1] * r[2][2] - r[1][2] * r[2][1])
+            - r[0][1] * (r[1][0] * r[2][2] - r[1][2] * r[2][0])
+            + r[0][2] * (r[1][0] * r[2][1] - r[1][1] * r[2][0]))
+
+
+def _gram_residuals(matrices: np.ndarray) -> np.ndarray:
+    """
+    X^T X - I for (n, 3, 3) matrices.
+    """
+    # matmul is considerably faster on a contiguous copy than on a transposed view
+    gram_matrices = np.ascontiguousarray(matrices.swapaxes(-1, -2)) @ matrices
+    gram_matrices -= np.eye(3)
+    return gram_matrices
+
+
+def rotation_matrix_residuals(rotation_matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Residuals measuring how far matrices are from proper rotation matrices.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        matrices to be checked
+
+    Returns
+    -------
+    determinant_residuals, orthonormality_residuals : (n, ) array, (n, ) array
+        |det(R) - 1| and the Frobenius norm of R^T R - I for each matrix
+    """
+    rotation_matrices = np.asarray(rotation_matrices, dtype=float).reshape((-1, 3, 3))
+    determinant_residuals = np.abs(_determinants(rotation_matrices) - 1)
+    gram_residuals = _gram_residuals(rotation_matrices).reshape((-1, 9))
+    orthonormality_residuals = np.sqrt(np.einsum('ni,ni->n', gram_residuals, gram_residuals))
+    return determinant_residuals, orthonormality_residuals
+
+
+def is_rotation_matrix(rotation_matrices: np.ndarray,
+                       tolerance: float = rotation_matrix_tolerance) -> np.ndarray:
+    """
+    Check whether matrices are proper rotation matrices within a tolerance.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        matrices to be checked
+    tolerance : float
+        maximum determinant and orthonormality residuals, see `rotation_matrix_residuals`
+
+    Returns
+    -------
+    valid : (n, ) array of bool
+        True for proper rotation matrices, False otherwise (including non-finite matrices)
+    """
+    determinant_residuals, orthonormality_residuals = rotation_matrix_residuals(rotation_matrices)
+    return (determinant_residuals <= tolerance) & (orthonormality_residuals <= tolerance)
+
+
+def _orthonormalise_svd(rotation_matrices: np.ndarray) -> np.ndarray:
+    """
+    Closest proper rotation matrices from singular value decompositions, non-finite matrices
+    are left as is.
+    """
+    finite = np.isfinite(rotation_matrices).all(axis=(-1, -2))
+    if not np.all(finite):
+        orthonormalised = rotation_matrices.copy()
+        orthonormalised[finite] = _orthonormalise_svd(rotation_matrices[finite])
+        return orthonormalised
+
+    u, _, vt = np.linalg.svd(rotation_matrices)
+    # Flip the least significant direction where the closest orthogonal matrix is a reflection
+    signs = np.sign(_determinants(u @ vt))
+    u[..., :, 2] *= signs[..., np.newaxis]
+    return u @ vt
+
+
+def _orthonormalise_newton(rotation_matrices: np.ndarray,
+                           max_iterations: int = 10,
+                           tolerance: float = 1e-13) -> np.ndarray:
+    """
+    Closest orthogonal matrices from Newton-Schulz iterations, X <- X (3I - X^T X) / 2, for
+    matrices close to rotation matrices, other matrices are orthonormalised by SVD.
+    """
+    gram_residuals = _gram_residuals(rotation_matrices)
+    # Convergence is guaranteed if the norm of X^T X - I is below 1, NaN compares as False
+    near = np.einsum('nij,nij->n', gram_residuals, gram_residuals) < 0.25
+    all_near = np.all(near)
+
+    orthonormalised = rotation_matrices if all_near else rotation_matrices[near]
+    if not all_near:
+        gram_residuals = gram_residuals[near]
+    for _ in range(max_iterations):
+        if not np.abs(gram_residuals).max(initial=0) > tolerance:
+            break
+        # X (3I - X^T X) / 2 = X - X (X^T X - I) / 2
+        orthonormalised = orthonormalised - 0.5 * (orthonormalised @ gram_residuals)
+        gram_residuals = _gram_residuals(orthonormalised)
+
+    if all_near:
+        result = orthonormalised
+    else:
+        result = rotation_matrices.copy()
+        result[near] = orthonormalised
+
+    # Matrices closest to reflections and matrices far from rotations are handled by SVD
+    failed = ~near
+    failed[near] = _determinants(orthonormalised) < 0
+    if np.any(failed):
+        # Without iterations the result is still the input, never write into it
+        if result is rotation_matrices:
+            result = result.copy()
+        result[failed] = _orthonormalise_svd(rotation_matrices[failed])
+    return result
+
+
+def orthonormalise_rotation_matrices(rotation_matrices: np.ndarray,
+                                     method: str = 'newton',
+                                     chunk_size: int = 1_000_000) -> np.ndarray:
+    """
+    Project matrices onto the closest proper rotation matrices (polar decomposition).
+
+    Entries are clipped to [-1, 1] after orthonormalisation so that later calls to arccos and
+    arcsin cannot return NaN.
+
+    Parameters
+    ----------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        approximately orthonormal matrices, e.g. after long chains of compositions
+    method : str
+        'newton' - Newton-Schulz iterations, fast for matrices close to rotation matrices
+        'svd' - batched singular value decomposition, robust for any matrix
+    chunk_size : int
+        number of matrices processed at once
+
+    Returns
+    -------
+    rotation_matrices : (n, 3, 3) or (3, 3) array
+        proper rotation matrices
+    """
+    if method not in orthonormalisation_methods:
+        raise ValueError(f'method must be one of {orthonormalisation_methods}')
+    orthonormalise = _orthonormalise_newton if method == 'newton' else _orthonormalise_svd
+
+    rotation_matrices = np.asarray(rotation_matrices, dtype=float)
+    shape = rotation_matrices.shape
+    rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
+
+    orthonormalised = np.empty_like(rotation_matrices)
+    for start in range(0, rotation_matrices.shape[0], chunk_size):
+        stop = start + chunk_size
+        orthonormalised[start:stop] = orthonormalise(rotation_matrices[start:stop])
+
+    np.clip(orthonormalised, -1, 1, out=orthonormalised)
+    return orthonormalised.reshape(shape)
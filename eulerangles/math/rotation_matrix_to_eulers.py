@@ -1,25 +1,73 @@
+from typing import Optional, Tuple
+
 import numpy as np
 
-from .constants import valid_axes
+from .constants import valid_axes, gimbal_lock_tolerance
+from .dask_arrays import is_dask_array, map_row_blocks
+from .rotation_matrices.orthonormalisation import is_rotation_matrix, \
+    orthonormalise_rotation_matrices
+from .scalar import matrix2euler_scalar
+
+# Number of matrices orthonormalised or validated at once before deriving euler angles
+pre_stage_chunk_size = 100_000
+
 
+def _arccos_entry(rotation_matrices: np.ndarray,
+                  row: int,
+                  col: int,
+                  well_conditioned: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    arccos of the entry (row, col) of each matrix and indices where its sine is below
+    `gimbal_lock_tolerance`.
 
-def matrix2xyx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+    If `well_conditioned`, arctan2 of the entry against the norm of the other two entries in
+    its row is used instead, which stays accurate near 0 and pi for matrices carrying rounding
+    errors.
+    """
+    entries = rotation_matrices[:, row, col]
+    if not well_conditioned:
+        # |sin| < tolerance without evaluating the sine
+        gimbal_idx = np.abs(entries) > np.sqrt(1 - gimbal_lock_tolerance ** 2)
+        return np.arccos(entries), gimbal_idx
+    others = [idx for idx in range(3) if idx != col]
+    norms = np.hypot(rotation_matrices[:, row, others[0]], rotation_matrices[:, row, others[1]])
+    return np.arctan2(norms, entries), norms < gimbal_lock_tolerance
+
+
+def _arcsin_entry(rotation_matrices: np.ndarray,
+                  row: int,
+                  col: int,
+                  well_conditioned: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    arcsin of the entry (row, col) of each matrix and indices where its cosine is below
+    `gimbal_lock_tolerance`, see `_arccos_entry`.
+    """
+    entries = rotation_matrices[:, row, col]
+    if not well_conditioned:
+        # |cos| < tolerance without evaluating the cosine
+        gimbal_idx = np.abs(entries) > np.sqrt(1 - gimbal_lock_tolerance ** 2)
+        return np.arcsin(entries), gimbal_idx
+    others = [idx for idx in range(3) if idx != col]
+    norms = np.hypot(rotation_matrices[:, row, others[0]], rotation_matrices[:, row, others[1]])
+    return np.arctan2(entries, norms), norms < gimbal_lock_tolerance
+
+
+def matrix2xyx_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rx(k3) @ Ry(k2) @ Rx(k1) = [[c2, s1s2, c1s2],
                                 [s2s3, -s1c2s3+c1c3, -c1c2s3-s1c3],
                                 [-s2c3, s1c2c3+c1s3, c1c2c3-s1s3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arccos(rotation_matrices[:, 0, 0])
-
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 2]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 0, 0, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r23 = rotation_matrices[gimbal_idx, 1, 2]
@@ -36,29 +84,28 @@ def matrix2xyx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r12, r13)
     angles_radians[idx, 2] = np.arctan2(r21, -r31)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2yzy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2yzy_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Ry(k3) @ Rz(k2) @ Ry(k1) = [[c1c2c3-s1s3, -s2c3, s1c2c3+c1c3],
                                 [c1s2, c2, s1s2],
                                 [-c1c2s3, s2s3, -s1c2s3+c1c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arccos(rotation_matrices[:, 1, 1])
-
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 1, 0]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 1, 1, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r31 = rotation_matrices[gimbal_idx, 2, 0]
@@ -75,28 +122,27 @@ def matrix2yzy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r23, r21)
     angles_radians[idx, 2] = np.arctan2(r32, -r12)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
     return euler_angles
 
 
-def matrix2zxz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2zxz_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rz(k3) @ Rx(k2) @ Rz(k1) = [[-s1c2s3+c1c3, -c1c2s3-s1c3, s2s3],
                                 [s1c2c3+s1s3, c1c2c3-s1s3, -s2c3],
                                 [s1s2, c1s2, c2]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles[:, 1] = np.arccos(rotation_matrices[:, 2, 2])
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 2]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 2, 2, well_conditioned)
+    angles[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r12 = rotation_matrices[gimbal_idx, 0, 1]
@@ -113,29 +159,28 @@ def matrix2zxz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles[idx, 0] = np.arctan2(r31, r32)
     angles[idx, 2] = np.arctan2(r13, -r23)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles) if degrees else angles
 
     return euler_angles
 
 
-def matrix2xzx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2xzx_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rx(k3) @ Rz(k2) @ Rx(k1) = [[c2, -c1s2, s1s2],
                                 [s2c3, c1c2c3-s3, -s1c2c3-c1s3],
                                 [s2s3, c1c2s3+s1c3, -s1c2s3+c1c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arccos(rotation_matrices[:, 0, 0])
-
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 2]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 0, 0, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r32 = rotation_matrices[gimbal_idx, 2, 1]
@@ -152,28 +197,27 @@ def matrix2xzx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r13, -r12)
     angles_radians[idx, 2] = np.arctan2(r31, r21)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
     return euler_angles
 
 
-def matrix2yxy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2yxy_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Ry(k3) @ Rx(k2) @ Ry(k1) = [[-s1c2s3+c1c3, s2s3, c1c2s3+s1c3],
                                 [s1s2, c2, -c1s2],
                                 [-s1c2c3-c1s3, s2c3, c1c2c3-s1s3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arccos(rotation_matrices[:, 1, 1])
-
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 1]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 1, 1, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r13 = rotation_matrices[gimbal_idx, 0, 2]
@@ -190,29 +234,28 @@ def matrix2yxy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r21, -r23)
     angles_radians[idx, 2] = np.arctan2(r12, r32)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2zyz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2zyz_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rz(k3) @ Ry(k2) @ Rz(k1) = [[c1c2c3-s1s3, -s1c2c3-c1s3, s2c3],
                                 [c1c2s3+s1c3, -s1c2s3+c1c3, s2s3],
                                 [-c1s2, s1s2, c2]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arccos(rotation_matrices[:, 2, 2])
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Gimbal lock case (s2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 2]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (s2 = 0)
+    angle2, gimbal_idx = _arccos_entry(rotation_matrices, 2, 2, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r21 = rotation_matrices[gimbal_idx, 1, 0]
@@ -229,29 +272,28 @@ def matrix2zyz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r32, -r31)
     angles_radians[idx, 2] = np.arctan2(r23, r13)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2xyz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2xyz_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rz(k3) @ Ry(k2) @ Rx(k1) = [[c2c3, s1s2c3-c1s3, c1s2c3+s1s3],
                                 [c2s3, s1s2s3+c1c3, c1s2s3-s1c3],
                                 [-s2, s1c2, c1c2]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = -np.arcsin(rotation_matrices[:, 2, 0])
-
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 0]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 2, 0, well_conditioned)
+    angles_radians[:, 1] = -angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r23 = rotation_matrices[gimbal_idx, 1, 2]
@@ -268,29 +310,28 @@ def matrix2xyz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r32, r33)
     angles_radians[idx, 2] = np.arctan2(r21, r11)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2yzx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2yzx_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rx(k3) @ Rz(k2) @ Ry(k1) = [[c1c2, -s2, s1c2],
                                 [c1s2c3+s1s3, c2c3, s1s2c3-c1s3],
                                 [c1s2s3-s1c3, c2s3, s1s2s3+c1c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = -np.arcsin(rotation_matrices[:, 0, 1])
-
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 0]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 0, 1, well_conditioned)
+    angles_radians[:, 1] = -angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r31 = rotation_matrices[gimbal_idx, 2, 0]
@@ -307,29 +348,28 @@ def matrix2yzx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r13, r11)
     angles_radians[idx, 2] = np.arctan2(r32, r22)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2zxy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2zxy_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Ry(k3) @ Rx(k2) @ Rz(k1) = [[s1s2s3+c1c3, c1s2s3-s1c3, c2s3],
                                 [s1c2, c1c2, -s2],
                                 [s1s2c3-c1s3, c1s2c3+s1s3, c2c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = -np.arcsin(rotation_matrices[:, 1, 2])
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 1, 0]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 1, 2, well_conditioned)
+    angles_radians[:, 1] = -angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r12 = rotation_matrices[gimbal_idx, 0, 1]
@@ -346,29 +386,28 @@ def matrix2zxy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(r21, r22)
     angles_radians[idx, 2] = np.arctan2(r13, r33)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2xzy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2xzy_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Ry(k3) @ Rz(k2) @ Rx(k1) = [[c2c3, -c1s2c3+s1s3, s1s2c3+c1s3],
                                 [s2, c1c2, -s1c2],
                                 [-c2s3, c1s2s3+s1c3, -s1s2s3+c1c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arcsin(rotation_matrices[:, 1, 0])
-
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 0, 0]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 1, 0, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r32 = rotation_matrices[gimbal_idx, 2, 1]
@@ -385,29 +424,28 @@ def matrix2xzy_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(-r23, r22)
     angles_radians[idx, 2] = np.arctan2(-r31, r11)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2yxz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2yxz_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rz(k3) @ Rx(k2) @ Ry(k1) = [[-s1s2s3+c1c3, -c2s3, c1s2s3+s1c3],
                                 [s1s2c3+c1s3, c2c3, -c1s2c3+s1s3],
                                 [-s1c2, s2, c1c2]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arcsin(rotation_matrices[:, 2, 1])
-
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 1, 1]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 2, 1, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r13 = rotation_matrices[gimbal_idx, 0, 2]
@@ -424,29 +462,28 @@ def matrix2yxz_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(-r31, r33)
     angles_radians[idx, 2] = np.arctan2(-r12, r22)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2zyx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
+def matrix2zyx_extrinsic(rotation_matrices: np.ndarray,
+                         degrees: bool = True,
+                         well_conditioned: bool = False) -> np.ndarray:
     """
     Rx(k3) @ Ry(k2) @ Rz(k1) = [[c1c2, -s1c2, s2],
                                 [c1s2s3+s1c3, -s1s2s3+c1c3, -c2s3],
                                 [-c1s2c3+s1s3, s1s2c3+c1s3, c2c3]]
     """
     rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
-    angles_radians = np.zeros((rotation_matrices.shape[0], 3))
-
-    # Angle 2 can be taken directly from matrices
-    angles_radians[:, 1] = np.arcsin(rotation_matrices[:, 0, 2])
+    # Store each angle contiguously, (n, 3) view of a (3, n) array
+    angles_radians = np.zeros((3, rotation_matrices.shape[0])).T
 
-    # Gimbal lock case (c2 = 0)
-    tolerance = 1e-4
-
-    # Find indices where this is the case
-    gimbal_idx = np.abs(rotation_matrices[:, 1, 1]) < tolerance
+    # Angle 2 can be taken directly from matrices, along with indices of the gimbal lock
+    # case (c2 = 0)
+    angle2, gimbal_idx = _arcsin_entry(rotation_matrices, 0, 2, well_conditioned)
+    angles_radians[:, 1] = angle2
 
     # Calculate angle 1 and set angle 3 = 0 for those indices
     r21 = rotation_matrices[gimbal_idx, 1, 0]
@@ -463,40 +500,57 @@ def matrix2zyx_extrinsic(rotation_matrices: np.ndarray) -> np.ndarray:
     angles_radians[idx, 0] = np.arctan2(-r12, r11)
     angles_radians[idx, 2] = np.arctan2(-r23, r33)
 
-    # convert to degrees
-    euler_angles = np.rad2deg(angles_radians)
+    # convert to degrees if required
+    euler_angles = np.rad2deg(angles_radians) if degrees else angles_radians
 
     return euler_angles
 
 
-def matrix2euler_extrinsic(rotation_matrices: np.ndarray, axes: str):
+def matrix2euler_extrinsic(rotation_matrices: np.ndarray,
+                           axes: str,
+                           degrees: bool = True,
+                           well_conditioned: bool = False):
     matrix2euler_function = extrinsic_matrix2euler_functions[axes]
-    return matrix2euler_function(rotation_matrices)
+    return matrix2euler_function(rotation_matrices, degrees=degrees,
+                                 well_conditioned=well_conditioned)
 
 
-def matrix2euler_intrinsic(rotation_matrices: np.ndarray, axes: str):
+def matrix2euler_intrinsic(rotation_matrices: np.ndarray,
+                           axes: str,
+                           degrees: bool = True,
+                           well_conditioned: bool = False):
     """
     It can be shown that a set of intrinsic rotations about axes x then y then z through angles
     α, β, γ is equivalent to a set of extrinsic rotations about axes z then y then x
     by angles γ, β, α.
     """
     extrinsic_axes = axes[::-1]
-    extrinsic_eulers = matrix2euler_extrinsic(rotation_matrices, extrinsic_axes)
+    extrinsic_eulers = matrix2euler_extrinsic(rotation_matrices, extrinsic_axes, degrees=degrees,
+                                              well_conditioned=well_conditioned)
     intrinsic_eulers = extrinsic_eulers[:, ::-1]
     return intrinsic_eulers
 
 
-def matrix2euler_right_handed(rotation_matrices: np.ndarray, axes: str, intrinsic: bool):
+def matrix2euler_right_handed(rotation_matrices: np.ndarray,
+                              axes: str,
+                              intrinsic: bool,
+                              degrees: bool = True,
+                              well_conditioned: bool = False):
     if intrinsic:
-        return matrix2euler_intrinsic(rotation_matrices, axes)
+        return matrix2euler_intrinsic(rotation_matrices, axes, degrees=degrees,
+                                      well_conditioned=well_conditioned)
     else:
-        return matrix2euler_extrinsic(rotation_matrices, axes)
+        return matrix2euler_extrinsic(rotation_matrices, axes, degrees=degrees,
+                                      well_conditioned=well_conditioned)
 
 
 def matrix2euler(rotation_matrices: np.ndarray,
                  axes: str,
                  intrinsic: bool,
                  right_handed_rotation: bool,
+                 degrees: bool = True,
+                 orthonormalise: Optional[str] = None,
+                 validate: bool = False,
                  ) -> np.ndarray:
     """
     Derive a set of euler angles from a set of rotation matrices.
@@ -504,7 +558,7 @@ def matrix2euler(rotation_matrices: np.ndarray,
     Parameters
     ----------
     rotation_matrices : (n, 3, 3) or (3, 3) array of float
-        rotation matrices from which euler angles are derived
+        rotation matrices from which euler angles are derived, dask arrays are converted lazily
     axes : str
         valid sequence of three non-sequential axes from 'x', 'y' and 'z'
         e.g. 'zyz', 'zxz', 'xyz'
@@ -514,6 +568,17 @@ def matrix2euler(rotation_matrices: np.ndarray,
     right_handed_rotation : bool
         True - Euler angles are for right handed rotations
         False - Euler angles are for left handed rotations
+    degrees : bool
+        True - Euler angles are returned in degrees
+        False - Euler angles are returned in radians
+    orthonormalise : str or None
+        'newton' or 'svd' - project matrices onto the closest rotation matrices first, see
+        `orthonormalise_rotation_matrices`
+        None - matrices are used as given
+    validate : bool
+        True - raise a ValueError if any matrix (after orthonormalisation) is not a proper
+        rotation matrix, see `is_rotation_matrix`
+        False - matrices are not checked
 
     Returns
     -------
@@ -521,7 +586,6 @@ def matrix2euler(rotation_matrices: np.ndarray,
         Euler angles derived from rotation matrices
     """
     # Sanitise and check input
-    rotation_matrices = np.asarray(rotation_matrices).reshape((-1, 3, 3))
     formatted_axes = axes.strip().lower()
 
     if formatted_axes not in valid_axes:
@@ -529,14 +593,81 @@ def matrix2euler(rotation_matrices: np.ndarray,
 
     axes = formatted_axes
 
+    # Lazily map over blocks of rows for dask arrays
+    if is_dask_array(rotation_matrices):
+        return map_row_blocks(matrix2euler, rotation_matrices, (3, 3), (3,),
+                              axes=axes,
+                              intrinsic=intrinsic,
+                              right_handed_rotation=right_handed_rotation,
+                              degrees=degrees,
+                              orthonormalise=orthonormalise,
+                              validate=validate)
+
+    rotation_matrices = np.asarray(rotation_matrices)
+    pre_stage = orthonormalise is not None or validate
+
+    # Single rotation matrix, avoid array overheads where possible
+    if rotation_matrices.shape == (3, 3) and not pre_stage:
+        euler_angles = matrix2euler_scalar(rotation_matrices.tolist(), axes, intrinsic,
+                                           right_handed_rotation, degrees=degrees)
+        if euler_angles is not None:
+            return np.array(euler_angles, dtype=float)
+
+    rotation_matrices = rotation_matrices.reshape((-1, 3, 3))
+
     # Calculate euler angles for right handed rotations
-    euler_angles = matrix2euler_right_handed(rotation_matrices, axes, intrinsic)
+    if not pre_stage:
+        euler_angles = matrix2euler_right_handed(rotation_matrices, axes, intrinsic,
+                                                 degrees=degrees)
+    else:
+        # Orthonormalise and validate in chunks to bound memory
+        n_rows = rotation_matrices.shape[0]
+        euler_angles = np.empty((n_rows, 3))
+        for start in range(0, n_rows, pre_stage_chunk_size):
+            stop = min(start + pre_stage_chunk_size, n_rows)
+            chunk = rotation_matrices[start:stop]
+            if orthonormalise is not None:
+                chunk = orthonormalise_rotation_matrices(chunk, method=orthonormalise)
+            if validate:
+                invalid = np.flatnonzero(~is_rotation_matrix(chunk))
+                if invalid.size > 0:
+                    raise ValueError(f'{invalid.size} matrices in rows {start} to {stop - 1} '
+                                     f'are not rotation matrices, first at row '
+                                     f'{start + invalid[0]}')
+            euler_angles[start:stop] = matrix2euler_right_handed(chunk, axes, intrinsic,
+                                                                 degrees=degrees)
 
     # If you want left handed rotations, invert the angles
     if not right_handed_rotation:
         euler_angles *= -1
 
-    return euler_angles.squeeze()
+    # The extractors return views of column buffers, return rows contiguously
+    return np.ascontiguousarray(euler_angles.squeeze())
+
+
+def matrix2euler_well_conditioned(rotation_matrices: np.ndarray,
+                                  axes: str,
+                                  intrinsic: bool,
+                                  right_handed_rotation: bool,
+                                  degrees: bool = True) -> np.ndarray:
+    """
+    Derive a set of euler angles from rotation matrices carrying rounding errors, e.g. matrices
+    built with single precision trigonometry.
+
+    The second angle is derived with arctan2 from one entry and the norm of the other two
+    entries in its row rather than with arccos or arcsin of a single entry, which amplify
+    errors close to gimbal lock. This is slower than `matrix2euler`, see it for parameters.
+    """
+    formatted_axes = axes.strip().lower()
+    if formatted_axes not in valid_axes:
+        raise ValueError(f'Axes {axes} are not a valid set of euler angle axes')
+
+    rotation_matrices = np.asarray(rotation_matrices).reshape((-1, 3, 3))
+    euler_angles = matrix2euler_right_handed(rotation_matrices, formatted_axes, intrinsic,
+                                             degrees=degrees, well_conditioned=True)
+    if not right_handed_rotation:
+        euler_angles *= -1
+    return np.ascontiguousarray(euler_angles.squeeze())
 
 
 extrinsic_matrix2euler_functions = {
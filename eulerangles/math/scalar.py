@@ -0,0 +1,153 @@
+import math
+from typing import List, Optional, Sequence
+
+from .constants import gimbal_lock_tolerance
+
+Matrix = List[List[float]]
+
+
+def theta2rotm_scalar(theta: float, axis: str) -> Matrix:
+    """
+    Rotation matrix around a given axis 'x', 'y' or 'z' for a single angle in radians,
+    see `theta2rotm`.
+    """
+    c = math.cos(theta)
+    s = math.sin(theta)
+    if axis == 'x':
+        return [[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]]
+    elif axis == 'y':
+        return [[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]]
+    else:
+        return [[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]
+
+
+def matmul_scalar(a: Matrix, b: Matrix) -> Matrix:
+    """
+    Product of two 3x3 matrices given as nested lists.
+    """
+    (a11, a12, a13), (a21, a22, a23), (a31, a32, a33) = a
+    (b11, b12, b13), (b21, b22, b23), (b31, b32, b33) = b
+    return [[a11 * b11 + a12 * b21 + a13 * b31,
+             a11 * b12 + a12 * b22 + a13 * b32,
+             a11 * b13 + a12 * b23 + a13 * b33],
+            [a21 * b11 + a22 * b21 + a23 * b31,
+             a21 * b12 + a22 * b22 + a23 * b32,
+             a21 * b13 + a22 * b23 + a23 * b33],
+            [a31 * b11 + a32 * b21 + a33 * b31,
+             a31 * b12 + a32 * b22 + a33 * b32,
+             a31 * b13 + a32 * b23 + a33 * b33]]
+
+
+def transpose_scalar(a: Matrix) -> Matrix:
+    """
+    Transpose of a 3x3 matrix given as nested lists.
+    """
+    return [[a[0][i], a[1][i], a[2][i]] for i in range(3)]
+
+
+def euler2matrix_scalar(euler_angles: Sequence[float],
+                        axes: str,
+                        intrinsic: bool,
+                        right_handed_rotation: bool,
+                        degrees: bool = True) -> Matrix:
+    """
+    Derive a rotation matrix from a single set of euler angles using the math module,
+    see `euler2matrix`.
+
+    `axes` must already be sanitised.
+    """
+    if degrees:
+        euler_angles = [math.radians(angle) for angle in euler_angles]
+    if not right_handed_rotation:
+        euler_angles = [-angle for angle in euler_angles]
+
+    r1, r2, r3 = [theta2rotm_scalar(euler_angles[idx], axes[idx]) for idx in range(3)]
+    if intrinsic:
+        return matmul_scalar(matmul_scalar(r1, r2), r3)
+    else:
+        return matmul_scalar(matmul_scalar(r3, r2), r1)
+
+
+# Closed forms used by the extrinsic matrix2euler functions for each set of axes
+# (function for angle 2, index for angle 2,
+#  (sign, index, sign, index) of arctan2 arguments for angle 1 in gimbal lock,
+#  ... for angle 1 otherwise, ... for angle 3 otherwise)
+_extrinsic_closed_forms = {
+    'xyx': ('acos', (0, 0), (-1, (1, 2), 1, (1, 1)),
+            (1, (0, 1), 1, (0, 2)), (1, (1, 0), -1, (2, 0))),
+    'yzy': ('acos', (1, 1), (-1, (2, 0), 1, (2, 2)),
+            (1, (1, 2), 1, (1, 0)), (1, (2, 1), -1, (0, 1))),
+    'zxz': ('acos', (2, 2), (-1, (0, 1), 1, (0, 0)),
+            (1, (2, 0), 1, (2, 1)), (1, (0, 2), -1, (1, 2))),
+    'xzx': ('acos', (0, 0), (1, (2, 1), 1, (2, 2)),
+            (1, (0, 2), -1, (0, 1)), (1, (2, 0), 1, (1, 0))),
+    'yxy': ('acos', (1, 1), (1, (0, 2), 1, (0, 0)),
+            (1, (1, 0), -1, (1, 2)), (1, (0, 1), 1, (2, 1))),
+    'zyz': ('acos', (2, 2), (1, (1, 0), 1, (1, 1)),
+            (1, (2, 1), -1, (2, 0)), (1, (1, 2), 1, (0, 2))),
+    'xyz': ('-asin', (2, 0), (-1, (1, 2), 1, (1, 1)),
+            (1, (2, 1), 1, (2, 2)), (1, (1, 0), 1, (0, 0))),
+    'yzx': ('-asin', (0, 1), (-1, (2, 0), 1, (2, 2)),
+            (1, (0, 2), 1, (0, 0)), (1, (2, 1), 1, (1, 1))),
+    'zxy': ('-asin', (1, 2), (-1, (0, 1), 1, (0, 0)),
+            (1, (1, 0), 1, (1, 1)), (1, (0, 2), 1, (2, 2))),
+    'xzy': ('asin', (1, 0), (1, (2, 1), 1, (2, 2)),
+            (-1, (1, 2), 1, (1, 1)), (-1, (2, 0), 1, (0, 0))),
+    'yxz': ('asin', (2, 1), (1, (0, 2), 1, (0, 0)),
+            (-1, (2, 0), 1, (2, 2)), (-1, (0, 1), 1, (1, 1))),
+    'zyx': ('asin', (0, 2), (1, (1, 0), 1, (1, 1)),
+            (-1, (0, 1), 1, (0, 0)), (-1, (1, 2), 1, (2, 2))),
+}
+
+_angle2_functions = {
+    'acos': math.acos,
+    'asin': math.asin,
+    '-asin': lambda x: -math.asin(x),
+}
+
+
+def _atan2(rotation_matrix: Matrix, arguments: tuple) -> float:
+    sign_y, (iy, jy), sign_x, (ix, jx) = arguments
+    return math.atan2(sign_y * rotation_matrix[iy][jy], sign_x * rotation_matrix[ix][jx])
+
+
+def matrix2euler_extrinsic_scalar(rotation_matrix: Matrix, axes: str) -> List[float]:
+    """
+    Derive right handed extrinsic euler angles in radians from a single rotation matrix using
+    the math module, see the extrinsic matrix2euler functions.
+    """
+    angle2_function, (i2, j2), gimbal_angle1, angle1, angle3 = _extrinsic_closed_forms[axes]
+    angle2 = _angle2_functions[angle2_function](rotation_matrix[i2][j2])
+
+    # Gimbal lock case, |sin| or |cos| of angle 2 below the tolerance
+    if abs(rotation_matrix[i2][j2]) > math.sqrt(1 - gimbal_lock_tolerance ** 2):
+        return [_atan2(rotation_matrix, gimbal_angle1), angle2, 0.0]
+
+    return [_atan2(rotation_matrix, angle1), angle2, _atan2(rotation_matrix, angle3)]
+
+
+def matrix2euler_scalar(rotation_matrix: Matrix,
+                        axes: str,
+                        intrinsic: bool,
+                        right_handed_rotation: bool,
+                        degrees: bool = True) -> Optional[List[float]]:
+    """
+    Derive euler angles from a single rotation matrix using the math module,
+    see `matrix2euler`.
+
+    `axes` must already be sanitised. None is returned if the matrix contains entries outside
+    the domain of the inverse trigonometric functions.
+    """
+    try:
+        if intrinsic:
+            euler_angles = matrix2euler_extrinsic_scalar(rotation_matrix, axes[::-1])[::-1]
+        else:
+            euler_angles = matrix2euler_extrinsic_scalar(rotation_matrix, axes)
+    except ValueError:
+        return None
+
+    if not right_handed_rotation:
+        euler_angles = [-angle for angle in euler_angles]
+    if degrees:
+        euler_angles = [math.degrees(angle) for angle in euler_angles]
+    return euler_angles
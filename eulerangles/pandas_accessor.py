@@ -0,0 +1,87 @@
+"""
+A pandas DataFrame accessor for converting columns of Euler angles.
+
+Importing this module registers the accessor as `DataFrame.eulers`
+
+>>> import eulerangles.pandas_accessor
+>>> df.eulers.convert(cols=['rlnAngleRot', 'rlnAngleTilt', 'rlnAnglePsi'],
+...                   source='relion', target='dynamo')
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .base import ConversionMeta
+from .interface import convert_eulers_columns
+from .utils import get_conversion_metadata
+
+
+@pd.api.extensions.register_dataframe_accessor('eulers')
+class EulerAnglesAccessor:
+    """
+    Convert Euler angles stored in three columns of a DataFrame.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame):
+        self._dataframe = dataframe
+
+    def convert(self,
+                cols: Sequence[str],
+                source: Union[ConversionMeta, str],
+                target: Union[ConversionMeta, str],
+                output_cols: Optional[Sequence[str]] = None,
+                chunk_size: int = 1_000_000,
+                degrees: bool = True) -> pd.DataFrame:
+        """
+        Convert Euler angles stored in three columns and write the results into the DataFrame.
+
+        Columns are read as NumPy views where pandas allows, converted in chunks of rows with
+        `convert_eulers_columns` and each result column is assigned once, so no intermediate
+        DataFrames are built.
+
+        Parameters
+        ----------
+        cols : sequence of three str
+            names of the columns holding the first, second and third Euler angles
+        source : ConversionMeta or str
+            metadata defining how to interpret the euler angles or a string with the name of a
+            software package
+        target : ConversionMeta or str
+            metadata defining how to generate euler angles or a string with the name of a
+            software package
+        output_cols : sequence of three str or None
+            names of the columns to write results into, None overwrites `cols`
+        chunk_size : int
+            number of rows converted at once
+        degrees : bool
+            True - Euler angles are given and returned in degrees
+            False - Euler angles are given and returned in radians
+
+        Returns
+        -------
+        dataframe : pd.DataFrame
+            the DataFrame, modified in place
+        """
+        if len(cols) != 3:
+            raise ValueError('cols must contain exactly three column names')
+        output_cols = cols if output_cols is None else output_cols
+        if len(output_cols) != 3:
+            raise ValueError('output_cols must contain exactly three column names')
+
+        source = get_conversion_metadata(source)
+        target = get_conversion_metadata(target)
+
+        angle_columns = [self._dataframe[col].to_numpy(dtype=float) for col in cols]
+        n_rows = len(self._dataframe)
+        converted_eulers = np.empty((3, n_rows))
+
+        for start in range(0, n_rows, chunk_size):
+            stop = min(start + chunk_size, n_rows)
+            converted_eulers[:, start:stop] = convert_eulers_columns(
+                [angles[start:stop] for angles in angle_columns], source, target, degrees=degrees
+            )
+
+        for col, converted_angles in zip(output_cols, converted_eulers):
+            self._dataframe[col] = converted_angles
+        return self._dataframe
@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.eulers_to_eulers import euler2euler
+from .utils import get_conversion_metadata
+
+
+def _convert_rows(input_name: str,
+                  output_name: str,
+                  n_rows: int,
+                  start: int,
+                  stop: int,
+                  euler2euler_kwargs: dict):
+    """
+    Convert a range of rows between two shared memory blocks, run in worker processes.
+    """
+    input_memory = SharedMemory(name=input_name)
+    output_memory = SharedMemory(name=output_name)
+    try:
+        input_eulers = np.ndarray((n_rows, 3), dtype=float, buffer=input_memory.buf)
+        output_eulers = np.ndarray((n_rows, 3), dtype=float, buffer=output_memory.buf)
+        output_eulers[start:stop] = euler2euler(input_eulers[start:stop],
+                                                **euler2euler_kwargs).reshape((-1, 3))
+        del input_eulers, output_eulers
+    finally:
+        input_memory.close()
+        output_memory.close()
+
+
+def convert_eulers_parallel(euler_angles: np.ndarray,
+                            source_meta: Union[ConversionMeta, str],
+                            target_meta: Union[ConversionMeta, str],
+                            n_workers: Optional[int] = None,
+                            chunk_size: Optional[int] = None,
+                            executor: Optional[Executor] = None,
+                            degrees: bool = True) -> np.ndarray:
+    """
+    Convert Euler angles defined according to one 'convention' into Euler angles defined
+    according to another using a pool of worker processes.
+
+    Input and output arrays are placed in shared memory and each worker runs `euler2euler` in
+    place on a disjoint range of rows, so no large arrays are pickled.
+
+    Parameters
+    ----------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles to be converted
+
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or a string with the name of a
+        software package
+
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or a string with the name of a software
+        package
+
+    n_workers : int or None
+        number of worker processes, defaults to the number of CPUs, ignored if `executor` is
+        provided
+
+    chunk_size : int or None
+        number of rows converted per task, defaults to an even split between workers
+
+    executor : concurrent.futures.Executor or None
+        process pool to run conversions on, e.g. to reuse workers across several files,
+        a new ProcessPoolExecutor is created and shut down if not provided
+
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+
+    Returns
+    -------
+    euler_angles : (n, 3) or (3,) array of float
+        Euler angles resulting from conversion
+    """
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+    euler2euler_kwargs = {
+        'source_axes': source_meta.axes,
+        'source_intrinsic': source_meta.intrinsic,
+        'source_right_handed_rotation': source_meta.right_handed_rotation,
+        'target_axes': target_meta.axes,
+        'target_intrinsic': target_meta.intrinsic,
+        'target_right_handed_rotation': target_meta.right_handed_rotation,
+        'invert_matrix': source_meta.active != target_meta.active,
+        'degrees': degrees,
+    }
+
+    euler_angles = np.asarray(euler_angles, dtype=float).reshape((-1, 3))
+    n_rows = euler_angles.shape[0]
+    if n_rows == 0:
+        return np.empty((0, 3))
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = -(-n_rows // n_workers)
+
+    input_memory = SharedMemory(create=True, size=euler_angles.nbytes)
+    output_memory = SharedMemory(create=True, size=euler_angles.nbytes)
+    own_executor = executor is None
+    try:
+        input_eulers = np.ndarray((n_rows, 3), dtype=float, buffer=input_memory.buf)
+        input_eulers[:] = euler_angles
+        del input_eulers
+
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+
+        futures = [executor.submit(_convert_rows,
+                                   input_memory.name,
+                                   output_memory.name,
+                                   n_rows,
+                                   start,
+                                   min(start + chunk_size, n_rows),
+                                   euler2euler_kwargs)
+                   for start in range(0, n_rows, chunk_size)]
+        for future in futures:
+            future.result()
+
+        output_eulers = np.ndarray((n_rows, 3), dtype=float, buffer=output_memory.buf).copy()
+    finally:
+        if own_executor and executor is not None:
+            executor.shutdown()
+        for shared_memory in (input_memory, output_memory):
+            shared_memory.close()
+            shared_memory.unlink()
+
+    return output_eulers.squeeze()
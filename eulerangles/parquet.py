@@ -0,0 +1,187 @@
+"""
+Streaming conversion of Euler angle and rotation matrix columns in Parquet files.
+
+Files are processed one row group at a time with pyarrow, columns are passed to the columnar
+conversion functions as NumPy views of the Arrow buffers where possible and no pandas objects
+are created. This module requires pyarrow and is not imported by `eulerangles`
+
+>>> import eulerangles.parquet
+>>> eulerangles.parquet.convert_parquet('particles.parquet', 'converted.parquet',
+...                                     cols=['rlnAngleRot', 'rlnAngleTilt', 'rlnAnglePsi'],
+...                                     source_meta='relion', target_meta='dynamo')
+"""
+from typing import Iterator, Optional, Sequence, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .base import ConversionMeta
+from .interface import convert_eulers_columns
+from .math.columnar import euler2matrix_columns, matrix2euler_columns
+from .utils import get_conversion_metadata
+
+parquet_outputs = ('eulers', 'matrices')
+
+# Default names of the columns holding the nine components of rotation matrices, row-major
+default_matrix_cols = [f'matrix_{i}{j}' for i in range(1, 4) for j in range(1, 4)]
+
+
+def _column2numpy(column: Union[pa.Array, pa.ChunkedArray]) -> np.ndarray:
+    """
+    Float64 NumPy array from an Arrow column, a view of the Arrow buffer if it is a single
+    chunk of float64 values without nulls.
+    """
+    if isinstance(column, pa.ChunkedArray) and column.num_chunks == 1:
+        column = column.chunk(0)
+    if isinstance(column, pa.Array) and column.null_count == 0 \
+            and column.type == pa.float64():
+        return column.to_numpy(zero_copy_only=True)
+    return np.asarray(column.to_numpy(), dtype=float)
+
+
+def iter_parquet_columns(filename: str, cols: Sequence[str]) -> Iterator[np.ndarray]:
+    """
+    Iterate over columns of a Parquet file one row group at a time.
+
+    Parameters
+    ----------
+    filename : str
+        Parquet file
+    cols : sequence of str
+        names of the columns to read
+
+    Yields
+    ------
+    columns : (len(cols), n) array of float
+        values of the columns in each row group
+    """
+    parquet_file = pq.ParquetFile(filename)
+    for row_group in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(row_group, columns=list(cols))
+        yield np.stack([_column2numpy(table.column(col)) for col in cols])
+
+
+def convert_parquet(source_filename: str,
+                    target_filename: str,
+                    cols: Sequence[str],
+                    source_meta: Union[ConversionMeta, str],
+                    target_meta: Union[ConversionMeta, str],
+                    output_cols: Optional[Sequence[str]] = None,
+                    output: str = 'eulers',
+                    degrees: bool = True):
+    """
+    Convert Euler angle or rotation matrix columns of a Parquet file, one row group at a time.
+
+    Every row group of the source file is read, its orientation columns converted with the
+    columnar conversion functions and written with all other columns as a row group of the
+    target file, so memory use is bounded by the size of a row group.
+
+    Parameters
+    ----------
+    source_filename : str
+        Parquet file to be converted
+    target_filename : str
+        Parquet file to be written
+    cols : sequence of three or nine str
+        names of the columns holding the first, second and third Euler angles or, row-major, the
+        nine components of rotation matrices
+    source_meta : ConversionMeta or str
+        metadata defining how to interpret the euler angles or rotation matrices or a string
+        with the name of a software package
+    target_meta : ConversionMeta or str
+        metadata defining how to generate euler angles or rotation matrices or a string with
+        the name of a software package
+    output_cols : sequence of three or nine str or None
+        names of the columns to write results into, existing columns are replaced, None
+        overwrites `cols` if the output has the same kind as the input, otherwise results are
+        written to `default_matrix_cols` or to three columns named after `cols` with '_euler'
+        appended
+    output : str
+        'eulers' - Euler angles are written
+        'matrices' - the nine components of rotation matrices are written
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+    """
+    if len(cols) not in (3, 9):
+        raise ValueError('cols must contain three Euler angle or nine matrix column names')
+    if output not in parquet_outputs:
+        raise ValueError(f'output must be one of {parquet_outputs}')
+
+    input_matrices = len(cols) == 9
+    output_matrices = output == 'matrices'
+    if output_cols is None:
+        if input_matrices == output_matrices:
+            output_cols = cols
+        elif output_matrices:
+            output_cols = default_matrix_cols
+        else:
+            output_cols = [f'{col}_euler' for col in cols[:3]]
+    if len(output_cols) != (9 if output_matrices else 3):
+        raise ValueError('output_cols must contain one column name per output component')
+
+    source_meta = get_conversion_metadata(source_meta)
+    target_meta = get_conversion_metadata(target_meta)
+
+    parquet_file = pq.ParquetFile(source_filename)
+    writer = None
+    try:
+        for row_group in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(row_group)
+            columns = [_column2numpy(table.column(col)) for col in cols]
+            converted = _convert_columns(columns, source_meta, target_meta, input_matrices,
+                                         output_matrices, degrees)
+
+            for col, values in zip(output_cols, converted):
+                values = pa.array(values)
+                idx = table.schema.get_field_index(col)
+                if idx == -1:
+                    table = table.append_column(col, values)
+                else:
+                    table = table.set_column(idx, col, values)
+
+            if writer is None:
+                writer = pq.ParquetWriter(target_filename, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _convert_columns(columns: Sequence[np.ndarray],
+                     source_meta: ConversionMeta,
+                     target_meta: ConversionMeta,
+                     input_matrices: bool,
+                     output_matrices: bool,
+                     degrees: bool) -> np.ndarray:
+    """
+    Convert columns of Euler angles (3, n) or matrix components (9, n) into the requested
+    output, returned as (3, n) or (9, n).
+    """
+    if not input_matrices and not output_matrices:
+        return convert_eulers_columns(columns, source_meta, target_meta, degrees=degrees)
+
+    if input_matrices:
+        rotation_matrices = np.stack(columns).reshape((3, 3, -1))
+    else:
+        rotation_matrices = euler2matrix_columns(
+            columns,
+            axes=source_meta.axes,
+            intrinsic=source_meta.intrinsic,
+            right_handed_rotation=source_meta.right_handed_rotation,
+            degrees=degrees
+        )
+
+    # Check if desired transformation is of the same type as the input
+    if source_meta.active != target_meta.active:
+        # Components are the leading axes of (3, 3, n) arrays
+        rotation_matrices = rotation_matrices.swapaxes(0, 1)
+
+    if output_matrices:
+        return rotation_matrices.reshape((9, -1))
+    return matrix2euler_columns(rotation_matrices,
+                                axes=target_meta.axes,
+                                intrinsic=target_meta.intrinsic,
+                                right_handed_rotation=target_meta.right_handed_rotation,
+                                degrees=degrees)
@@ -0,0 +1,132 @@
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.quaternions import quaternion2matrix
+from .math.rotation_matrix_to_eulers import matrix2euler
+from .utils import get_conversion_metadata
+
+random_rotation_outputs = ('eulers', 'matrices', 'quaternions')
+
+
+def _uniforms2quaternions(uniforms: np.ndarray) -> np.ndarray:
+    """
+    Map (n, 3) uniform samples on [0, 1) to uniformly distributed unit quaternions (w, x, y, z)
+    using Shoemake's method.
+    """
+    u1, u2, u3 = [uniforms[:, idx] for idx in range(3)]
+    lower, upper = np.sqrt(1 - u1), np.sqrt(u1)
+    theta2, theta3 = 2 * np.pi * u2, 2 * np.pi * u3
+    return np.stack([upper * np.cos(theta3),
+                     lower * np.sin(theta2),
+                     lower * np.cos(theta2),
+                     upper * np.sin(theta3)], axis=-1)
+
+
+def _sanitise_target_meta(target_meta: Optional[Union[ConversionMeta, str]],
+                          output: str) -> Optional[ConversionMeta]:
+    if output not in random_rotation_outputs:
+        raise ValueError(f'output must be one of {random_rotation_outputs}')
+    if output == 'eulers':
+        if target_meta is None:
+            raise ValueError("target_meta is required if output is 'eulers'")
+        target_meta = get_conversion_metadata(target_meta)
+    return target_meta
+
+
+def _random_rotations(rng: np.random.Generator,
+                      n: int,
+                      target_meta: Optional[ConversionMeta],
+                      output: str,
+                      degrees: bool) -> np.ndarray:
+    quaternions = _uniforms2quaternions(rng.random((n, 3)))
+    if output == 'quaternions':
+        return quaternions
+
+    rotation_matrices = quaternion2matrix(quaternions).reshape((-1, 3, 3))
+    if output == 'matrices':
+        return rotation_matrices
+
+    euler_angles = matrix2euler(rotation_matrices,
+                                axes=target_meta.axes,
+                                intrinsic=target_meta.intrinsic,
+                                right_handed_rotation=target_meta.right_handed_rotation,
+                                degrees=degrees)
+    return np.asarray(euler_angles).reshape((-1, 3))
+
+
+def iter_random_rotations(n: int,
+                          target_meta: Optional[Union[ConversionMeta, str]] = None,
+                          output: str = 'eulers',
+                          chunk_size: int = 1_000_000,
+                          seed: Optional[Union[int, np.random.Generator]] = None,
+                          degrees: bool = True) -> Iterator[np.ndarray]:
+    """
+    Generate uniformly distributed random rotations in chunks.
+
+    Unit quaternions are sampled directly with Shoemake's method and converted to the requested
+    output. Uniform samples are drawn from a single generator in row order, so for a given seed
+    the same rotations are produced whatever the chunk size.
+
+    Parameters
+    ----------
+    n : int
+        total number of rotations
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, required if output is 'eulers'
+    output : str
+        'eulers' - Euler angles are generated
+        'matrices' - rotation matrices are generated
+        'quaternions' - unit quaternions (w, x, y, z) are generated
+    chunk_size : int
+        maximum number of rotations per chunk
+    seed : int, np.random.Generator or None
+        seed or generator passed to `np.random.default_rng`
+    degrees : bool
+        True - Euler angles are returned in degrees
+        False - Euler angles are returned in radians
+
+    Yields
+    ------
+    rotations : (m, 3), (m, 3, 3) or (m, 4) array of float
+        consecutive chunks of random rotations
+    """
+    target_meta = _sanitise_target_meta(target_meta, output)
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunk_size):
+        yield _random_rotations(rng, min(chunk_size, n - start), target_meta, output, degrees)
+
+
+def random_rotations(n: int,
+                     target_meta: Optional[Union[ConversionMeta, str]] = None,
+                     output: str = 'eulers',
+                     seed: Optional[Union[int, np.random.Generator]] = None,
+                     degrees: bool = True) -> np.ndarray:
+    """
+    Generate uniformly distributed random rotations, see `iter_random_rotations`.
+
+    Parameters
+    ----------
+    n : int
+        number of rotations
+    target_meta : ConversionMeta, str or None
+        metadata defining how to generate euler angles or a string with the name of a software
+        package, required if output is 'eulers'
+    output : str
+        'eulers', 'matrices' or 'quaternions'
+    seed : int, np.random.Generator or None
+        seed or generator passed to `np.random.default_rng`
+    degrees : bool
+        True - Euler angles are returned in degrees
+        False - Euler angles are returned in radians
+
+    Returns
+    -------
+    rotations : (n, 3), (n, 3, 3) or (n, 4) array of float
+        random rotations
+    """
+    target_meta = _sanitise_target_meta(target_meta, output)
+    return _random_rotations(np.random.default_rng(seed), n, target_meta, output, degrees)
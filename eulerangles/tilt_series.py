@@ -0,0 +1,169 @@
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+from .base import ConversionMeta
+from .math.eulers_to_rotation_matrix import euler2matrix
+from .math.rotation_matrix_to_eulers import matrix2euler
+from .math.rotation_matrices.utils import invert_rotation_matrices
+from .utils import get_conversion_metadata
+
+
+def _active_matrices(euler_angles: np.ndarray,
+                     meta: ConversionMeta,
+                     degrees: bool) -> np.ndarray:
+    rotation_matrices = euler2matrix(np.asarray(euler_angles).reshape((-1, 3)),
+                                     axes=meta.axes,
+                                     intrinsic=meta.intrinsic,
+                                     right_handed_rotation=meta.right_handed_rotation,
+                                     degrees=degrees).reshape((-1, 3, 3))
+    if not meta.active:
+        rotation_matrices = invert_rotation_matrices(rotation_matrices)
+    return np.ascontiguousarray(rotation_matrices)
+
+
+class TiltSeriesOrientations:
+    """
+    Lazy outer product of N particle orientations with T per-tilt rotations.
+
+    Each (particle, tilt) orientation is the particle rotation followed by the tilt rotation,
+    R_tilt @ R_particle for active rotations. Only the N + T input rotation matrices are stored,
+    composed orientations are computed on demand for a subset of particles or in chunks of
+    particles so the full (N, T, 3, 3) array is never built.
+
+    Parameters
+    ----------
+    particle_eulers : (n, 3) or (3,) array of float
+        Euler angles describing particle orientations
+    tilt_eulers : (t, 3) or (3,) array of float
+        Euler angles describing the rotation of each tilt image
+    particle_meta : ConversionMeta or str
+        metadata defining how to interpret the particle euler angles or a string with the name
+        of a software package
+    tilt_meta : ConversionMeta, str or None
+        metadata defining how to interpret the tilt euler angles, None uses `particle_meta`
+    degrees : bool
+        True - Euler angles are given and returned in degrees
+        False - Euler angles are given and returned in radians
+    """
+
+    def __init__(self,
+                 particle_eulers: np.ndarray,
+                 tilt_eulers: np.ndarray,
+                 particle_meta: Union[ConversionMeta, str],
+                 tilt_meta: Optional[Union[ConversionMeta, str]] = None,
+                 degrees: bool = True):
+        self.particle_meta = get_conversion_metadata(particle_meta)
+        self.tilt_meta = self.particle_meta if tilt_meta is None \
+            else get_conversion_metadata(tilt_meta)
+        self.degrees = degrees
+
+        # Compose in terms of active rotations, whatever the input conventions
+        self._particle_matrices = _active_matrices(particle_eulers, self.particle_meta, degrees)
+        self._tilt_matrices = _active_matrices(tilt_eulers, self.tilt_meta, degrees)
+
+    @property
+    def n_particles(self) -> int:
+        return self._particle_matrices.shape[0]
+
+    @property
+    def n_tilts(self) -> int:
+        return self._tilt_matrices.shape[0]
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.n_particles, self.n_tilts
+
+    def __len__(self) -> int:
+        return self.n_particles
+
+    def matrices(self,
+                 particles: Union[int, slice, np.ndarray] = slice(None),
+                 target_meta: Optional[Union[ConversionMeta, str]] = None) -> np.ndarray:
+        """
+        Rotation matrices for every tilt of a subset of particles.
+
+        Parameters
+        ----------
+        particles : int, slice or array of int
+            particles for which orientations are composed, all particles by default
+        target_meta : ConversionMeta, str or None
+            matrices describe active rotations for an active target and are inverted to describe
+            passive rotations for a passive target, whatever the conventions of the inputs,
+            None uses `particle_meta`
+
+        Returns
+        -------
+        rotation_matrices : (m, t, 3, 3) array
+            rotation matrices for each selected particle and each tilt
+        """
+        target_meta = self.particle_meta if target_meta is None \
+            else get_conversion_metadata(target_meta)
+        particle_matrices = self._particle_matrices[particles].reshape((-1, 3, 3))
+        rotation_matrices = self._tilt_matrices[np.newaxis] @ particle_matrices[:, np.newaxis]
+        if not target_meta.active:
+            rotation_matrices = invert_rotation_matrices(rotation_matrices)
+        return rotation_matrices
+
+    def eulers(self,
+               particles: Union[int, slice, np.ndarray] = slice(None),
+               target_meta: Optional[Union[ConversionMeta, str]] = None) -> np.ndarray:
+        """
+        Euler angles for every tilt of a subset of particles.
+
+        Parameters
+        ----------
+        particles : int, slice or array of int
+            particles for which orientations are composed, all particles by default
+        target_meta : ConversionMeta, str or None
+            metadata defining how to generate euler angles or a string with the name of a
+            software package, None uses `particle_meta`, Euler angles describe active or
+            passive rotations according to the target, see `matrices`
+
+        Returns
+        -------
+        euler_angles : (m, t, 3) array
+            Euler angles for each selected particle and each tilt
+        """
+        target_meta = self.particle_meta if target_meta is None \
+            else get_conversion_metadata(target_meta)
+        rotation_matrices = self.matrices(particles, target_meta)
+        n_particles = rotation_matrices.shape[0]
+        euler_angles = matrix2euler(rotation_matrices.reshape((-1, 3, 3)),
+                                    axes=target_meta.axes,
+                                    intrinsic=target_meta.intrinsic,
+                                    right_handed_rotation=target_meta.right_handed_rotation,
+                                    degrees=self.degrees)
+        return euler_angles.reshape((n_particles, self.n_tilts, 3))
+
+    def iter_matrices(self,
+                      chunk_size: int = 10_000,
+                      target_meta: Optional[Union[ConversionMeta, str]] = None
+                      ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Iterate over rotation matrices in chunks of particles.
+
+        Yields
+        ------
+        particles, rotation_matrices : slice, (m, t, 3, 3) array
+            particles in the chunk and their rotation matrices for each tilt
+        """
+        for start in range(0, self.n_particles, chunk_size):
+            particles = slice(start, min(start + chunk_size, self.n_particles))
+            yield particles, self.matrices(particles, target_meta)
+
+    def iter_eulers(self,
+                    chunk_size: int = 10_000,
+                    target_meta: Optional[Union[ConversionMeta, str]] = None
+                    ) -> Iterator[Tuple[slice, np.ndarray]]:
+        """
+        Iterate over Euler angles in chunks of particles.
+
+        Yields
+        ------
+        particles, euler_angles : slice, (m, t, 3) array
+            particles in the chunk and their Euler angles for each tilt
+        """
+        for start in range(0, self.n_particles, chunk_size):
+            particles = slice(start, min(start + chunk_size, self.n_particles))
+            yield particles, self.eulers(particles, target_meta)
@@ -1,10 +1,16 @@
+from .base import ConversionMeta
 from .constants import euler_angle_metadata
 
 
 def get_conversion_metadata(convention):
     """
     Attempts to retrieve ConversionMeta objects from a given software package name
+
+    ConversionMeta objects are returned unchanged.
     """
+    if isinstance(convention, ConversionMeta):
+        return convention
+
     try:
         convention = convention.strip().lower()
         convention = euler_angle_metadata[convention]
@@ -0,0 +1,46 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import convert_eulers, aconvert_eulers, aiter_convert_eulers
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(1000, 3))
+
+
+def test_aconvert_eulers():
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+    result = asyncio.run(aconvert_eulers(test_eulers, 'relion', 'dynamo', chunk_size=300))
+    assert_array_almost_equal(expected, result)
+
+    result = asyncio.run(aconvert_eulers(test_eulers[0], 'relion', 'dynamo'))
+    assert_array_almost_equal(expected[0], result)
+
+
+def test_aiter_convert_eulers():
+    async def collect():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return [chunk async for chunk in aiter_convert_eulers(test_eulers, 'relion', 'dynamo',
+                                                                  chunk_size=300,
+                                                                  executor=executor)]
+
+    chunks = asyncio.run(collect())
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+
+    assert [chunk.shape[0] for chunk in chunks] == [300, 300, 300, 100]
+    assert_array_almost_equal(expected, np.concatenate(chunks))
+
+
+def test_aconvert_eulers_cancellation():
+    async def cancel():
+        task = asyncio.ensure_future(aconvert_eulers(test_eulers, 'relion', 'dynamo',
+                                                     chunk_size=1))
+        await asyncio.sleep(0)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel())
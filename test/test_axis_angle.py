@@ -0,0 +1,56 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import euler2rotvec, rotvec2euler, matrix2axisangle, axisangle2matrix, \
+    euler2matrix
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(20, 3))
+
+
+def test_euler2rotvec_all_combinations():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            for right_handed_rotation in (True, False):
+                rotation_vectors = euler2rotvec(test_eulers, axes, intrinsic,
+                                                right_handed_rotation)
+                expected = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation)
+                angles = np.linalg.norm(rotation_vectors, axis=-1)
+                result = axisangle2matrix(rotation_vectors, angles, degrees=False)
+                assert_array_almost_equal(expected, result)
+
+                eulers = rotvec2euler(rotation_vectors, axes, intrinsic, right_handed_rotation)
+                assert_array_almost_equal(
+                    expected, euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                )
+
+
+def test_matrix2axisangle():
+    matrices = euler2matrix(test_eulers, 'zxz', True, True)
+    rotation_axes, angles = matrix2axisangle(matrices)
+    assert np.all((angles >= 0) & (angles <= 180))
+    assert_array_almost_equal(np.ones(20), np.linalg.norm(rotation_axes, axis=-1))
+    assert_array_almost_equal(matrices, axisangle2matrix(rotation_axes, angles))
+
+
+def test_small_and_half_turn_angles():
+    rotation_axes = rng.normal(size=(4, 3))
+    rotation_axes /= np.linalg.norm(rotation_axes, axis=-1, keepdims=True)
+
+    for angle in (1e-9, 180 - 1e-7, 180):
+        matrices = axisangle2matrix(rotation_axes, np.full(4, angle))
+        result_axes, result_angles = matrix2axisangle(matrices)
+        assert_array_almost_equal(np.full(4, angle), result_angles, decimal=6)
+        # Axes of half turns are only defined up to sign
+        if angle < 90:
+            assert_array_almost_equal(rotation_axes, result_axes)
+        else:
+            assert_array_almost_equal(np.ones(4), np.abs(np.sum(rotation_axes * result_axes, -1)))
+
+    rotation_vectors = euler2rotvec([1e-9, 0, 0], 'zyz', True, True, degrees=False)
+    assert_array_almost_equal([0, 0, 1e-9], rotation_vectors, decimal=15)
+
+    rotation_axes, angles = matrix2axisangle(np.eye(3))
+    assert_array_almost_equal([0, 0, 1], rotation_axes)
+    assert angles == 0
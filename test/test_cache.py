@@ -0,0 +1,147 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import ConversionCache, DiskConversionCache, convert_eulers, euler2matrix
+
+test_eulers_multiple = np.arange(30, dtype=float).reshape((10, 3))
+
+
+def test_conversion_cache_hits_and_misses():
+    cache = ConversionCache()
+    first = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    second = cache.convert_eulers(test_eulers_multiple.copy(), 'relion', 'dynamo')
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert first is second
+    assert_array_almost_equal(first, convert_eulers(test_eulers_multiple, 'relion', 'dynamo'))
+
+
+def test_conversion_cache_distinguishes_conventions():
+    cache = ConversionCache()
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    cache.convert_eulers(test_eulers_multiple, 'dynamo', 'relion')
+    cache.convert_eulers(test_eulers_multiple + 1, 'relion', 'dynamo')
+
+    assert cache.misses == 3
+    assert len(cache) == 3
+
+
+def test_conversion_cache_euler2matrix():
+    cache = ConversionCache()
+    result = cache.euler2matrix(test_eulers_multiple, 'zyz', True, True)
+    cache.euler2matrix(test_eulers_multiple, 'ZYZ', True, True)
+
+    assert cache.stats['hits'] == 1
+    assert_array_almost_equal(result, euler2matrix(test_eulers_multiple, 'zyz', True, True))
+    with pytest.raises(ValueError):
+        result[0, 0, 0] = 1
+
+
+def test_conversion_cache_distinguishes_units():
+    cache = ConversionCache()
+    degrees = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    radians = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo', degrees=False)
+    matrices = cache.euler2matrix(test_eulers_multiple, 'zyz', True, True, degrees=False)
+
+    assert cache.misses == 3
+    assert_array_almost_equal(degrees, convert_eulers(test_eulers_multiple, 'relion', 'dynamo'))
+    assert_array_almost_equal(radians, convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                                                      degrees=False))
+    assert_array_almost_equal(matrices, euler2matrix(test_eulers_multiple, 'zyz', True, True,
+                                                     degrees=False))
+
+
+def test_conversion_cache_distinguishes_precision():
+    cache = ConversionCache()
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    fast = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo', precision='fast')
+    cache.euler2matrix(test_eulers_multiple, 'zyz', True, True)
+    cache.euler2matrix(test_eulers_multiple, 'zyz', True, True, precision='fast')
+
+    assert cache.misses == 4
+    assert_array_almost_equal(fast, convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                                                   precision='fast'))
+
+
+def test_conversion_cache_lru_eviction():
+    entry_bytes = test_eulers_multiple.nbytes
+    cache = ConversionCache(max_bytes=2 * entry_bytes)
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    cache.convert_eulers(test_eulers_multiple + 1, 'relion', 'dynamo')
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    cache.convert_eulers(test_eulers_multiple + 2, 'relion', 'dynamo')
+
+    assert len(cache) == 2
+    assert cache.n_bytes <= cache.max_bytes
+
+    # most recently used entry survived eviction
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    assert cache.hits == 2
+
+
+def test_disk_conversion_cache_round_trip(tmp_path):
+    cache = DiskConversionCache(tmp_path / 'cache')
+    first = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+
+    # a second cache object, as used by another process, shares results
+    other_cache = DiskConversionCache(tmp_path / 'cache')
+    second = other_cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+
+    assert cache.misses == 1
+    assert other_cache.hits == 1
+    assert isinstance(second, np.memmap)
+    assert_array_almost_equal(first, second)
+    assert_array_almost_equal(second, convert_eulers(test_eulers_multiple, 'relion', 'dynamo'))
+
+
+def test_disk_conversion_cache_distinguishes_units_and_precision(tmp_path):
+    cache = DiskConversionCache(tmp_path / 'cache')
+    degrees = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    radians = cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo', degrees=False)
+
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo', precision='fast')
+
+    assert cache.misses == 3
+    assert_array_almost_equal(degrees, convert_eulers(test_eulers_multiple, 'relion', 'dynamo'))
+    assert_array_almost_equal(radians, convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                                                      degrees=False))
+
+
+def test_disk_conversion_cache_keyed_on_source_file(tmp_path):
+    source_file = tmp_path / 'particles.tbl'
+    source_file.write_bytes(b'header' + test_eulers_multiple.tobytes())
+    cache = DiskConversionCache(tmp_path / 'cache')
+
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                         source_file=source_file, byte_range=(6, None))
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                         source_file=source_file, byte_range=(6, None))
+    cache.convert_eulers(test_eulers_multiple, 'relion', 'dynamo',
+                         source_file=source_file, byte_range=(0, None))
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_disk_conversion_cache_eviction(tmp_path):
+    cache = DiskConversionCache(tmp_path, max_bytes=2 * test_eulers_multiple.nbytes + 512)
+    for offset in range(4):
+        cache.convert_eulers(test_eulers_multiple + offset, 'relion', 'dynamo')
+
+    assert cache.stats['entries'] == 2
+    assert cache.n_bytes <= cache.max_bytes
+
+
+def test_disk_conversion_cache_ignores_foreign_files(tmp_path):
+    foreign_file = tmp_path / 'particles.npy'
+    np.save(foreign_file, test_eulers_multiple)
+    cache = DiskConversionCache(tmp_path, max_bytes=test_eulers_multiple.nbytes + 256)
+    for offset in range(3):
+        cache.convert_eulers(test_eulers_multiple + offset, 'relion', 'dynamo')
+    assert cache.stats['entries'] == 1
+
+    cache.clear()
+    assert cache.stats['entries'] == 0
+    assert_array_almost_equal(test_eulers_multiple, np.load(foreign_file))
@@ -0,0 +1,69 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from eulerangles import ConversionMeta, euler2matrix, matrix2euler, canonicalise_eulers, \
+    hash_eulers
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-720, 720, size=(50, 3))
+
+
+def all_metas():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            for right_handed_rotation in (True, False):
+                yield ConversionMeta(name='test', axes=axes, intrinsic=intrinsic,
+                                     right_handed_rotation=right_handed_rotation, active=True)
+
+
+def test_canonicalise_eulers_preserves_rotations():
+    for meta in all_metas():
+        canonical = canonicalise_eulers(test_eulers, meta)
+        expected = euler2matrix(test_eulers, meta.axes, meta.intrinsic,
+                                meta.right_handed_rotation)
+        result = euler2matrix(canonical, meta.axes, meta.intrinsic, meta.right_handed_rotation)
+        assert_array_almost_equal(expected, result)
+        assert_array_almost_equal(canonical, canonicalise_eulers(canonical, meta))
+        assert canonical.flags.c_contiguous
+
+
+def test_canonicalise_eulers_equivalent_eulers():
+    for meta in all_metas():
+        matrices = euler2matrix(test_eulers, meta.axes, meta.intrinsic,
+                                meta.right_handed_rotation)
+        equivalent = matrix2euler(matrices, meta.axes, meta.intrinsic, meta.right_handed_rotation)
+        assert_array_almost_equal(canonicalise_eulers(test_eulers, meta),
+                                  canonicalise_eulers(equivalent, meta))
+
+
+def test_canonicalise_eulers_gimbal_lock():
+    for meta in all_metas():
+        second = 90 if meta.axes[0] != meta.axes[2] else 0
+        for second in (second, second - 180):
+            eulers = np.array([10, second, 30])
+            matrix = euler2matrix(eulers, meta.axes, meta.intrinsic, meta.right_handed_rotation)
+            equivalent = matrix2euler(matrix, meta.axes, meta.intrinsic,
+                                      meta.right_handed_rotation)
+
+            canonical = canonicalise_eulers(eulers, meta)
+            assert_array_almost_equal(canonical, canonicalise_eulers(equivalent, meta))
+            assert canonical[2 if not meta.intrinsic else 0] == 0
+            assert_array_almost_equal(
+                matrix, euler2matrix(canonical, meta.axes, meta.intrinsic,
+                                     meta.right_handed_rotation)
+            )
+
+
+def test_canonicalise_eulers_radians():
+    canonical = canonicalise_eulers(test_eulers, 'relion')
+    result = canonicalise_eulers(np.deg2rad(test_eulers), 'relion', degrees=False)
+    assert_array_almost_equal(np.deg2rad(canonical), result)
+
+
+def test_hash_eulers():
+    eulers = np.array([[10, 20, 30], [370, 20, -330], [190, -20, 210], [10, 21, 30]])
+    hashes = hash_eulers(eulers, 'relion', resolution=0.5)
+    assert hashes.dtype == np.int64
+    assert_array_equal(hashes[:3], hashes[0])
+    assert hashes[3] != hashes[0]
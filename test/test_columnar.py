@@ -0,0 +1,47 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import euler2matrix, matrix2euler, convert_eulers, euler2matrix_columns, \
+    matrix2euler_columns, convert_eulers_columns
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(10, 3))
+
+
+def test_euler2matrix_columns_all_combinations():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            for right_handed_rotation in (True, False):
+                expected = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation)
+                result = euler2matrix_columns(test_eulers.T, axes, intrinsic,
+                                              right_handed_rotation)
+                assert result.shape == (3, 3, 10)
+                assert result.flags.c_contiguous
+                assert_array_almost_equal(expected, result.transpose((2, 0, 1)))
+
+
+def test_matrix2euler_columns_all_combinations():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            for right_handed_rotation in (True, False):
+                matrices = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation)
+                expected = matrix2euler(matrices, axes, intrinsic, right_handed_rotation)
+                result = matrix2euler_columns(np.ascontiguousarray(matrices.transpose((1, 2, 0))),
+                                              axes, intrinsic, right_handed_rotation)
+                assert result.shape == (3, 10)
+                assert all(row.flags.contiguous for row in result)
+                assert_array_almost_equal(expected, result.T)
+                assert expected.flags.c_contiguous
+
+    with pytest.raises(ValueError):
+        matrix2euler_columns(euler2matrix(test_eulers, 'zyz', True, True), 'zyz', True, True)
+
+
+def test_convert_eulers_columns():
+    columns = [np.ascontiguousarray(test_eulers[:, idx]) for idx in range(3)]
+    result = convert_eulers_columns(columns, source_meta='relion', target_meta='dynamo')
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+    assert_array_almost_equal(expected, result.T)
+    assert expected.flags.c_contiguous
@@ -0,0 +1,60 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import ConversionMeta, compose_eulers, invert_eulers, euler2matrix, \
+    convert_eulers
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers_a = rng.uniform(-180, 180, size=(30, 3))
+test_eulers_b = rng.uniform(-180, 180, size=(30, 3))
+
+
+def relion_matrices(eulers):
+    return euler2matrix(eulers, 'zyz', True, True)
+
+
+def test_compose_eulers():
+    result = compose_eulers(test_eulers_a, test_eulers_b, 'relion', 'relion', chunk_size=7)
+    expected = relion_matrices(test_eulers_a) @ relion_matrices(test_eulers_b)
+    assert_array_almost_equal(expected, relion_matrices(result))
+
+    # Broadcasting a single global rotation
+    result = compose_eulers(test_eulers_a[0], test_eulers_b, 'relion', 'relion')
+    expected = relion_matrices(test_eulers_a[0]) @ relion_matrices(test_eulers_b)
+    assert result.shape == (30, 3)
+    assert_array_almost_equal(expected, relion_matrices(result))
+
+    result = compose_eulers(test_eulers_a[0], test_eulers_b[0], 'relion', 'relion')
+    assert result.shape == (3,)
+
+
+def test_compose_eulers_mixed_conventions():
+    active_meta = ConversionMeta(name='active', axes='xyz', intrinsic=False,
+                                 right_handed_rotation=False, active=True)
+    eulers_b = convert_eulers(test_eulers_b, 'relion', active_meta)
+    result = compose_eulers(test_eulers_a, eulers_b, 'relion', active_meta,
+                            target_meta='dynamo')
+    expected = compose_eulers(test_eulers_a, test_eulers_b, 'relion', 'relion')
+    assert_array_almost_equal(relion_matrices(expected),
+                              relion_matrices(convert_eulers(result, 'dynamo', 'relion')))
+
+
+def test_invert_eulers_all_axes():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            meta = ConversionMeta(name='test', axes=axes, intrinsic=intrinsic,
+                                  right_handed_rotation=True, active=True)
+            matrices = euler2matrix(test_eulers_a, axes, intrinsic, True)
+            result = invert_eulers(test_eulers_a, meta)
+            assert_array_almost_equal(matrices.swapaxes(-1, -2),
+                                      euler2matrix(result, axes, intrinsic, True))
+
+
+def test_invert_eulers_to_other_convention():
+    result = invert_eulers(test_eulers_a, 'relion', target_meta='dynamo')
+    expected = invert_eulers(test_eulers_a, 'relion')
+    assert_array_almost_equal(relion_matrices(expected),
+                              relion_matrices(convert_eulers(result, 'dynamo', 'relion')))
+    assert result.flags.c_contiguous and expected.flags.c_contiguous
+    assert invert_eulers(test_eulers_a[0], 'relion', target_meta='dynamo').shape == (3,)
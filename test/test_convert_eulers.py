@@ -1,9 +1,18 @@
+import numpy as np
 from numpy.testing import assert_array_almost_equal
+import pytest
 
-from eulerangles import convert_eulers
+from eulerangles import ConversionMeta, convert_eulers, convert_eulers_many, convert_matrices, \
+    euler2matrix
+from eulerangles.utils import get_conversion_metadata
 
 dynamo_eulers = [-47.2730, 1.1777, -132.3000]
 relion_eulers = [137.7000, 1.1777, 42.7270]
+active_meta = ConversionMeta(name='active',
+                             axes='xyz',
+                             intrinsic=False,
+                             right_handed_rotation=False,
+                             active=True)
 
 
 def test_convert_eulers_dynamo_to_relion():
@@ -18,3 +27,47 @@ def test_convert_eulers_relion_to_dynamo():
                                    source_meta='relion',
                                    target_meta='dynamo')
     assert_array_almost_equal(dynamo_eulers, result_eulers, decimal=5)
+
+
+def test_convert_eulers_many():
+    eulers = np.arange(30, dtype=float).reshape((10, 3))
+    targets = ['dynamo', 'warp', active_meta]
+    result = convert_eulers_many(eulers, source_meta='relion', targets=targets)
+
+    assert list(result.keys()) == ['dynamo', 'warp', 'active']
+    for target, key in zip(targets, result):
+        expected = convert_eulers(eulers, source_meta='relion', target_meta=target)
+        assert_array_almost_equal(expected, result[key])
+
+
+def test_convert_eulers_many_duplicate_keys():
+    renamed_meta = ConversionMeta(name='active', axes='zyz', intrinsic=True,
+                                  right_handed_rotation=True, active=False)
+    with pytest.raises(ValueError):
+        convert_eulers_many(dynamo_eulers, source_meta='dynamo',
+                            targets=[active_meta, renamed_meta])
+    with pytest.raises(ValueError):
+        convert_eulers_many(dynamo_eulers, source_meta='dynamo', targets=['relion', 'relion'])
+
+
+def test_convert_eulers_many_single():
+    result = convert_eulers_many(dynamo_eulers, source_meta='dynamo', targets=['relion'])
+    assert_array_almost_equal(relion_eulers, result['relion'], decimal=5)
+
+
+def test_convert_matrices_matches_convert_eulers():
+    eulers = np.arange(30, dtype=float).reshape((10, 3))
+    relion_meta = get_conversion_metadata('relion')
+    for target_meta in (get_conversion_metadata('dynamo'), active_meta):
+        relion_matrices = euler2matrix(eulers,
+                                       axes=relion_meta.axes,
+                                       intrinsic=relion_meta.intrinsic,
+                                       right_handed_rotation=relion_meta.right_handed_rotation)
+        target_eulers = convert_eulers(eulers, source_meta=relion_meta, target_meta=target_meta)
+        target_matrices = euler2matrix(target_eulers,
+                                       axes=target_meta.axes,
+                                       intrinsic=target_meta.intrinsic,
+                                       right_handed_rotation=target_meta.right_handed_rotation)
+
+        result = convert_matrices(relion_matrices, source_meta='relion', target_meta=target_meta)
+        assert_array_almost_equal(target_matrices, result)
@@ -0,0 +1,53 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import euler2matrix, matrix2euler, euler2euler, convert_eulers
+
+da = pytest.importorskip('dask.array')
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(100, 3))
+test_matrices = euler2matrix(test_eulers, axes='zyz', intrinsic=True, right_handed_rotation=True)
+
+
+def test_euler2matrix_dask():
+    eulers = da.from_array(test_eulers, chunks=(30, 2))
+    result = euler2matrix(eulers, axes='zyz', intrinsic=True, right_handed_rotation=True)
+
+    assert isinstance(result, da.Array)
+    assert result.shape == (100, 3, 3)
+    assert result.chunks == ((30, 30, 30, 10), (3,), (3,))
+    assert_array_almost_equal(test_matrices, result.compute(scheduler='threads'))
+
+
+def test_matrix2euler_dask():
+    matrices = da.from_array(test_matrices, chunks=(30, 3, 3))
+    result = matrix2euler(matrices, axes='zxz', intrinsic=False, right_handed_rotation=True)
+    expected = matrix2euler(test_matrices, axes='zxz', intrinsic=False, right_handed_rotation=True)
+
+    assert isinstance(result, da.Array)
+    assert result.chunks == ((30, 30, 30, 10), (3,))
+    assert_array_almost_equal(expected, result.compute(scheduler='threads'))
+
+
+def test_euler2euler_dask_single():
+    eulers = da.from_array(test_eulers[0])
+    result = euler2euler(eulers, 'zyz', True, True, 'xyz', False, False, invert_matrix=True)
+    expected = euler2euler(test_eulers[0], 'zyz', True, True, 'xyz', False, False,
+                           invert_matrix=True)
+
+    assert result.shape == (3,)
+    assert_array_almost_equal(expected, result.compute(scheduler='threads'))
+
+
+def test_convert_eulers_dask_distributed():
+    distributed = pytest.importorskip('distributed')
+    eulers = da.from_array(test_eulers, chunks=(25, 3))
+    result = convert_eulers(eulers, source_meta='relion', target_meta='dynamo')
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+
+    with distributed.LocalCluster(n_workers=2, processes=False,
+                                  dashboard_address=None) as cluster:
+        with distributed.Client(cluster) as client:
+            assert_array_almost_equal(expected, client.compute(result).result())
@@ -0,0 +1,51 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import ConversionMeta, angular_distance, convert_eulers, euler2matrix
+
+rng = np.random.default_rng(0)
+test_eulers_a = rng.uniform(-180, 180, size=(50, 3))
+test_eulers_b = rng.uniform(-180, 180, size=(50, 3))
+
+
+def reference_distance(eulers_a, eulers_b):
+    matrices_a = euler2matrix(eulers_a, 'zyz', True, True)
+    matrices_b = euler2matrix(eulers_b, 'zyz', True, True)
+    trace = np.trace(matrices_a.swapaxes(-1, -2) @ matrices_b, axis1=-2, axis2=-1)
+    return np.rad2deg(np.arccos(np.clip((trace - 1) / 2, -1, 1)))
+
+
+def test_angular_distance():
+    expected = reference_distance(test_eulers_a, test_eulers_b)
+    result = angular_distance(test_eulers_a, test_eulers_b, 'relion', 'relion', chunk_size=7)
+    assert_array_almost_equal(expected, result)
+
+
+def test_angular_distance_across_conventions():
+    active_meta = ConversionMeta(name='active', axes='xyz', intrinsic=False,
+                                 right_handed_rotation=False, active=True)
+    converted = convert_eulers(test_eulers_a, source_meta='relion', target_meta=active_meta)
+    result = angular_distance(test_eulers_a, converted, 'relion', active_meta)
+    assert_array_almost_equal(np.zeros(50), result)
+
+
+def test_angular_distance_small_angles():
+    result = angular_distance([10, 20, 30], [10, 20, 30 + 1e-6], 'relion', 'relion')
+    assert np.isclose(result, 1e-6, rtol=1e-3)
+
+
+def test_angular_distance_symmetry():
+    # C4 symmetry about z
+    symmetry = euler2matrix(np.array([[0, 0, 0], [90, 0, 0], [180, 0, 0], [270, 0, 0]]),
+                            'zyz', True, True)
+    eulers_b = test_eulers_a + [0, 0, 90]
+    assert np.all(angular_distance(test_eulers_a, eulers_b, 'relion', 'relion') > 1)
+
+    result = angular_distance(test_eulers_a, eulers_b, 'relion', 'relion', symmetry=symmetry)
+    assert_array_almost_equal(np.zeros(50), result)
+
+    expected = np.min([reference_distance(test_eulers_a, test_eulers_b + [0, 0, angle])
+                       for angle in (0, 90, 180, 270)], axis=0)
+    result = angular_distance(test_eulers_a, test_eulers_b, 'relion', 'relion',
+                              symmetry=symmetry)
+    assert_array_almost_equal(expected, result)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import ConversionMeta, euler2matrix, matrix2euler, euler2euler, \
+    convert_eulers, angular_distance, matrix2quaternion
+from eulerangles.distances import quaternion_angular_distance
+from eulerangles.math.constants import valid_axes
+from eulerangles.math.fast_trig import fast_max_angular_error, sin_cos_fast
+from eulerangles.math.rotation_matrix_to_eulers import matrix2euler_well_conditioned
+
+rng = np.random.default_rng(0)
+# Include angles well outside [-180, 180] and angles close to gimbal lock
+test_eulers = np.concatenate([rng.uniform(-180, 180, size=(2000, 3)),
+                              rng.uniform(-3600, 3600, size=(200, 3)),
+                              np.array([[10, 1e-5, 20], [10, 180 - 1e-5, 20], [10, 90, 20]])])
+conventions = [(axes, intrinsic, right_handed_rotation)
+               for axes in valid_axes
+               for intrinsic in (True, False)
+               for right_handed_rotation in (True, False)]
+
+
+def matrix_angular_error(matrices_a, matrices_b):
+    quaternion_distances = quaternion_angular_distance(matrix2quaternion(matrices_a),
+                                                       matrix2quaternion(matrices_b))
+    return np.rad2deg(quaternion_distances)
+
+
+def test_sin_cos_fast():
+    theta = rng.uniform(-1000, 1000, size=10000)
+    sin_theta, cos_theta = sin_cos_fast(theta)
+    assert np.abs(sin_theta - np.sin(theta)).max() < 1e-6
+    assert np.abs(cos_theta - np.cos(theta)).max() < 1e-6
+
+
+@pytest.mark.parametrize('axes, intrinsic, right_handed_rotation', conventions)
+def test_euler2matrix_fast_error_budget(axes, intrinsic, right_handed_rotation):
+    exact = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation)
+    fast = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation, precision='fast')
+    assert matrix_angular_error(exact, fast).max() < fast_max_angular_error
+
+
+@pytest.mark.parametrize('axes, intrinsic, right_handed_rotation', conventions)
+def test_euler2euler_fast_error_budget(axes, intrinsic, right_handed_rotation):
+    kwargs = dict(source_axes='zyz', source_right_handed_rotation=True, source_intrinsic=True,
+                  target_axes=axes, target_right_handed_rotation=right_handed_rotation,
+                  target_intrinsic=intrinsic, invert_matrix=False)
+    exact = euler2euler(test_eulers, **kwargs)
+    fast = euler2euler(test_eulers, **kwargs, precision='fast')
+    meta = ConversionMeta(name='test', axes=axes, intrinsic=intrinsic,
+                          right_handed_rotation=right_handed_rotation, active=True)
+    assert angular_distance(exact, fast, meta, meta).max() < fast_max_angular_error
+
+
+@pytest.mark.parametrize('axes, intrinsic, right_handed_rotation', conventions)
+def test_matrix2euler_well_conditioned(axes, intrinsic, right_handed_rotation):
+    matrices = euler2matrix(test_eulers, axes, intrinsic, right_handed_rotation)
+    result = matrix2euler_well_conditioned(matrices, axes, intrinsic, right_handed_rotation)
+    assert result.flags.c_contiguous
+    assert_array_almost_equal(matrix2euler(matrices, axes, intrinsic, right_handed_rotation),
+                              result)
+    assert_array_almost_equal(matrices,
+                              euler2matrix(result, axes, intrinsic, right_handed_rotation))
+
+
+def test_convert_eulers_fast():
+    exact = convert_eulers(test_eulers, 'relion', 'dynamo')
+    fast = convert_eulers(test_eulers, 'relion', 'dynamo', precision='fast')
+    assert angular_distance(exact, fast, 'dynamo', 'dynamo').max() < fast_max_angular_error
+
+
+def test_invalid_precision():
+    with pytest.raises(ValueError):
+        euler2matrix(test_eulers[0], 'zyz', True, True, precision='approximate')
+    with pytest.raises(ValueError):
+        convert_eulers(test_eulers[0], 'relion', 'dynamo', precision='approximate')
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from eulerangles import ViewingDirectionHistogram, random_rotations, convert_eulers
+
+
+def test_histogram_is_equal_area():
+    eulers = random_rotations(200_000, 'relion', seed=0)
+    histogram = ViewingDirectionHistogram(n_tilt_bins=10, n_rot_bins=20)
+    histogram.add(eulers, 'relion', chunk_size=30_000)
+
+    assert histogram.n_total == 200_000
+    expected = 200_000 / 200
+    assert np.all(np.abs(histogram.counts - expected) < 5 * np.sqrt(expected))
+
+
+def test_histogram_bins():
+    eulers = np.array([[0, 0, 0],
+                       [45, 100, 10],
+                       [-135, 179, -170]])
+    histogram = ViewingDirectionHistogram(n_tilt_bins=4, n_rot_bins=4, n_psi_bins=2)
+    histogram.add(eulers, 'relion')
+
+    expected = np.zeros((4, 4, 2), dtype=int)
+    expected[0, 2, 1] = 1
+    expected[2, 2, 1] = 1
+    expected[3, 0, 0] = 1
+    assert_array_equal(expected, histogram.counts)
+
+
+def test_histogram_conventions_and_merge(tmp_path):
+    eulers = random_rotations(1000, 'relion', seed=1)
+    histogram = ViewingDirectionHistogram(n_psi_bins=8).add(eulers, 'relion')
+
+    # Partial histograms from other conventions merge to the same counts
+    dynamo_eulers = convert_eulers(eulers, 'relion', 'dynamo')
+    merged = ViewingDirectionHistogram(n_psi_bins=8).add(dynamo_eulers[:400], 'dynamo')
+    merged.merge(ViewingDirectionHistogram(n_psi_bins=8).add(dynamo_eulers[400:], 'dynamo'))
+    assert_array_equal(histogram.counts, merged.counts)
+
+    with pytest.raises(ValueError):
+        merged.merge(ViewingDirectionHistogram())
+
+    filename = tmp_path / 'histogram.npz'
+    histogram.save(filename)
+    loaded = ViewingDirectionHistogram.load(filename)
+    assert loaded.shape == histogram.shape
+    assert_array_equal(histogram.counts, loaded.counts)
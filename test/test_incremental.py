@@ -0,0 +1,101 @@
+import os
+
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import IncrementalConverter, convert_eulers, random_rotations
+
+test_eulers = random_rotations(100, 'relion', seed=0)
+expected_eulers = convert_eulers(test_eulers, 'relion', 'dynamo')
+
+
+def test_incremental_array(tmp_path):
+    state_file = tmp_path / 'state.json'
+    converter = IncrementalConverter('relion', 'dynamo', state_file=state_file)
+    assert_array_almost_equal(expected_eulers[:40], converter.update(test_eulers[:40]))
+    assert converter.update(test_eulers[:40]).shape == (0, 3)
+
+    # State persists between runs
+    converter = IncrementalConverter('relion', 'dynamo', state_file=state_file)
+    assert converter.n_rows == 40
+    assert_array_almost_equal(expected_eulers[40:], converter.update(test_eulers))
+
+    with pytest.raises(ValueError):
+        converter.update(test_eulers[:50])
+    converter.reset()
+    assert_array_almost_equal(expected_eulers[:50], converter.update(test_eulers[:50]))
+
+    with pytest.raises(ValueError):
+        IncrementalConverter('relion', 'warp', state_file=state_file)
+
+
+def test_incremental_file(tmp_path):
+    filename = tmp_path / 'particles.star'
+    state_file = tmp_path / 'state.json'
+    lines = [f'{rot} {tilt} {psi} particle_{idx:03d}.mrc\n'
+             for idx, (rot, tilt, psi) in enumerate(test_eulers)]
+    header = '\ndata_particles\n\nloop_\n_rlnAngleRot #1\n_rlnAngleTilt #2\n_rlnAnglePsi #3\n'
+    comments = ('#', 'data_', 'loop_', '_')
+
+    # Last line partially written
+    filename.write_text(header + ''.join(lines[:30]) + lines[30][:5])
+    converter = IncrementalConverter('relion', 'dynamo', state_file=state_file)
+    result = converter.update_file(filename, comments=comments)
+    assert_array_almost_equal(expected_eulers[:30], result)
+
+    with open(filename, 'a') as file:
+        file.write(lines[30][5:] + ''.join(lines[31:]))
+    converter = IncrementalConverter('relion', 'dynamo', state_file=state_file)
+    result = converter.update_file(filename, comments=comments)
+    assert_array_almost_equal(expected_eulers[30:], result)
+    assert converter.n_rows == 100
+    assert converter.update_file(filename, comments=comments).shape == (0, 3)
+
+    with pytest.raises(ValueError):
+        converter.update(test_eulers)
+    with pytest.raises(ValueError):
+        converter.update_file(tmp_path / 'other.star')
+
+    filename.write_text(header)
+    with pytest.raises(ValueError):
+        converter.update_file(filename, comments=comments)
+
+
+def test_incremental_file_relative_path(tmp_path, monkeypatch):
+    filename = tmp_path / 'particles.txt'
+    filename.write_text(''.join(f'{rot} {tilt} {psi}\n' for rot, tilt, psi in test_eulers[:10]))
+    monkeypatch.chdir(tmp_path)
+    converter = IncrementalConverter('relion', 'dynamo')
+    converter.update_file('particles.txt')
+    assert converter.source_file == os.path.abspath('particles.txt')
+    assert converter.update_file(filename).shape == (0, 3)
+
+
+def test_incremental_file_replaced(tmp_path):
+    filename = tmp_path / 'particles.txt'
+    lines = [f'{rot} {tilt} {psi}\n' for rot, tilt, psi in test_eulers]
+    filename.write_text(''.join(lines[:10]))
+    converter = IncrementalConverter('relion', 'dynamo', state_file=tmp_path / 'state.json')
+    converter.update_file(filename)
+
+    # Rewritten by renaming a longer file with the same converted rows over the original
+    replacement = tmp_path / 'replacement.txt'
+    replacement.write_text(''.join(lines[:20]))
+    os.replace(replacement, filename)
+    converter = IncrementalConverter('relion', 'dynamo', state_file=tmp_path / 'state.json')
+    assert_array_almost_equal(expected_eulers[10:20], converter.update_file(filename))
+
+    # Replaced in place and by renaming, longer than the converted offset in both cases
+    filename.write_text(''.join(lines[50:]))
+    with pytest.raises(ValueError):
+        converter.update_file(filename)
+    replacement.write_text(''.join(lines[:5] + lines[50:]))
+    os.replace(replacement, filename)
+    converter = IncrementalConverter('relion', 'dynamo', state_file=tmp_path / 'state.json')
+    with pytest.raises(ValueError):
+        converter.update_file(filename)
+
+    converter.reset()
+    result = converter.update_file(filename)
+    assert_array_almost_equal(expected_eulers[:5], result[:5])
+    assert_array_almost_equal(expected_eulers[50:], result[5:])
@@ -0,0 +1,78 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import interpolate_eulers, resample_eulers, angular_distance, euler2matrix, \
+    convert_eulers
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(6, 3))
+test_times = np.array([0, 1, 2.5, 3, 5, 6])
+
+
+def test_interpolation_hits_samples():
+    for method in ('slerp', 'squad'):
+        result = interpolate_eulers(test_times, test_eulers, test_times, 'relion',
+                                    method=method, output='matrices')
+        assert_array_almost_equal(euler2matrix(test_eulers, 'zyz', True, True), result)
+
+
+def test_slerp_midpoints():
+    query_times = (test_times[1:] + test_times[:-1]) / 2
+    result = interpolate_eulers(test_times, test_eulers, query_times, 'relion')
+    distances_start = angular_distance(test_eulers[:-1], result, 'relion', 'relion')
+    distances_end = angular_distance(result, test_eulers[1:], 'relion', 'relion')
+    total_distances = angular_distance(test_eulers[:-1], test_eulers[1:], 'relion', 'relion')
+    assert_array_almost_equal(total_distances / 2, distances_start)
+    assert_array_almost_equal(total_distances / 2, distances_end)
+
+
+def test_uniform_rotation():
+    # Constant angular velocity about a single axis is reproduced exactly by both methods
+    eulers = np.stack([np.zeros(5), np.arange(5) * 20, np.zeros(5)], axis=-1)
+    query_times = np.linspace(-1, 5, 25)
+    expected = np.stack([np.zeros(25), np.clip(query_times, 0, 4) * 20, np.zeros(25)], axis=-1)
+    for method in ('slerp', 'squad'):
+        result = interpolate_eulers(np.arange(5), eulers, query_times, 'relion', method=method,
+                                    output='matrices')
+        assert_array_almost_equal(euler2matrix(expected, 'zyz', True, True), result)
+
+    # Also for unevenly spaced times
+    uneven_times = np.array([0, 0.5, 2, 2.5, 4])
+    eulers = np.stack([np.zeros(5), uneven_times * 20, np.zeros(5)], axis=-1)
+    query_times = np.linspace(0, 4, 25)
+    expected = np.stack([np.zeros(25), query_times * 20, np.zeros(25)], axis=-1)
+    result = interpolate_eulers(uneven_times, eulers, query_times, 'relion', method='squad',
+                                output='matrices')
+    assert_array_almost_equal(euler2matrix(expected, 'zyz', True, True), result)
+
+
+def test_squad_continuous_angular_velocity():
+    # Angular velocity either side of each inner sample agrees for unevenly spaced times
+    step = 1e-6
+    query_times = np.stack([test_times[1:-1] - step, test_times[1:-1],
+                            test_times[1:-1] + step], axis=-1).reshape(-1)
+    matrices = interpolate_eulers(test_times, test_eulers, query_times, 'relion',
+                                  method='squad', output='matrices').reshape((-1, 3, 3, 3))
+    before = matrices[:, 1] @ matrices[:, 0].swapaxes(-1, -2)
+    after = matrices[:, 2] @ matrices[:, 1].swapaxes(-1, -2)
+    assert_array_almost_equal((before - np.eye(3)) / step, (after - np.eye(3)) / step, decimal=3)
+
+
+def test_interpolation_batched_and_converted():
+    batch = np.stack([test_eulers, test_eulers[::-1]])
+    query_times = np.linspace(0, 6, 11)
+    result = interpolate_eulers(test_times, batch, query_times, 'relion', target_meta='dynamo',
+                                method='squad')
+    assert result.shape == (2, 11, 3)
+    for idx in range(2):
+        single = interpolate_eulers(test_times, batch[idx], query_times, 'relion',
+                                    method='squad')
+        distances = angular_distance(convert_eulers(single, 'relion', 'dynamo'), result[idx],
+                                     'dynamo', 'dynamo')
+        assert_array_almost_equal(np.zeros(11), distances)
+
+
+def test_resample_eulers():
+    result = resample_eulers(test_eulers, 11, 'relion', output='matrices')
+    assert result.shape == (11, 3, 3)
+    assert_array_almost_equal(euler2matrix(test_eulers, 'zyz', True, True), result[::2])
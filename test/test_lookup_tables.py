@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import euler2matrix
+from eulerangles.math.constants import valid_axes
+from eulerangles.math.lookup_tables import grid_indices, n_memoised_tables, trig_lookup_table
+from eulerangles.math.rotation_matrices.angle_to_matrix import theta2rotm
+
+rng = np.random.default_rng(0)
+grid_eulers = rng.integers(-720, 720, size=(100, 3)) * 0.5
+
+
+def test_euler2matrix_lookup_all_combinations():
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            for right_handed_rotation in (True, False):
+                expected = euler2matrix(grid_eulers, axes, intrinsic, right_handed_rotation)
+                for angular_step in (0.5, 0.25, 'auto'):
+                    result = euler2matrix(grid_eulers, axes, intrinsic, right_handed_rotation,
+                                          angular_step=angular_step)
+                    assert_array_almost_equal(expected, result, decimal=12)
+
+
+def test_lookup_radians_and_large_angles():
+    theta = np.deg2rad(rng.integers(-5000, 5000, size=100) * 1.0)
+    expected = theta2rotm(theta, 'y', degrees=False)
+    result = theta2rotm(theta, 'y', degrees=False, angular_step=np.deg2rad(1))
+    assert_array_almost_equal(expected, result, decimal=12)
+
+    result = theta2rotm(theta, 'y', degrees=False, angular_step='auto')
+    assert_array_almost_equal(expected, result, decimal=12)
+
+
+def test_lookup_off_grid_fallback():
+    eulers = grid_eulers + 0.1
+    assert grid_indices(eulers[:, 0], 0.5) is None
+    assert_array_almost_equal(euler2matrix(eulers, 'zyz', True, True),
+                              euler2matrix(eulers, 'zyz', True, True, angular_step=0.5))
+
+
+def test_lookup_tables_are_memoised():
+    cos_table, sin_table = trig_lookup_table(720)
+    assert trig_lookup_table(720)[0] is cos_table
+    assert not cos_table.flags.writeable
+
+    with pytest.raises(ValueError):
+        grid_indices(grid_eulers[:, 0], 0.7)
+
+
+def test_lookup_tables_are_bounded():
+    # Sweeping over many angular steps keeps a bounded number of tables in memory
+    for n_bins in range(1000, 1000 + 2 * n_memoised_tables):
+        trig_lookup_table(n_bins)
+    assert trig_lookup_table.cache_info().currsize == n_memoised_tables
@@ -1,7 +1,7 @@
 import numpy as np
 from numpy.testing import assert_array_almost_equal
 
-from eulerangles import matrix2euler
+from eulerangles import euler2matrix, matrix2euler
 from eulerangles.math.constants import valid_axes
 from eulerangles.utils import get_conversion_metadata
 
@@ -51,3 +51,16 @@ def test_matrix2euler_relion():
                                  right_handed_rotation=relion_meta.right_handed_rotation)
 
     assert_array_almost_equal(relion_eulers, result_eulers, decimal=4)
+
+
+def test_matrix2euler_gimbal_lock_detection():
+    # Matrix entries vanish for first and third angles of +-90 without gimbal lock
+    eulers = np.array([[90, 40, 30], [30, 40, 90], [-90, 40, -90], [10, 1e-6, 20]])
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            matrices = euler2matrix(eulers, axes, intrinsic, True)
+            for matrix in matrices:
+                result = matrix2euler(matrix, axes, intrinsic, True)
+                assert_array_almost_equal(matrix, euler2matrix(result, axes, intrinsic, True))
+            result = matrix2euler(matrices, axes, intrinsic, True)
+            assert_array_almost_equal(matrices, euler2matrix(result, axes, intrinsic, True))
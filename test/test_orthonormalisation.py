@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import matrix2euler, euler2matrix, random_rotations, \
+    rotation_matrix_residuals, is_rotation_matrix, orthonormalise_rotation_matrices
+
+rng = np.random.default_rng(0)
+test_matrices = random_rotations(1000, output='matrices', seed=0)
+noisy_matrices = test_matrices + rng.normal(scale=1e-6, size=test_matrices.shape)
+
+
+def test_rotation_matrix_residuals():
+    determinant_residuals, orthonormality_residuals = rotation_matrix_residuals(test_matrices)
+    assert np.all(determinant_residuals < 1e-12)
+    assert np.all(orthonormality_residuals < 1e-12)
+    assert np.all(is_rotation_matrix(test_matrices))
+
+    assert not np.any(is_rotation_matrix(noisy_matrices))
+    reflections = test_matrices * -1
+    assert not np.any(is_rotation_matrix(reflections))
+    assert not is_rotation_matrix(np.full((3, 3), np.nan))[0]
+
+
+@pytest.mark.parametrize('method', ['newton', 'svd'])
+def test_orthonormalise_rotation_matrices(method):
+    result = orthonormalise_rotation_matrices(noisy_matrices, method=method, chunk_size=300)
+    assert np.all(is_rotation_matrix(result, tolerance=1e-12))
+    assert_array_almost_equal(test_matrices, result, decimal=5)
+
+    # Reflections and matrices far from rotations are mapped onto proper rotations
+    distorted = test_matrices[:3] * [[[-1]], [[5]], [[0.1]]]
+    result = orthonormalise_rotation_matrices(distorted, method=method)
+    assert np.all(is_rotation_matrix(result, tolerance=1e-12))
+    assert_array_almost_equal(test_matrices[1:3], result[1:3])
+
+    assert orthonormalise_rotation_matrices(noisy_matrices[0], method=method).shape == (3, 3)
+
+
+@pytest.mark.parametrize('method', ['newton', 'svd'])
+def test_orthonormalise_rotation_matrices_leaves_input_unchanged(method):
+    # Reflections are orthonormal, the Newton path needs no iterations and falls back to SVD
+    reflections = -random_rotations(4, output='matrices', seed=1)
+    original = reflections.copy()
+    result = orthonormalise_rotation_matrices(reflections, method=method)
+    assert np.all(is_rotation_matrix(result, tolerance=1e-12))
+    np.testing.assert_array_equal(original, reflections)
+
+    matrix2euler(reflections, 'zyz', True, True, orthonormalise=method)
+    np.testing.assert_array_equal(original, reflections)
+
+
+def test_matrix2euler_pre_stage():
+    # Accumulated error pushes an entry past 1, arccos returns NaN
+    drifted = euler2matrix(np.array([[10, 0, 30], [50, 20, 40]]), 'zyz', True, True)
+    drifted[:, 2, 2] += 1e-12
+    with pytest.warns(RuntimeWarning):
+        assert np.any(np.isnan(matrix2euler(drifted, 'zyz', True, True)))
+
+    result = matrix2euler(drifted, 'zyz', True, True, orthonormalise='newton')
+    assert not np.any(np.isnan(result))
+    assert_array_almost_equal(drifted, euler2matrix(result, 'zyz', True, True))
+
+    with pytest.raises(ValueError):
+        matrix2euler(noisy_matrices, 'zyz', True, True, validate=True)
+    result = matrix2euler(noisy_matrices, 'zyz', True, True, orthonormalise='svd',
+                          validate=True)
+    assert_array_almost_equal(matrix2euler(test_matrices, 'zyz', True, True), result, decimal=3)
@@ -0,0 +1,40 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import convert_eulers
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('eulerangles.pandas_accessor')
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(100, 3))
+relion_columns = ['rlnAngleRot', 'rlnAngleTilt', 'rlnAnglePsi']
+
+
+def test_dataframe_accessor_in_place():
+    df = pd.DataFrame(test_eulers, columns=relion_columns)
+    df['rlnImageName'] = 'particle'
+    result = df.eulers.convert(cols=relion_columns, source='relion', target='dynamo',
+                               chunk_size=30)
+
+    assert result is df
+    assert list(df.columns) == relion_columns + ['rlnImageName']
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+    assert_array_almost_equal(expected, df[relion_columns].to_numpy())
+
+
+def test_dataframe_accessor_new_columns():
+    df = pd.DataFrame(test_eulers, columns=relion_columns)
+    df.eulers.convert(cols=relion_columns, source='relion', target='dynamo',
+                      output_cols=['tdrot', 'tilt', 'narot'])
+
+    assert_array_almost_equal(test_eulers, df[relion_columns].to_numpy())
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+    assert_array_almost_equal(expected, df[['tdrot', 'tilt', 'narot']].to_numpy())
+
+
+def test_dataframe_accessor_requires_three_columns():
+    df = pd.DataFrame(test_eulers, columns=relion_columns)
+    with pytest.raises(ValueError):
+        df.eulers.convert(cols=relion_columns[:2], source='relion', target='dynamo')
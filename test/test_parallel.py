@@ -0,0 +1,26 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import convert_eulers, convert_eulers_parallel
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(1000, 3))
+
+
+def test_convert_eulers_parallel():
+    expected = convert_eulers(test_eulers, source_meta='relion', target_meta='dynamo')
+    result = convert_eulers_parallel(test_eulers, source_meta='relion', target_meta='dynamo',
+                                     n_workers=2, chunk_size=300)
+    assert_array_almost_equal(expected, result)
+
+
+def test_convert_eulers_parallel_shared_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        for eulers in (test_eulers, test_eulers[0]):
+            expected = convert_eulers(eulers, source_meta='dynamo', target_meta='warp')
+            result = convert_eulers_parallel(eulers, source_meta='dynamo', target_meta='warp',
+                                             executor=executor)
+            assert result.shape == expected.shape
+            assert_array_almost_equal(expected, result)
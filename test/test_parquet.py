@@ -0,0 +1,64 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+import pytest
+
+from eulerangles import convert_eulers, euler2matrix, ConversionMeta
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+eulerangles_parquet = pytest.importorskip('eulerangles.parquet')
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(100, 3))
+relion_columns = ['rlnAngleRot', 'rlnAngleTilt', 'rlnAnglePsi']
+
+
+@pytest.fixture
+def relion_parquet(tmp_path):
+    filename = tmp_path / 'particles.parquet'
+    table = pa.table({'rlnImageName': [f'{idx:06d}@particles.mrcs' for idx in range(100)],
+                      **{col: test_eulers[:, idx] for idx, col in enumerate(relion_columns)}})
+    pq.write_table(table, filename, row_group_size=30)
+    return filename
+
+
+def test_iter_parquet_columns(relion_parquet):
+    chunks = list(eulerangles_parquet.iter_parquet_columns(relion_parquet, relion_columns))
+    assert [chunk.shape for chunk in chunks] == [(3, 30), (3, 30), (3, 30), (3, 10)]
+    assert_array_almost_equal(test_eulers.T, np.concatenate(chunks, axis=1))
+
+
+def test_convert_parquet_eulers(relion_parquet, tmp_path):
+    target = tmp_path / 'dynamo.parquet'
+    eulerangles_parquet.convert_parquet(relion_parquet, target, relion_columns,
+                                        'relion', 'dynamo')
+    parquet_file = pq.ParquetFile(target)
+    assert parquet_file.num_row_groups == 4
+
+    table = pq.read_table(target)
+    assert table.column_names == ['rlnImageName'] + relion_columns
+    result = np.stack([table.column(col).to_numpy() for col in relion_columns], axis=-1)
+    assert_array_almost_equal(convert_eulers(test_eulers, 'relion', 'dynamo'), result)
+
+
+def test_convert_parquet_matrices(relion_parquet, tmp_path):
+    active_meta = ConversionMeta(name='active', axes='zyz', intrinsic=True,
+                                 right_handed_rotation=True, active=True)
+    matrix_file = tmp_path / 'matrices.parquet'
+    eulerangles_parquet.convert_parquet(relion_parquet, matrix_file, relion_columns,
+                                        'relion', active_meta, output='matrices')
+    table = pq.read_table(matrix_file)
+    result = np.stack([table.column(col).to_numpy()
+                       for col in eulerangles_parquet.default_matrix_cols], axis=-1)
+    expected = euler2matrix(test_eulers, 'zyz', True, True).swapaxes(-1, -2)
+    assert_array_almost_equal(expected.reshape((-1, 9)), result)
+
+    # Back to Euler angles
+    euler_file = tmp_path / 'eulers.parquet'
+    eulerangles_parquet.convert_parquet(matrix_file, euler_file,
+                                        eulerangles_parquet.default_matrix_cols,
+                                        active_meta, 'relion', output_cols=relion_columns)
+    table = pq.read_table(euler_file)
+    result = np.stack([table.column(col).to_numpy() for col in relion_columns], axis=-1)
+    assert_array_almost_equal(euler2matrix(test_eulers, 'zyz', True, True),
+                              euler2matrix(result, 'zyz', True, True))
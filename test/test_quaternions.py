@@ -0,0 +1,41 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import euler2matrix, euler2quaternion, quaternion2matrix, matrix2quaternion, \
+    multiply_quaternions, invert_quaternions
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(20, 3))
+
+
+def test_euler2quaternion_all_combinations():
+    for eulers in (test_eulers[0], test_eulers):
+        for axes in valid_axes:
+            for intrinsic in (True, False):
+                for right_handed_rotation in (True, False):
+                    expected = euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                    quaternions = euler2quaternion(eulers, axes, intrinsic, right_handed_rotation)
+                    assert quaternions.shape[-1] == 4
+                    assert_array_almost_equal(expected, quaternion2matrix(quaternions))
+
+
+def test_matrix2quaternion():
+    matrices = euler2matrix(test_eulers, 'zyz', True, True)
+    matrices = np.concatenate([matrices, np.diag([1, -1, -1])[np.newaxis], np.eye(3)[np.newaxis]])
+    quaternions = matrix2quaternion(matrices)
+
+    assert np.all(quaternions[:, 0] >= 0)
+    assert_array_almost_equal(np.ones(len(matrices)), np.linalg.norm(quaternions, axis=-1))
+    assert_array_almost_equal(matrices, quaternion2matrix(quaternions))
+
+
+def test_multiply_and_invert_quaternions():
+    matrices = euler2matrix(test_eulers, 'zxz', False, True)
+    quaternions = matrix2quaternion(matrices)
+    other_quaternions = quaternions[::-1]
+
+    product = multiply_quaternions(quaternions, other_quaternions)
+    assert_array_almost_equal(matrices @ matrices[::-1], quaternion2matrix(product))
+    assert_array_almost_equal(matrices.swapaxes(-1, -2),
+                              quaternion2matrix(invert_quaternions(quaternions)))
@@ -0,0 +1,70 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import euler2matrix, matrix2euler, euler2euler, convert_eulers, \
+    convert_eulers_columns
+from eulerangles.math.constants import valid_axes
+
+test_eulers_single = [10, 20, 30]
+test_eulers_multiple = np.arange(15).reshape((5, 3))
+test_eulers_gimbal = np.array([[10, 0, 30], [10, 90, 30], [10, -90, 30], [10, 180, 30]])
+
+
+def test_euler2matrix_radians_all_combinations():
+    for eulers in (test_eulers_single, test_eulers_multiple):
+        for axes in valid_axes:
+            for intrinsic in (True, False):
+                for right_handed_rotation in (True, False):
+                    expected = euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                    result = euler2matrix(np.deg2rad(eulers), axes, intrinsic,
+                                          right_handed_rotation, degrees=False)
+                    assert_array_almost_equal(expected, result)
+
+
+def test_matrix2euler_radians_all_combinations():
+    for eulers in (test_eulers_single, test_eulers_multiple, test_eulers_gimbal):
+        for axes in valid_axes:
+            for intrinsic in (True, False):
+                for right_handed_rotation in (True, False):
+                    matrices = euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                    expected = matrix2euler(matrices, axes, intrinsic, right_handed_rotation)
+                    result = matrix2euler(matrices, axes, intrinsic, right_handed_rotation,
+                                          degrees=False)
+                    assert_array_almost_equal(np.deg2rad(expected), result)
+
+
+def test_radians_round_trip_all_valid_axes():
+    eulers = np.deg2rad(test_eulers_single)
+    for axes in valid_axes:
+        for intrinsic in (True, False):
+            rotation_matrix = euler2matrix(eulers, axes=axes, intrinsic=intrinsic,
+                                           right_handed_rotation=True, degrees=False)
+            result_eulers = matrix2euler(rotation_matrix, axes=axes, intrinsic=intrinsic,
+                                         right_handed_rotation=True, degrees=False)
+            assert_array_almost_equal(eulers, result_eulers)
+
+
+def test_euler2euler_radians_dynamo2relion():
+    dynamo_eulers = np.deg2rad([-47.2730, 1.1777, -132.3000])
+    relion_eulers = np.deg2rad([137.7000, 1.1777, 42.7270])
+
+    result_eulers = euler2euler(dynamo_eulers,
+                                source_axes='zxz',
+                                source_intrinsic=False,
+                                source_right_handed_rotation=True,
+                                target_axes='zyz',
+                                target_intrinsic=True,
+                                target_right_handed_rotation=True,
+                                invert_matrix=False,
+                                degrees=False)
+    assert_array_almost_equal(relion_eulers, result_eulers, decimal=6)
+
+
+def test_convert_eulers_radians():
+    expected = convert_eulers(test_eulers_multiple, 'relion', 'dynamo')
+    result = convert_eulers(np.deg2rad(test_eulers_multiple), 'relion', 'dynamo', degrees=False)
+    assert_array_almost_equal(np.deg2rad(expected), result)
+
+    result = convert_eulers_columns(np.deg2rad(test_eulers_multiple).T, 'relion', 'dynamo',
+                                    degrees=False)
+    assert_array_almost_equal(np.deg2rad(expected), result.T)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import random_rotations, iter_random_rotations, euler2matrix
+
+
+def test_reproducible_across_chunk_sizes():
+    expected = random_rotations(1000, output='quaternions', seed=42)
+    for chunk_size in (1, 7, 333, 1000, 5000):
+        chunks = list(iter_random_rotations(1000, output='quaternions', chunk_size=chunk_size,
+                                            seed=42))
+        assert all(len(chunk) <= chunk_size for chunk in chunks)
+        assert_array_almost_equal(expected, np.concatenate(chunks))
+
+
+def test_outputs_agree():
+    quaternions = random_rotations(100, output='quaternions', seed=0)
+    matrices = random_rotations(100, output='matrices', seed=0)
+    eulers = random_rotations(100, 'relion', seed=0)
+
+    assert_array_almost_equal(np.ones(100), np.linalg.norm(quaternions, axis=-1))
+    assert_array_almost_equal(np.broadcast_to(np.eye(3), (100, 3, 3)),
+                              matrices @ matrices.swapaxes(-1, -2))
+    assert_array_almost_equal(matrices, euler2matrix(eulers, 'zyz', True, True))
+
+
+def test_uniform_distribution():
+    matrices = random_rotations(200_000, output='matrices', seed=1)
+    # Every entry of a uniformly distributed rotation matrix has zero mean and variance 1 / 3
+    assert np.all(np.abs(matrices.mean(axis=0)) < 0.01)
+    assert np.all(np.abs(matrices.var(axis=0) - 1 / 3) < 0.01)
+
+
+def test_eulers_require_target_meta():
+    with pytest.raises(ValueError):
+        random_rotations(10)
@@ -0,0 +1,68 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import ConversionMeta, euler2matrix, convert_eulers_and_shifts, \
+    compose_rigid_body_transforms, invert_rigid_body_transforms, rigid_body2transform, \
+    transform2rigid_body, compose_transforms, invert_transforms
+from eulerangles.utils import get_conversion_metadata
+
+rng = np.random.default_rng(0)
+test_eulers = rng.uniform(-180, 180, size=(10, 3))
+test_shifts = rng.normal(size=(10, 3))
+test_points = rng.normal(size=(10, 3))
+test_matrices = euler2matrix(test_eulers, axes='zyz', intrinsic=True, right_handed_rotation=True)
+
+
+def apply(rotation_matrices, shifts, points):
+    return np.einsum('nij,nj->ni', rotation_matrices, points) + shifts
+
+
+def test_invert_rigid_body_transforms():
+    inverse_matrices, inverse_shifts = invert_rigid_body_transforms(test_matrices, test_shifts)
+    transformed = apply(test_matrices, test_shifts, test_points)
+    assert_array_almost_equal(test_points, apply(inverse_matrices, inverse_shifts, transformed))
+
+
+def test_compose_rigid_body_transforms():
+    other_matrices = test_matrices[::-1]
+    other_shifts = test_shifts[::-1]
+    matrices, shifts = compose_rigid_body_transforms(test_matrices, test_shifts,
+                                                     other_matrices, other_shifts)
+    expected = apply(test_matrices, test_shifts, apply(other_matrices, other_shifts, test_points))
+    assert_array_almost_equal(expected, apply(matrices, shifts, test_points))
+
+
+def test_homogeneous_transforms():
+    transforms = rigid_body2transform(test_matrices, test_shifts)
+    other_transforms = transforms[::-1]
+
+    assert transforms.shape == (10, 4, 4)
+    assert_array_almost_equal(transforms @ other_transforms,
+                              compose_transforms(transforms, other_transforms))
+    assert_array_almost_equal(np.linalg.inv(transforms), invert_transforms(transforms))
+
+    matrices, shifts = transform2rigid_body(transforms)
+    assert_array_almost_equal(test_matrices, matrices)
+    assert_array_almost_equal(test_shifts, shifts)
+
+
+def test_convert_eulers_and_shifts():
+    relion_meta = get_conversion_metadata('relion')
+    active_meta = ConversionMeta(name='active', axes='xyz', intrinsic=False,
+                                 right_handed_rotation=True, active=True)
+
+    eulers, shifts = convert_eulers_and_shifts(test_eulers, test_shifts,
+                                               source_meta='relion', target_meta=active_meta)
+    matrices = euler2matrix(eulers, axes='xyz', intrinsic=False, right_handed_rotation=True)
+    relion_matrices = euler2matrix(test_eulers,
+                                   axes=relion_meta.axes,
+                                   intrinsic=relion_meta.intrinsic,
+                                   right_handed_rotation=relion_meta.right_handed_rotation)
+
+    # the target transformation undoes the source transformation
+    transformed = apply(relion_matrices, test_shifts, test_points)
+    assert_array_almost_equal(test_points, apply(matrices, shifts, transformed))
+
+    # shifts are unchanged between conventions of the same active/passive nature
+    _, shifts = convert_eulers_and_shifts(test_eulers, test_shifts, 'relion', 'dynamo')
+    assert_array_almost_equal(test_shifts, shifts)
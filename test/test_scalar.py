@@ -0,0 +1,57 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import euler2matrix, matrix2euler, euler2euler, convert_eulers
+from eulerangles.math.constants import valid_axes
+
+rng = np.random.default_rng(0)
+test_eulers = np.concatenate([rng.uniform(-180, 180, size=(5, 3)),
+                              [[10, 0, 30], [10, 90, 30], [10, -90, 30], [10, 180, 30]]])
+
+
+def test_euler2matrix_scalar_matches_array_path():
+    for eulers in test_eulers:
+        for axes in valid_axes:
+            for intrinsic in (True, False):
+                for right_handed_rotation in (True, False):
+                    expected = euler2matrix(eulers.reshape((1, 3)), axes, intrinsic,
+                                            right_handed_rotation)
+                    result = euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                    assert result.shape == (3, 3)
+                    assert_array_almost_equal(expected, result, decimal=10)
+
+
+def test_matrix2euler_scalar_matches_array_path():
+    for eulers in test_eulers:
+        for axes in valid_axes:
+            for intrinsic in (True, False):
+                for right_handed_rotation in (True, False):
+                    matrix = euler2matrix(eulers, axes, intrinsic, right_handed_rotation)
+                    expected = matrix2euler(matrix.reshape((1, 3, 3)), axes, intrinsic,
+                                            right_handed_rotation)
+                    result = matrix2euler(matrix, axes, intrinsic, right_handed_rotation)
+                    assert result.shape == (3,)
+                    assert_array_almost_equal(expected, result, decimal=10)
+
+
+def test_euler2euler_scalar_matches_array_path():
+    for eulers in test_eulers:
+        for invert_matrix in (True, False):
+            expected = euler2euler(eulers.reshape((1, 3)), 'zxz', True, False, 'xyz', False, True,
+                                   invert_matrix=invert_matrix)
+            result = euler2euler(eulers, 'zxz', True, False, 'xyz', False, True,
+                                 invert_matrix=invert_matrix)
+            assert result.shape == (3,)
+            assert_array_almost_equal(expected, result, decimal=10)
+
+
+def test_matrix2euler_scalar_out_of_domain_falls_back():
+    matrix = np.eye(3) * 1.0000001
+    with np.errstate(invalid='ignore'):
+        result = matrix2euler(matrix, 'zyz', True, True)
+    assert np.isnan(result[1])
+
+
+def test_convert_eulers_scalar():
+    result = convert_eulers(np.array([-47.2730, 1.1777, -132.3000]), 'dynamo', 'relion')
+    assert_array_almost_equal([137.7000, 1.1777, 42.7270], result, decimal=5)
@@ -0,0 +1,62 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from eulerangles import TiltSeriesOrientations, ConversionMeta, convert_eulers, euler2matrix, \
+    matrix2euler
+
+rng = np.random.default_rng(0)
+particle_eulers = rng.uniform(-180, 180, size=(25, 3))
+tilt_eulers = np.stack([np.zeros(7), np.linspace(-60, 60, 7), np.zeros(7)], axis=-1)
+
+active_meta = ConversionMeta(name='active', axes='zyz', intrinsic=True,
+                             right_handed_rotation=True, active=True)
+
+
+def test_tilt_series_matrices():
+    orientations = TiltSeriesOrientations(particle_eulers, tilt_eulers, active_meta)
+    assert orientations.shape == (25, 7)
+    assert len(orientations) == 25
+
+    particle_matrices = euler2matrix(particle_eulers, 'zyz', True, True)
+    tilt_matrices = euler2matrix(tilt_eulers, 'zyz', True, True)
+    expected = tilt_matrices[np.newaxis] @ particle_matrices[:, np.newaxis]
+
+    assert_array_almost_equal(expected, orientations.matrices())
+    assert_array_almost_equal(expected[3:9], orientations.matrices(slice(3, 9)))
+    assert_array_almost_equal(expected[[4]], orientations.matrices(4))
+
+    chunks = [matrices for _, matrices in orientations.iter_matrices(chunk_size=6)]
+    assert_array_almost_equal(expected, np.concatenate(chunks))
+
+
+def test_tilt_series_eulers():
+    orientations = TiltSeriesOrientations(particle_eulers, tilt_eulers, active_meta)
+    expected_matrices = orientations.matrices()
+
+    # Passive target, matrices are inverted
+    eulers = orientations.eulers(target_meta='relion')
+    assert eulers.shape == (25, 7, 3)
+    expected = matrix2euler(expected_matrices.swapaxes(-1, -2).reshape((-1, 3, 3)),
+                            'zyz', True, True)
+    assert_array_almost_equal(expected.reshape((25, 7, 3)), eulers)
+
+    chunks = [eulers for _, eulers in orientations.iter_eulers(chunk_size=4,
+                                                               target_meta='relion')]
+    assert_array_almost_equal(eulers, np.concatenate(chunks))
+
+
+def test_tilt_series_mixed_conventions():
+    orientations = TiltSeriesOrientations(particle_eulers, tilt_eulers, active_meta)
+
+    # The same rotations given in other conventions compose to the same orientations
+    relion_particles = convert_eulers(particle_eulers, active_meta, 'relion')
+    dynamo_tilts = convert_eulers(tilt_eulers, active_meta, 'dynamo')
+    mixed_orientations = TiltSeriesOrientations(relion_particles, dynamo_tilts,
+                                                'relion', 'dynamo')
+
+    assert_array_almost_equal(orientations.matrices(target_meta='relion'),
+                              mixed_orientations.matrices())
+
+    # Passive particle convention and no target, matrices describe passive rotations
+    assert_array_almost_equal(orientations.matrices().swapaxes(-1, -2),
+                              mixed_orientations.matrices())